@@ -0,0 +1,130 @@
+# Fájl helye: /batch.py
+# Funkció: Kézmentes sorozat teszt a gyártósorra. Alacsony PWM-en várakozik; a bedugott ventilátort a
+# TACH impulzusokról (FanController.pulses_since) ismeri fel, majd automatikusan lefuttatja a beállított
+# ugrásválasz / kifutás mérést, kiértékeli a határértékekkel (MEGFELELT / NEM), és a ventilátor kihúzása
+# (az impulzusok elmaradása) után újra vár. A kezelőnek csak a be- és kidugás marad.
+
+import time
+import config
+import logger
+from step_response import StepResponseTest, NONE, REPORT_HEADER, report_line
+
+# Állapotok: várakozás, felismerés (pörgés felfutás / kontaktus pergés), mérés, eredmény (kihúzásig)
+WAIT = 0
+ARM = 1
+TEST = 2
+VERDICT = 3
+
+# Hibaokok (soros riport és kijelző)
+REASON_OK = "OK"
+REASON_RPM = "RPM"       # Teljes PWM-en kevés a fordulat (vagy nem forog)
+REASON_RISE = "RISE"     # Lassú felfutás
+REASON_COAST = "COAST"   # Rövid kifutás: nagy csapágy súrlódás
+
+
+def evaluate(results):
+    """Kiértékelés a lépcső rekordokból; az első hibaokot adja (REASON_OK, ha minden határon belül)."""
+    for rec in results:
+        start_duty, end_duty, final, rise_ms, coast_ms = rec[0], rec[1], rec[3], rec[6], rec[8]
+        if end_duty > start_duty:
+            if final < config.BATCH_MIN_RPM * end_duty // 100:
+                return REASON_RPM
+            if rise_ms == NONE or rise_ms > config.BATCH_MAX_RISE_MS:
+                return REASON_RISE
+        elif coast_ms != NONE and coast_ms < config.BATCH_MIN_COAST_MS:
+            return REASON_COAST # Ha 0 % PWM-en sem áll meg, nincs kifutási idő: nem hiba
+    return REASON_OK
+
+
+class BatchTester:
+    """A sorozat teszt állapotgépe; a logikai hurok hívja (tick), a mérést a StepResponseTest végzi."""
+    def __init__(self, fan):
+        self.fan = fan
+        self.test = StepResponseTest(fan, config.BATCH_STEPS)
+        self.active = False
+        self.state = WAIT
+        self.state_start = 0
+        self.tested = 0
+        self.passed = 0
+        self.reason = REASON_OK  # Az utolsó ventilátor eredménye
+        self._mark = 0           # tach_counter az előző hívásnál
+        self._pulses = 0         # Impulzusok a várakozás / felismerés kezdete óta
+        self._last_pulse = 0
+
+    def start(self, now):
+        self.active = True
+        self._enter(WAIT, now)
+
+    def stop(self):
+        self.test.stop()
+        self.active = False
+
+    def reset_counts(self):
+        self.tested = 0
+        self.passed = 0
+
+    def _enter(self, state, now):
+        self.state = state
+        self.state_start = now
+        self._mark = self.fan.tach_counter
+        self._pulses = 0
+        self._last_pulse = now
+        self.fan.set_duty_percent(config.BATCH_IDLE_DUTY)
+
+    def _poll_tach(self, now):
+        """Új impulzusok a TACH számlálóból; az utolsó impulzus idejét is frissíti."""
+        n = self.fan.pulses_since(self._mark)
+        if n:
+            self._mark = (self._mark + n) & 0x3FFFFFFF
+            self._pulses += n
+            self._last_pulse = now
+        return n
+
+    def tick(self, now):
+        if not self.active:
+            return
+        if self.state == TEST:
+            # Él rögzítés alatt a számláló áll: a kihúzást csak a mérés után figyeljük
+            self.test.tick(now)
+            if not self.test.active:
+                self._verdict(now)
+            return
+        self._poll_tach(now)
+        quiet = time.ticks_diff(now, self._last_pulse) >= config.BATCH_REMOVE_MS
+        if self.state == WAIT:
+            if quiet:
+                self._pulses = 0 # Egy-egy zavar impulzus nem számít
+            elif self._pulses >= config.BATCH_DETECT_PULSES:
+                self._enter(ARM, now)
+        elif self.state == ARM:
+            if quiet:
+                self._enter(WAIT, now) # Csak pergés volt, vagy azonnal kihúzták
+            elif time.ticks_diff(now, self.state_start) >= config.BATCH_ARM_MS:
+                logger.info("Sorozat teszt: ventilator felismerve, meres indul")
+                self.state = TEST
+                self.state_start = now
+                self.test.start(now, settled=True)
+        elif self.state == VERDICT:
+            # Az utolsó lépcső megállíthatta a ventilátort: a felpörgéshez türelmi idő jár
+            if quiet and time.ticks_diff(now, self.state_start) >= config.BATCH_ARM_MS:
+                logger.info("Sorozat teszt: ventilator eltavolitva")
+                self._enter(WAIT, now)
+
+    def _verdict(self, now):
+        self.reason = evaluate(self.test.results)
+        self.tested += 1
+        if self.reason == REASON_OK:
+            self.passed += 1
+        logger.info("Sorozat teszt: {}. ventilator: {}", self.tested, self.reason)
+        self._enter(VERDICT, now)
+
+    def report_lines(self):
+        """Soros riport: összesítés, majd az utolsó ventilátor lépcsői (a 'step' parancs formátumában)."""
+        lines = [f"BH,state={self.state},tested={self.tested},passed={self.passed},"
+                 f"failed={self.tested - self.passed},last={self.reason}",
+                 REPORT_HEADER]
+        for rec in self.test.results:
+            lines.append(report_line(rec))
+        return lines
+
+# Utolsó módosítás: 2026. október 19. 20:15:00
@@ -0,0 +1,89 @@
+# Fájl helye: /bigfont.py
+# Funkció: Előre kiszámolt 16x24-es nagy számjegy font (MONO_VLSB) a jól olvasható RPM kijelzéshez.
+# GENERÁLT FÁJL - ne szerkeszd kézzel! Forrás: tools/gen_bigfont.py
+
+from micropython import const
+import framebuf
+
+WIDTH = const(16)
+HEIGHT = const(24)
+_GLYPH_SIZE = const(48)   # 16 oszlop * 3 lap
+_BLANK = const(10)        # Üres karakter indexe (vezető nullák helyett)
+_MAX_VALUE = (0, 9, 99, 999, 9999, 99999, 999999)
+
+_DATA = (
+    # '0'
+    b"\xff\xff\xff\x07\x07\x07\x07\x07\x07\x07\x07\xff\xff\xff\x00\x00"
+    b"\xff\xff\xff\x00\x00\x00\x00\x00\x00\x00\x00\xff\xff\xff\x00\x00"
+    b"\xff\xff\xff\xe0\xe0\xe0\xe0\xe0\xe0\xe0\xe0\xff\xff\xff\x00\x00"
+    # '1'
+    b"\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xff\xff\xff\x00\x00"
+    b"\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xff\xff\xff\x00\x00"
+    b"\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xff\xff\xff\x00\x00"
+    # '2'
+    b"\x07\x07\x07\x07\x07\x07\x07\x07\x07\x07\x07\xff\xff\xff\x00\x00"
+    b"\xfc\xfc\xfc\x1c\x1c\x1c\x1c\x1c\x1c\x1c\x1c\x1f\x1f\x1f\x00\x00"
+    b"\xff\xff\xff\xe0\xe0\xe0\xe0\xe0\xe0\xe0\xe0\xe0\xe0\xe0\x00\x00"
+    # '3'
+    b"\x07\x07\x07\x07\x07\x07\x07\x07\x07\x07\x07\xff\xff\xff\x00\x00"
+    b"\x1c\x1c\x1c\x1c\x1c\x1c\x1c\x1c\x1c\x1c\x1c\xff\xff\xff\x00\x00"
+    b"\xe0\xe0\xe0\xe0\xe0\xe0\xe0\xe0\xe0\xe0\xe0\xff\xff\xff\x00\x00"
+    # '4'
+    b"\xff\xff\xff\x00\x00\x00\x00\x00\x00\x00\x00\xff\xff\xff\x00\x00"
+    b"\x1f\x1f\x1f\x1c\x1c\x1c\x1c\x1c\x1c\x1c\x1c\xff\xff\xff\x00\x00"
+    b"\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xff\xff\xff\x00\x00"
+    # '5'
+    b"\xff\xff\xff\x07\x07\x07\x07\x07\x07\x07\x07\x07\x07\x07\x00\x00"
+    b"\x1f\x1f\x1f\x1c\x1c\x1c\x1c\x1c\x1c\x1c\x1c\xfc\xfc\xfc\x00\x00"
+    b"\xe0\xe0\xe0\xe0\xe0\xe0\xe0\xe0\xe0\xe0\xe0\xff\xff\xff\x00\x00"
+    # '6'
+    b"\xff\xff\xff\x07\x07\x07\x07\x07\x07\x07\x07\x07\x07\x07\x00\x00"
+    b"\xff\xff\xff\x1c\x1c\x1c\x1c\x1c\x1c\x1c\x1c\xfc\xfc\xfc\x00\x00"
+    b"\xff\xff\xff\xe0\xe0\xe0\xe0\xe0\xe0\xe0\xe0\xff\xff\xff\x00\x00"
+    # '7'
+    b"\x07\x07\x07\x07\x07\x07\x07\x07\x07\x07\x07\xff\xff\xff\x00\x00"
+    b"\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xff\xff\xff\x00\x00"
+    b"\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xff\xff\xff\x00\x00"
+    # '8'
+    b"\xff\xff\xff\x07\x07\x07\x07\x07\x07\x07\x07\xff\xff\xff\x00\x00"
+    b"\xff\xff\xff\x1c\x1c\x1c\x1c\x1c\x1c\x1c\x1c\xff\xff\xff\x00\x00"
+    b"\xff\xff\xff\xe0\xe0\xe0\xe0\xe0\xe0\xe0\xe0\xff\xff\xff\x00\x00"
+    # '9'
+    b"\xff\xff\xff\x07\x07\x07\x07\x07\x07\x07\x07\xff\xff\xff\x00\x00"
+    b"\x1f\x1f\x1f\x1c\x1c\x1c\x1c\x1c\x1c\x1c\x1c\xff\xff\xff\x00\x00"
+    b"\xe0\xe0\xe0\xe0\xe0\xe0\xe0\xe0\xe0\xe0\xe0\xff\xff\xff\x00\x00"
+    # ' '
+    b"\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00"
+    b"\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00"
+    b"\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00"
+)
+
+# Blit forrás leírók egyszer, importáláskor készülnek; a glyph bájtok a (frozen) modul
+# konstansában maradnak, rajzoláskor nincs sem másolás, sem objektum foglalás.
+_mv = memoryview(_DATA)
+_GLYPHS = tuple(
+    (_mv[i * _GLYPH_SIZE:(i + 1) * _GLYPH_SIZE], WIDTH, HEIGHT, framebuf.MONO_VLSB)
+    for i in range(11)
+)
+del _mv
+
+
+def draw_number(fb, value, x, y, digits):
+    """
+    Nemnegatív egész kirajzolása jobbra igazítva, `digits` karakter szélességben.
+    Stringformázás nélkül, számjegyenként blitel; a túl nagy értéket telítésbe viszi.
+    """
+    if value < 0:
+        value = 0
+    elif value > _MAX_VALUE[digits]:
+        value = _MAX_VALUE[digits]
+    pos_x = x + (digits - 1) * WIDTH
+    for i in range(digits):
+        if i > 0 and value == 0:
+            fb.blit(_GLYPHS[_BLANK], pos_x, y)
+        else:
+            fb.blit(_GLYPHS[value % 10], pos_x, y)
+            value //= 10
+        pos_x -= WIDTH
+
+# Utolsó módosítás: 2026. október 19. 09:10:00
\ No newline at end of file
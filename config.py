@@ -10,31 +10,107 @@ PIN_MENU = 14      # "B" gomb (Menü/Vissza)
 PIN_SELECT = 15    # "A" gomb (Kiválaszt/Léptet)
 PIN_I2C_SCL = 5    # OLED SCL
 PIN_I2C_SDA = 4    # OLED SDA
+PIN_ENC_A = None   # Opcionális forgó jeladó "A" fázis (pl. 18)
+PIN_ENC_B = None   # Opcionális forgó jeladó "B" fázis (pl. 19)
+PIN_ENC_SW = None  # Opcionális forgó jeladó nyomógomb (SELECT-ként működik, pl. 20)
 
 # ========== KIJELZŐ BEÁLLÍTÁSOK ==========
 OLED_WIDTH = 128
 OLED_HEIGHT = 32
 I2C_FREQ = 400000
+BIG_DIGITS = True  # Teszt képernyőn nagy (16x24) számjegyes RPM kijelzés
+DISPLAY_RETRY_MIN_MS = 1000   # Hiányzó kijelző újrapróbálása: kezdeti várakozás
+DISPLAY_RETRY_MAX_MS = 30000  # ... és a visszalépés felső határa
+HEADLESS_IDLE_MS = 200        # Kijelző nélkül a megjelenítő feladat csak ennyi időnként ébred
+TELEMETRY_INTERVAL_MS = 1000  # Soros telemetria periódusa (headless módban automatikus)
 
 # ========== VENTILÁTOR BEÁLLÍTÁSOK ==========
 PWM_FREQ = 25000       # 25kHz Intel szabvány szerint
 PWM_MIN_DUTY = 0
 PWM_MAX_DUTY = 65535
 TACH_PULSES_PER_REV = 2 # Impulzus per fordulat (szabványos ventilátor)
+CAPTURE_EDGES = 4096    # Él rögzítő puffer mérete (4 bájt / él -> 16 KB, csak rögzítéskor)
+CAPTURE_WINDOW_MS = 5000 # Alapértelmezett rögzítési ablak
+CAPTURE_CMDS = 256      # Rögzítés alatt ennyi PWM parancs fér el (visszajátszáshoz)
 
 # ========== LOGIKA BEÁLLÍTÁSOK ==========
-SPLASH_TIME_MS = 2000
+CONTROL_CORE = True           # Mérés / szabályzás a második magon (_thread), fix periódussal
+CONTROL_PERIOD_US = 10000     # A vezérlő hurok periódusa
+CONTROL_RING_SLOTS = 16       # Parancs és telemetria gyűrű mérete (rekord, kettő hatvány)
+SPLASH_MIN_MS = 0             # Splash minimális ideje a boot kezdetétől (0 = az init végéig)
 AUTO_STEP_INTERVAL_MS = 5000  # Auto módban lépésköz
 RPM_UPDATE_INTERVAL_MS = 1000 # RPM mérés gyakorisága
+WINDOW_TIMER = True           # A mérési ablakot hardver időzítő zárja (pontos ablakhossz)
 TARGET_RPM_TOLERANCE = 100    # Cél RPM tűréshatár (+/-)
+TARGET_RPM_MAX = 10000        # Kézzel (rámpával) beállítható legnagyobb cél RPM
+TARGET_RPM_RAMP_STEP = 50     # Cél RPM lépés gomb tartásakor (gyorsulással szorozva)
 STALL_THRESHOLD_DUTY = 30     # % PWM, ami felett elakadásnak számít a 0 RPM
-MOVING_AVERAGE_SAMPLES = 5    # Hány mérést átlagoljon
+MOVING_AVERAGE_SAMPLES = 5    # Hány mérést átlagoljon ("sma" szűrő alapértéke)
+# RPM szűrő láncok (rpm_filters): "sma<n>", "ema<eltolás>", "median<n>", "kalman", vesszővel fűzve
+RPM_FILTER_DEFAULT = "sma5"   # Menüben és a nem felsorolt módokban
+RPM_FILTER_MODES = {
+    "RUN_AUTO": "median3,sma3",   # Kijelzés: sima számok, kiugró ablakok nélkül
+    "RUN_MANUAL": "median3,sma3",
+    "RUN_TARGET": "kalman",       # Szabályzás: kis késés, lépcsőnél azonnal követ
+    "RUN_ENDURANCE": "median3,sma3",
+}
+RPM_KALMAN_Q = 400            # Kalman folyamat zaj (rpm^2 / ablak)
+RPM_KALMAN_R = 2500           # Kalman mérési zaj (rpm^2; ~50 rpm szórás ablakonként)
+TREND_SAMPLES = 128           # Trend grafikon hossza mintában (1 minta / RPM mérés)
+
+# ========== TARTÓS (BURN-IN) TESZT ==========
+ENDURANCE_STEPS = (20, 40, 60, 80, 100) # PWM lépcsők %-ban, ciklikusan ismételve
+ENDURANCE_STEP_MS = 60000     # Egy lépcső hossza
+ENDURANCE_SETTLE_MS = 10000   # Lépcsőváltás után ennyi ideig nem gyűjtünk statisztikát
+ENDURANCE_CHECKPOINT_MS = 600000 # Ellenőrzőpont a flash-re ennyi időnként (és kilépéskor)
+ENDURANCE_FILE = "endurance.json"
+
+# ========== UGRÁSVÁLASZ / KIFUTÁS MÉRÉS ==========
+STEP_RESPONSE_STEPS = ((0, 100), (100, 0), (30, 70), (70, 30)) # (kiinduló, cél) PWM % párok sorban
+STEP_PREP_MS = 10000          # Kiinduló PWM tartása az ugrás előtt (ha az előző lépcső nem ott végzett)
+STEP_PRETRIGGER_MS = 1000     # Élrögzítés az ugrás előtt (kiinduló RPM)
+STEP_CAPTURE_MS = 15000       # Rögzítés az ugrás után legfeljebb (vagy a puffer megteléséig)
+STEP_TAIL_MS = 2000           # A rögzítés utolsó ennyi ideje adja a végső RPM-et
+STEP_STOP_GAP_MS = 1000       # Ennyi ideig nincs él: a ventilátor áll (a kifutás vége)
+STEP_SETTLE_BAND_PERMILLE = 20 # Beállási sáv a végső RPM körül (ezrelék)
+STEP_SETTLE_MIN_RPM = 30      # A beállási sáv legkisebb szélessége
+STEP_LOG_FILE = "steps.bin"   # Eredmény rekordok (16 bájt / lépcső)
+STEP_LOG_MAX_BYTES = 8192     # E fölött a fájl .old előzménnyé válik
+
+# ========== SOROZAT TESZT (KÉZMENTES) ==========
+BATCH_IDLE_DUTY = 30          # Várakozás PWM-je: ezen a bedugott ventilátor már forog (TACH impulzusok)
+BATCH_DETECT_PULSES = 20      # Ennyi impulzus után a ventilátor jelen van (zavar impulzusok ellen)
+BATCH_ARM_MS = 3000           # Felismerés után ennyi ideig stabil pörgés kell a mérés előtt
+BATCH_REMOVE_MS = 1500        # Ennyi ideig nincs impulzus: a ventilátort kihúzták
+BATCH_STEPS = ((30, 100), (100, 0)) # A mért lépcsők (felfutás teljes PWM-re, majd kifutás)
+BATCH_MIN_RPM = 1000          # Legkisebb végső RPM 100 % PWM-en (kisebb célnál arányosan)
+BATCH_MAX_RISE_MS = 5000      # Leghosszabb 10-90 %-os felfutás
+BATCH_MIN_COAST_MS = 2000     # Legrövidebb kifutás a megállásig (0: nincs vizsgálat)
 
 # ========== ALAPÉRTELMEZETT BEÁLLÍTÁSOK ==========
 DEFAULT_LANGUAGE = "en"
 DEFAULT_PWM_STEP = 20         # %-os ugrás manuális módban
 DEFAULT_DEBOUNCE_MS = 200     # Gomb érzéketlenségi idő (pergésmentesítés)
 
+# Gomb gesztusok
+BUTTON_SETTLE_MS = 15         # Él után ennyi ideig stabilnak kell lennie a szintnek
+BUTTON_LONG_MS = 600          # Hosszú nyomás küszöbe
+BUTTON_DOUBLE_MS = 400        # Két rövid nyomás között ennyi ms-on belül: dupla nyomás
+BUTTON_REPEAT_START_MS = 300  # Első ismétlési időköz hosszú nyomás után
+BUTTON_REPEAT_MIN_MS = 40     # Leggyorsabb ismétlés
+BUTTON_REPEAT_ACCEL = 80      # Ismétlésenként az időköz ennyi %-ra csökken
+
+# Forgó jeladó
+ENCODER_STEPS_PER_DETENT = 4  # Kvadratúra lépés / kattanás (tipikusan 4)
+ENCODER_MEDIUM_DPS = 8        # Kattanás / mp felett közepes gyorsítás
+ENCODER_FAST_DPS = 20         # Kattanás / mp felett gyors gyorsítás
+ENCODER_MEDIUM_SCALE = 2      # Közepes sebességnél lépésszorzó
+ENCODER_FAST_SCALE = 5        # Gyors forgatásnál lépésszorzó
+ENCODER_RPM_STEP = 10         # Cél RPM lépés kattanásonként (szorzó előtt)
+
+SETTINGS_FLUSH_DELAY_MS = 2000 # Beállítás változások összevonása ennyi ideig írás előtt
+SETTINGS_COMPACT_RECORDS = 32  # Ennyi napló rekord után tömörítés a pillanatképbe
+
 # Opciók a beállítások menühöz
 PWM_STEP_OPTIONS = [5, 10, 20, 25]
 DEBOUNCE_OPTIONS = [50, 100, 200, 300, 500] # ms
@@ -45,7 +121,44 @@ SCROLL_SPEED_HORIZONTAL = 40  # Pixel/mp (vízszintes görgetés)
 SCROLL_SPEED_VERTICAL = 15    # Pixel/mp (About screen függőleges)
 SCROLL_WAIT_MS = 1000         # Várakozás görgetés után (ms)
 
+# ========== SZENZOROK ==========
+SENSOR_SAMPLE_INTERVAL_MS = 250 # Háttér mintavétel periódusa
+SENSOR_OVERSAMPLE = 16          # Ennyi ADC mérés átlaga ad egy mintát
+SENSOR_EMA_SHIFT = 2            # Simítás: EMA súly 1/2^n
+ADC_SUPPLY_PIN = None           # pl. 26 (ADC0): ventilátor tápfeszültség osztón keresztül
+ADC_SUPPLY_DIVIDER = 11         # Feszültségosztó aránya (pl. 100k / 10k -> 11)
+ADC_CURRENT_PIN = None          # pl. 27 (ADC1): sönt erősítő kimenete
+ADC_CURRENT_MA_PER_V = 1000     # Áramérzékelő átalakítási tényező (mA / V)
+
+# ========== EREDMÉNY NAPLÓ ==========
+RESULT_LOG_RECORDS = 1024     # Rekordok száma a gyűrűben (16 bájt / rekord -> 16 KB flash)
+RESULT_LOG_PAGE = 256         # RAM puffer mérete: ennyi bájtos kötegekben írunk
+RESULT_LOG_FLUSH_MS = 10000   # Nem teli puffer kiírása ennyi tétlenség után
+RESULT_SETTLE_BAND_RPM = 50   # Két egymás utáni ablak eltérése, ami alatt beálltnak tekintjük
+
+# ========== MEMÓRIA KEZELÉS ==========
+GC_INTERVAL_MS = 5000          # Explicit gyűjtés legfeljebb ilyen gyakran (üresjárati résben)
+GC_WINDOW_SLACK_MS = 250       # Csak az RPM ablak elején gyűjtünk (ennyi ms-on belül a kezdettől)
+GC_THRESHOLD_BYTES = 24 * 1024 # Automatikus gyűjtés ennyi foglalás után (biztonsági háló)
+HEAP_REPORT_INTERVAL_MS = 30000 # Heap telemetria a soros portra (debug módban)
+
 # ========== DEBUG ==========
 DEBUG_MODE = True
 
-# Utolsó módosítás: 2026. február 06. 09:40:00
\ No newline at end of file
+# ========== KIJELZŐ TÜKRÖZÉS ==========
+MIRROR_INTERVAL_MS = 200      # Változott lapok küldése legfeljebb ilyen gyakran ('mirror on [ms]')
+MIRROR_KEYFRAME_MS = 5000     # Teljes kép (kulcskép) ennyi időnként, hogy a néző bármikor csatlakozhasson
+
+# ========== NAPLÓZÁS ==========
+# Szintek: 0 DEBUG, 1 INFO, 2 WARN, 3 ERROR, 4 OFF (kikapcsolva: a gyűrű sem foglalódik)
+LOG_LEVEL = 0 if DEBUG_MODE else 1
+LOG_RING_SLOTS = 32           # Bejegyzések a RAM gyűrűben (teli gyűrűnél a legrégebbi vész el)
+LOG_REPEAT_MS = 2000          # Ugyanaz az üzenet ennyin belül csak egyszer (a többit megszámoljuk)
+LOG_DRAIN_MS = 100            # Háttér kiürítés periódusa
+LOG_DRAIN_BATCH = 4           # Ennyi sor kiírása egy lépésben (a soros port blokkolhat)
+LOG_SERIAL = True             # Kiírás a soros portra
+LOG_FILE = None               # Pl. "events.log": a bejegyzések flash fájlba is kerülnek
+LOG_FILE_LEVEL = 2            # Csak ettől a szinttől a fájlba (WARN)
+LOG_FILE_MAX_BYTES = 8192     # Efölött a fájl .old néven félrekerül
+
+# Utolsó módosítás: 2026. október 19. 22:00:00
\ No newline at end of file
@@ -0,0 +1,273 @@
+# Fájl helye: /control_core.py
+# Funkció: Determinisztikus mérő / szabályzó hurok a második magon (_thread), fix periódussal.
+# A UI maggal két zármentes, egy író / egy olvasó (SPSC) gyűrűn, fix méretű rekordokkal kommunikál;
+# a hurok nem foglal memóriát, így a kijelző, a GC és a flash írás a 0. magon nem késlelteti.
+
+from micropython import const
+from array import array
+import _thread
+import time
+import config
+
+# Parancs rekord (UI -> vezérlő mag): [művelet, érték]
+OP_DUTY = const(1)
+OP_TARGET = const(2)        # érték < 0: cél mód kikapcsolása
+OP_RESET_STATS = const(3)   # Jitter és mérési ablak statisztika nullázása
+OP_FILTER = const(4)        # érték: rpm_filters.PRESETS index
+OP_CAPTURE_START = const(5) # Él rögzítés (a pufferek a UI magon foglalódnak előtte)
+OP_CAPTURE_STOP = const(6)
+OP_CAPTURE_RELEASE = const(7)
+CMD_WORDS = const(2)
+
+# Telemetria rekord (vezérlő mag -> UI), mérési ablakonként
+T_SEQ = const(0)
+T_MS = const(1)             # Az ablak zárásának ticks_ms értéke
+T_RPM = const(2)
+T_DUTY = const(3)
+T_STALL = const(4)
+T_WINDOW_MS = const(5)      # A lezárt ablak hossza
+T_RAW = const(6)            # Szűretlen RPM
+T_TARGET = const(7)         # Cél RPM
+TELEMETRY_WORDS = const(8)
+
+# Jitter statisztika (csak a vezérlő mag írja): ciklusok, késés összeg / max (us), túlfutások
+S_TICKS = const(0)
+S_LATE_SUM = const(1)
+S_LATE_MAX = const(2)
+S_OVERRUNS = const(3)
+
+
+class SpscRing:
+    """
+    Egy író / egy olvasó gyűrű fix méretű egész rekordokkal. A fej indexet csak az író, a farok
+    indexet csak az olvasó írja (egy-egy szó tárolás), így zár nélkül is konzisztens a két mag között.
+    Használat foglalás nélkül: reserve() -> a rekord szavainak írása a buf-ba -> commit();
+    olvasás: peek() -> a szavak olvasása -> release().
+    """
+    def __init__(self, slots, words):
+        # A 30 bites körbeforduló indexekből a rés csak kettő hatvány méretnél folytonos
+        if slots <= 0 or slots & (slots - 1):
+            raise ValueError("a gyuru merete ketto hatvany kell legyen: " + str(slots))
+        self.slots = slots
+        self.mask = slots - 1
+        self.words = words
+        self.buf = array('i', (0 for _ in range(slots * words)))
+        self.idx = array('I', (0, 0))  # [fej (író), farok (olvasó)]
+        self.dropped = 0                # Tele gyűrű miatt eldobott rekordok (író oldali számláló)
+
+    def reserve(self):
+        """A következő szabad rekord kezdő indexe, vagy -1 ha tele van."""
+        head = self.idx[0]
+        if (head - self.idx[1]) & 0x3FFFFFFF >= self.slots:
+            self.dropped += 1
+            return -1
+        return (head & self.mask) * self.words
+
+    def commit(self):
+        self.idx[0] = (self.idx[0] + 1) & 0x3FFFFFFF
+
+    def peek(self):
+        """A legrégebbi olvasatlan rekord kezdő indexe, vagy -1 ha üres."""
+        tail = self.idx[1]
+        if tail == self.idx[0]:
+            return -1
+        return (tail & self.mask) * self.words
+
+    def release(self):
+        self.idx[1] = (self.idx[1] + 1) & 0x3FFFFFFF
+
+
+class WindowView:
+    """
+    Az utoljára átvett telemetria rekord a UI magon, a FanController mezőneveivel: a UI oldal
+    (kijelző, eredmény napló, tartós teszt) ebből olvas, így egy ablak minden értéke összetartozik,
+    és nem a vezérlő mag által épp írt objektumból jön.
+    """
+    def __init__(self, fan):
+        self.last_measure_time = fan.last_measure_time
+        self.current_rpm = fan.current_rpm
+        self.raw_rpm = fan.raw_rpm
+        self.current_duty_percent = fan.current_duty_percent
+        self.stall_detected = fan.stall_detected
+        self.target_rpm = fan.target_rpm
+        self.window_ms = 0
+
+
+class ControlCore:
+    def __init__(self, fan):
+        self.fan = fan
+        self.period_us = config.CONTROL_PERIOD_US
+        self.commands = SpscRing(config.CONTROL_RING_SLOTS, CMD_WORDS)
+        self.telemetry = SpscRing(config.CONTROL_RING_SLOTS, TELEMETRY_WORDS)
+        self.stats = array('i', (0, 0, 0, 0))
+        self.flags = array('b', (0, 0))  # [fut, leállítás kérve]
+        self.window_seq = 0
+        self.view = WindowView(fan)
+        self.error = None
+        # Nyugtázás: kiadott (csak a UI írja) és végrehajtott (csak a vezérlő mag írja) parancsok száma
+        self.issued = 0
+        self.acked = array('I', (0,))
+
+    # --- UI mag oldal ---
+
+    def start(self):
+        """A hurok indítása a második magon; ettől kezdve a FanController parancsai ide jönnek."""
+        self.flags[0] = 1
+        self.fan.remote = self
+        _thread.start_new_thread(self._loop, ())
+
+    def stop(self, timeout_ms=500):
+        """Leállítás kérése és megvárása; utána a FanController ismét közvetlenül vezérel."""
+        self.flags[1] = 1
+        end = time.ticks_add(time.ticks_ms(), timeout_ms)
+        while self.flags[0] and time.ticks_diff(end, time.ticks_ms()) > 0:
+            time.sleep_ms(5)
+        self.fan.remote = None
+
+    def _command(self, op, value):
+        """Parancs a gyűrűbe; a nyugtázási sorszámot adja (done()), vagy -1-et, ha a gyűrű tele van."""
+        base = self.commands.reserve()
+        if base < 0:
+            return -1
+        self.commands.buf[base] = op
+        self.commands.buf[base + 1] = value
+        self.commands.commit()
+        self.issued = (self.issued + 1) & 0x3FFFFFFF
+        return self.issued
+
+    def done(self, ticket):
+        """A ticket sorszámú parancsot (és minden korábbit) a vezérlő mag már végrehajtotta."""
+        return (self.acked[0] - ticket) & 0x3FFFFFFF < 0x20000000
+
+    def command_duty(self, percent):
+        return self._command(OP_DUTY, percent)
+
+    def command_target(self, rpm):
+        return self._command(OP_TARGET, rpm)
+
+    def reset_stats(self):
+        return self._command(OP_RESET_STATS, 0)
+
+    def command_filter(self, index):
+        return self._command(OP_FILTER, index)
+
+    def command_capture_start(self):
+        return self._command(OP_CAPTURE_START, 0)
+
+    def command_capture_stop(self):
+        return self._command(OP_CAPTURE_STOP, 0)
+
+    def command_capture_release(self):
+        return self._command(OP_CAPTURE_RELEASE, 0)
+
+    def poll_window(self):
+        """
+        Egy lezárt mérési ablak átvétele a telemetria gyűrűből a view pillanatképbe (a UI oldali
+        feldolgozáshoz, pl. eredmény napló és kijelző). Igazat ad, ha volt új ablak.
+        """
+        base = self.telemetry.peek()
+        if base < 0:
+            return False
+        buf = self.telemetry.buf
+        view = self.view
+        self.window_seq = buf[base + T_SEQ]
+        view.last_measure_time = buf[base + T_MS]
+        view.current_rpm = buf[base + T_RPM]
+        view.raw_rpm = buf[base + T_RAW]
+        view.current_duty_percent = buf[base + T_DUTY]
+        view.stall_detected = buf[base + T_STALL] != 0
+        view.target_rpm = buf[base + T_TARGET]
+        view.window_ms = buf[base + T_WINDOW_MS]
+        self.telemetry.release()
+        return True
+
+    def jitter_report(self):
+        """Ütemezési pontosság: ciklusok, átlagos / legnagyobb késés (us), túlfutások, eldobott rekordok."""
+        s = self.stats
+        ticks = max(1, s[S_TICKS])
+        return (s[S_TICKS], s[S_LATE_SUM] // ticks, s[S_LATE_MAX], s[S_OVERRUNS],
+                self.commands.dropped + self.telemetry.dropped)
+
+    # --- Vezérlő mag oldal (nem foglal memóriát) ---
+
+    def _drain_commands(self):
+        ring = self.commands
+        fan = self.fan
+        base = ring.peek()
+        while base >= 0:
+            op = ring.buf[base]
+            value = ring.buf[base + 1]
+            if op == OP_DUTY:
+                fan._apply_duty(value)
+            elif op == OP_TARGET:
+                if value < 0:
+                    fan.target_mode_active = False
+                else:
+                    fan.target_rpm = value
+                    fan.target_mode_active = True
+            elif op == OP_FILTER:
+                fan._apply_filter(value)
+            elif op == OP_CAPTURE_START:
+                fan._start_capture()
+            elif op == OP_CAPTURE_STOP:
+                fan._stop_capture()
+            elif op == OP_CAPTURE_RELEASE:
+                fan._release_capture()
+            elif op == OP_RESET_STATS:
+                s = self.stats
+                s[S_TICKS] = s[S_LATE_SUM] = s[S_LATE_MAX] = s[S_OVERRUNS] = 0
+                fan._reset_window_stats()
+            ring.release()
+            self.acked[0] = (self.acked[0] + 1) & 0x3FFFFFFF
+            base = ring.peek()
+
+    def _publish_window(self, seq, window_ms):
+        ring = self.telemetry
+        base = ring.reserve()
+        if base < 0:
+            return
+        fan = self.fan
+        buf = ring.buf
+        buf[base + T_SEQ] = seq
+        buf[base + T_MS] = fan.last_measure_time
+        buf[base + T_RPM] = fan.current_rpm
+        buf[base + T_DUTY] = fan.current_duty_percent
+        buf[base + T_STALL] = 1 if fan.stall_detected else 0
+        buf[base + T_WINDOW_MS] = window_ms
+        buf[base + T_RAW] = fan.raw_rpm
+        buf[base + T_TARGET] = fan.target_rpm
+        ring.commit()
+
+    def _loop(self):
+        fan = self.fan
+        stats = self.stats
+        period = self.period_us
+        deadline = time.ticks_add(time.ticks_us(), period)
+        seq = 0
+        try:
+            while not self.flags[1]:
+                # Várakozás a következő határidőig (rövid hátralévő időnél sleep_us pontosabb)
+                remaining = time.ticks_diff(deadline, time.ticks_us())
+                if remaining > 0:
+                    time.sleep_us(remaining)
+                late = time.ticks_diff(time.ticks_us(), deadline)
+                stats[S_TICKS] += 1
+                stats[S_LATE_SUM] += late
+                if late > stats[S_LATE_MAX]:
+                    stats[S_LATE_MAX] = late
+                if late > period:
+                    # Túlfutás (pl. flash írás miatti magfelfüggesztés): a rácsot újraillesztjük
+                    stats[S_OVERRUNS] += 1
+                    deadline = time.ticks_us()
+                deadline = time.ticks_add(deadline, period)
+
+                self._drain_commands()
+                start = fan.last_measure_time
+                if fan.calculate_rpm():
+                    seq += 1
+                    self._publish_window(seq, time.ticks_diff(fan.last_measure_time, start))
+        except Exception as e:
+            self.error = e
+        self.flags[0] = 0
+
+# Utolsó módosítás: 2026. október 19. 23:15:00
\ No newline at end of file
@@ -0,0 +1,66 @@
+# Fájl helye: /encoder.py
+# Funkció: Opcionális forgó jeladó (rotary encoder) kvadratúra dekódolása hard IRQ-ban,
+# állapottáblával, sebességfüggő lépésközzel a kézi PWM és a cél RPM finom állításához.
+
+from machine import Pin
+from array import array
+import time
+import config
+
+# Kvadratúra állapottábla: index = (előző AB << 2) | új AB, érték = -1 / 0 / +1.
+# Érvénytelen (kétbites) ugrásnál 0, így a pergés nem okoz hamis lépést.
+_QDEC = array('b', [0, -1, 1, 0, 1, 0, 0, -1, -1, 0, 0, 1, 0, 1, -1, 0])
+
+
+class RotaryEncoder:
+    def __init__(self, pin_a, pin_b):
+        self.pin_a = Pin(pin_a, Pin.IN, Pin.PULL_UP)
+        self.pin_b = Pin(pin_b, Pin.IN, Pin.PULL_UP)
+        self._state = (self.pin_a.value() << 1) | self.pin_b.value()
+        self._count = 0     # Nyers kvadratúra lépések (csak az ISR írja)
+        self._taken = 0     # Az utoljára kiolvasott detent pozíció
+        self._last_take = time.ticks_ms()
+        self.irq_count = 0
+
+        # Mindkét láb mindkét élére hard IRQ: nem kerül az ütemező sorába, gyors forgatásnál sem vész el lépés
+        trigger = Pin.IRQ_FALLING | Pin.IRQ_RISING
+        self.pin_a.irq(trigger=trigger, handler=self._isr, hard=True)
+        self.pin_b.irq(trigger=trigger, handler=self._isr, hard=True)
+
+    def _isr(self, pin):
+        """Állapotgép léptetése a táblával. Nem foglal memóriát (csak kis egészek)."""
+        s = ((self._state << 2) | (self.pin_a.value() << 1) | self.pin_b.value()) & 0x0F
+        self._count += _QDEC[s]
+        self._state = s & 0x03
+        self.irq_count += 1
+
+    def take_raw(self):
+        """Az előző kiolvasás óta megtett detent lépések (előjeles, skálázás nélkül)."""
+        # Kerekítés a legközelebbi kattanásra: a nyugalmi helyzet körüli +-1 lépés pergés (lefelé
+        # csonkításnál -1 -> 0 -> -1 ...) így nem ad hamis oda-vissza detent párokat
+        steps = config.ENCODER_STEPS_PER_DETENT
+        position = (self._count + steps // 2) // steps
+        delta = position - self._taken
+        self._taken = position
+        return delta
+
+    def take(self):
+        """
+        Detent lépések sebesség szerint skálázva: lassú forgatásnál 1-es, gyorsnál
+        ENCODER_MEDIUM_SCALE / ENCODER_FAST_SCALE szoros lépések.
+        """
+        now = time.ticks_ms()
+        delta = self.take_raw()
+        if delta == 0:
+            self._last_take = now
+            return 0
+        dt = max(1, time.ticks_diff(now, self._last_take))
+        self._last_take = now
+        speed = abs(delta) * 1000 // dt  # detent / s
+        if speed >= config.ENCODER_FAST_DPS:
+            return delta * config.ENCODER_FAST_SCALE
+        if speed >= config.ENCODER_MEDIUM_DPS:
+            return delta * config.ENCODER_MEDIUM_SCALE
+        return delta
+
+# Utolsó módosítás: 2026. október 19. 21:45:00
\ No newline at end of file
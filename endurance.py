@@ -0,0 +1,272 @@
+# Fájl helye: /endurance.py
+# Funkció: Tartós (burn-in) teszt: a PWM lépcsők ciklikus ismétlése órákon / napokon át, lépcsőnként
+# folyamatos statisztikával fix memóriában: Welford átlag / szórás, min / max, P² percentilis becslők
+# (5 / 50 / 95 %), valamint ciklusonkénti átlag és ennek eltérése az első ciklustól (lassú romlás, drift).
+# Az állapot időnként ellenőrzőpontba kerül a flash-en (ideiglenes fájl + átnevezés), áramszünet után
+# onnan folytatódik.
+
+import json
+import os
+import time
+import config
+import logger
+
+QUANTILES = (0.05, 0.5, 0.95)
+
+
+class P2Quantile:
+    """
+    P² percentilis becslő (Jain & Chlamtac): 5 marker, minden új mintánál állandó idő és memória,
+    a minták tárolása nélkül. Az első 5 mintáig a pontos rendezett értékeket használja.
+    """
+    def __init__(self, p):
+        self.p = p
+        self.dn = (0.0, p / 2, p, (1 + p) / 2, 1.0)
+        self.reset()
+
+    def reset(self):
+        self.q = [0.0] * 5                           # Marker magasságok
+        self.n = [0, 1, 2, 3, 4]                     # Marker pozíciók
+        self.np = [0.0, 2 * self.p, 4 * self.p, 2 + 2 * self.p, 4.0]  # Kívánt pozíciók
+        self.count = 0
+
+    def add(self, x):
+        q = self.q
+        n = self.n
+        if self.count < 5:
+            q[self.count] = float(x)
+            self.count += 1
+            if self.count == 5:
+                q.sort()
+            return
+        self.count += 1
+        if x < q[0]:
+            q[0] = float(x)
+            k = 0
+        elif x >= q[4]:
+            q[4] = float(x)
+            k = 3
+        else:
+            k = 0
+            while x >= q[k + 1]:
+                k += 1
+        for i in range(k + 1, 5):
+            n[i] += 1
+        for i in range(5):
+            self.np[i] += self.dn[i]
+        # A belső markerek igazítása a kívánt pozícióhoz (parabolikus, ha kell lineáris lépés)
+        for i in range(1, 4):
+            d = self.np[i] - n[i]
+            if (d >= 1 and n[i + 1] - n[i] > 1) or (d <= -1 and n[i - 1] - n[i] < -1):
+                s = 1 if d > 0 else -1
+                qp = q[i] + s / (n[i + 1] - n[i - 1]) * (
+                    (n[i] - n[i - 1] + s) * (q[i + 1] - q[i]) / (n[i + 1] - n[i])
+                    + (n[i + 1] - n[i] - s) * (q[i] - q[i - 1]) / (n[i] - n[i - 1]))
+                if not q[i - 1] < qp < q[i + 1]:
+                    qp = q[i] + s * (q[i + s] - q[i]) / (n[i + s] - n[i])
+                q[i] = qp
+                n[i] += s
+
+    def value(self):
+        if self.count == 0:
+            return 0
+        if self.count < 5:
+            ordered = sorted(self.q[:self.count])
+            return int(ordered[min(self.count - 1, int(self.p * self.count))])
+        return int(self.q[2])
+
+    def state(self):
+        return [self.q, self.n, self.np, self.count]
+
+    def load(self, st):
+        self.q, self.n, self.np, self.count = st
+
+
+class StepStats:
+    """Egy PWM lépcső statisztikája: Welford, min / max, percentilisek és ciklusonkénti átlag."""
+    def __init__(self, duty):
+        self.duty = duty
+        self.quantiles = [P2Quantile(p) for p in QUANTILES]
+        self.reset()
+
+    def reset(self):
+        self.n = 0
+        self.mean = 0.0
+        self.m2 = 0.0
+        self.rpm_min = 0
+        self.rpm_max = 0
+        self.cycle_sum = 0       # Az aktuális ciklus mintái (egész RPM összeg)
+        self.cycle_n = 0
+        self.baseline = -1       # Az első teljes ciklus átlaga (drift viszonyítási alap)
+        self.last_cycle = -1     # A legutóbb lezárt ciklus átlaga
+        for q in self.quantiles:
+            q.reset()
+
+    def add(self, rpm):
+        self.n += 1
+        delta = rpm - self.mean
+        self.mean += delta / self.n
+        self.m2 += delta * (rpm - self.mean)
+        if self.n == 1 or rpm < self.rpm_min:
+            self.rpm_min = rpm
+        if rpm > self.rpm_max:
+            self.rpm_max = rpm
+        for q in self.quantiles:
+            q.add(rpm)
+        self.cycle_sum += rpm
+        self.cycle_n += 1
+
+    def close_cycle(self):
+        """A lépcső végén: a ciklus átlaga, az első ciklusé lesz a viszonyítási alap."""
+        if not self.cycle_n:
+            return
+        self.last_cycle = self.cycle_sum // self.cycle_n
+        if self.baseline < 0:
+            self.baseline = self.last_cycle
+        self.cycle_sum = 0
+        self.cycle_n = 0
+
+    def std(self):
+        return int((self.m2 / (self.n - 1)) ** 0.5) if self.n > 1 else 0
+
+    def drift_permille(self):
+        """Az utolsó ciklus átlagának eltérése az elsőtől, ezrelékben (0, ha még nincs két ciklus)."""
+        if self.baseline <= 0 or self.last_cycle < 0:
+            return 0
+        return (self.last_cycle - self.baseline) * 1000 // self.baseline
+
+    def state(self):
+        return [self.duty, self.n, self.mean, self.m2, self.rpm_min, self.rpm_max, self.cycle_sum,
+                self.cycle_n, self.baseline, self.last_cycle, [q.state() for q in self.quantiles]]
+
+    def load(self, st):
+        (self.duty, self.n, self.mean, self.m2, self.rpm_min, self.rpm_max, self.cycle_sum,
+         self.cycle_n, self.baseline, self.last_cycle, qs) = st
+        for q, qst in zip(self.quantiles, qs):
+            q.load(qst)
+
+
+class EnduranceTest:
+    """A lépcsők ütemezése, a minták gyűjtése és az ellenőrzőpontok. A memória a lépcsők számával arányos."""
+    def __init__(self, fan):
+        self.fan = fan
+        self.filename = config.ENDURANCE_FILE
+        self.tmp_filename = config.ENDURANCE_FILE + ".tmp"
+        self.steps = [StepStats(d) for d in config.ENDURANCE_STEPS]
+        self.active = False
+        self.cycle = 0
+        self.step_idx = 0
+        self.step_start = 0
+        self.elapsed_s = 0       # Összes futási idő (ellenőrzőponttal együtt megmarad)
+        self.view_idx = -1       # Kijelzőn mutatott lépcső (-1: az aktuális)
+        self.last_checkpoint = 0
+        self._last_tick = 0
+
+    def start(self, now):
+        """Indítás / folytatás: ha van ugyanilyen lépcsőkkel készült ellenőrzőpont, onnan folytatja."""
+        self.active = True
+        if not self._restore():
+            self.reset(now)
+        self.step_start = now
+        self.last_checkpoint = now
+        self._last_tick = now
+        self.fan.set_duty_percent(self.steps[self.step_idx].duty)
+
+    def stop(self):
+        if self.active:
+            self.checkpoint()
+        self.active = False
+
+    def reset(self, now):
+        for st in self.steps:
+            st.reset()
+        self.cycle = 0
+        self.step_idx = 0
+        self.elapsed_s = 0
+        self.step_start = now
+        self.fan.set_duty_percent(self.steps[0].duty)
+        try:
+            os.remove(self.filename)
+        except OSError:
+            pass
+
+    def tick(self, now):
+        """Periodikus (logikai hurok): lépcsőváltás és ellenőrzőpont."""
+        if not self.active:
+            return
+        d = time.ticks_diff(now, self._last_tick)
+        if d >= 1000:
+            self.elapsed_s += d // 1000
+            self._last_tick = time.ticks_add(self._last_tick, d // 1000 * 1000)
+        if time.ticks_diff(now, self.step_start) >= config.ENDURANCE_STEP_MS:
+            self.steps[self.step_idx].close_cycle()
+            self.step_idx += 1
+            if self.step_idx >= len(self.steps):
+                self.step_idx = 0
+                self.cycle += 1
+            self.step_start = now
+            self.fan.set_duty_percent(self.steps[self.step_idx].duty)
+        if time.ticks_diff(now, self.last_checkpoint) >= config.ENDURANCE_CHECKPOINT_MS:
+            self.last_checkpoint = now
+            self.checkpoint()
+
+    def sample(self, fan):
+        """Új mérési ablak: a beállási idő után a lépcső statisztikájába kerül a szűretlen érték."""
+        if not self.active:
+            return
+        if time.ticks_diff(fan.last_measure_time, self.step_start) < config.ENDURANCE_SETTLE_MS:
+            return
+        self.steps[self.step_idx].add(fan.raw_rpm)
+
+    def view_step(self):
+        return self.steps[self.step_idx if self.view_idx < 0 else self.view_idx]
+
+    def next_view(self):
+        """Kijelzett lépcső léptetése: aktuális -> 1. -> 2. ... -> aktuális."""
+        self.view_idx += 1
+        if self.view_idx >= len(self.steps):
+            self.view_idx = -1
+
+    def checkpoint(self):
+        """Az állapot atomikus kiírása: ideiglenes fájl, majd átnevezés (félbeszakadásnál a régi marad)."""
+        state = {"steps": config.ENDURANCE_STEPS, "cycle": self.cycle, "step": self.step_idx,
+                 "elapsed_s": self.elapsed_s, "stats": [st.state() for st in self.steps]}
+        try:
+            with open(self.tmp_filename, "w") as f:
+                json.dump(state, f)
+            os.rename(self.tmp_filename, self.filename)
+        except OSError as e:
+            logger.error("Hiba a tartos teszt mentesekor: {}", e)
+
+    def _restore(self):
+        try:
+            with open(self.filename) as f:
+                state = json.load(f)
+        except (OSError, ValueError):
+            return False
+        if state.get("steps") != list(config.ENDURANCE_STEPS):
+            return False # Más lépcsőkkel készült: nem folytatható
+        try:
+            for st, sst in zip(self.steps, state["stats"]):
+                st.load(sst)
+        except (TypeError, ValueError, KeyError):
+            for st in self.steps:
+                st.reset()
+            return False
+        self.cycle = state["cycle"]
+        self.step_idx = state["step"] % len(self.steps)
+        self.elapsed_s = state["elapsed_s"]
+        logger.info("Tartos teszt folytatasa: {}. ciklus, {} s", self.cycle, self.elapsed_s)
+        return True
+
+    def report_lines(self):
+        """Soros riport: lépcsőnként egy "E" sor (a fejléc a mezők sorrendjét adja meg)."""
+        lines = [f"EH,cycle={self.cycle},step={self.step_idx},elapsed_s={self.elapsed_s},active={int(self.active)}",
+                 "EL,duty,n,mean,std,min,max,p05,p50,p95,cycle_mean,drift_permille"]
+        for st in self.steps:
+            p05, p50, p95 = (q.value() for q in st.quantiles)
+            lines.append(f"E,{st.duty},{st.n},{int(st.mean)},{st.std()},{st.rpm_min},{st.rpm_max},"
+                         f"{p05},{p50},{p95},{st.last_cycle},{st.drift_permille()}")
+        return lines
+
+# Utolsó módosítás: 2026. október 19. 19:45:00
@@ -1,12 +1,68 @@
 # Fájl helye: /fan_control.py
-# Funkció: Ventilátor PWM vezérlése, fordulatszám mérése (mozgóátlaggal), elakadás figyelés.
+# Funkció: Ventilátor PWM vezérlése, fordulatszám mérése (módonként választható szűrő lánccal), elakadás figyelés.
+# Rögzítő mód: a TACH élek nyers ticks_us időbélyegei előre lefoglalt tömbbe (hullámforma elemzéshez).
+# A mérés és szabályzás futhat a második magon is (control_core): ekkor a parancsok gyűrűn érkeznek.
+# A mérő oldal állapotát (rögzítés, ablak statisztika) csak a mérő oldal írja: a nyilvános metódusok
+# második magos módban parancsot küldenek, a végrehajtást capture_done() jelzi. A beállításokat
+# (PWM, cél RPM, szűrő) csak változáskor küldjük; teli gyűrűnél hamisat adnak, és retry_commands() pótolja.
+# A mérési ablakot hardver időzítő zárja (pillanatkép a számlálóról és az időről), így az ablak pontos.
 
-from machine import Pin, PWM
+from machine import Pin, PWM, Timer
+from micropython import const
+from array import array
 import time
 import config
+import fixmath
+import rpm_filters
+import logger
+
+# Ablak pillanatkép (az időzítő callback írja, seqlock: páratlan sorszám = írás folyamatban)
+_SNAP_SEQ = const(0)
+_SNAP_COUNT = const(1)
+_SNAP_CAP = const(2)
+_SNAP_US = const(3)
+_SNAP_MS = const(4)
+_SNAP_GEN = const(5)  # Rögzítés generáció (páratlan: rögzítés fut)
+
+# Ablakhossz statisztika: ablakok, |eltérés| összeg / max (us), kihagyott ablakok, min / max hossz
+W_COUNT = const(0)
+W_ERR_SUM = const(1)
+W_ERR_MAX = const(2)
+W_MISSED = const(3)
+W_MIN_US = const(4)
+W_MAX_US = const(5)
+
+_NO_RETRY = const(-2)  # Nincs újraküldendő beállítás (a -1 a cél RPM-nél érvényes érték)
 
 class FanController:
     def __init__(self):
+        # Él rögzítés (capture): a pufferek csak az első rögzítéskor foglalódnak
+        self.cap_buf = None
+        self.cap_len = 0
+        self.cap_idx = 0
+        self.capturing = False
+        self._cap_taken = 0
+        # Indításkor és leállításkor nő (páratlan = rögzít); az ablak pillanatkép ezzel azonosítja a módot
+        self.cap_gen = 0
+        self._win_gen = 0
+        self.cap_start_us = 0
+        self.cap_end_us = 0
+        # PWM parancsok a rögzítés alatt: (ticks_us & ~0x7F) | kitöltés %, a visszajátszáshoz
+        self.cap_cmds = None
+        self.cap_cmd_idx = 0
+        self._cap_ticket = 0  # Az utolsó rögzítés parancs nyugtázási sorszáma (UI oldal)
+        # A puffer gazdája az indítástól az elengedésig (soros dump, ugrásválasz); csak a UI írja
+        self.cap_owner = None
+        # Második magos vezérlés (control_core.ControlCore): ha be van állítva, a parancsok oda mennek
+        self.remote = None
+        # Második magos módban az utoljára elküldött és az eldobott (újraküldendő) beállítások (UI oldal);
+        # -1: ismeretlen / nincs, a cél RPM-nél -1 a kikapcsolt cél mód, _NO_RETRY: nincs teendő
+        self._duty_sent = -1
+        self._target_sent = -1
+        self._duty_retry = _NO_RETRY
+        self._target_retry = _NO_RETRY
+        self._filter_retry = _NO_RETRY
+        
         # PWM inicializálás
         self.pwm = PWM(Pin(config.PIN_PWM))
         self.pwm.freq(config.PWM_FREQ)
@@ -14,14 +70,41 @@ class FanController:
         
         # TACH inicializálás
         self.tach_pin = Pin(config.PIN_TACH, Pin.IN, Pin.PULL_UP)
+        # Monoton (30 bitre maszkolt) számláló: a fogyasztó csak olvas és különbséget képez,
+        # így nincs olvasás-nullázás verseny az IRQ-val (akár másik magról is)
         self.tach_counter = 0
-        self.tach_pin.irq(trigger=Pin.IRQ_FALLING, handler=self._tach_isr)
+        self._tach_taken = 0
+        # Előre lekötött metódus: az IRQ-ban sem foglalunk
+        self._tach_isr_ref = self._tach_isr
+        # Hard IRQ: az ütemező (kijelző, GC) terhelése nem késlelteti és nem ejti el az impulzusokat.
+        # Egyszer, itt (a 0. magon) és mindkét élre regisztráljuk: az RP2040 GPIO IRQ engedélyezése
+        # magonkénti, és a kezelő csak a 0. magon fut, ezért a vezérlő mag nem válthat kezelőt;
+        # a rögzítés és a számlálás között a capturing jelző dönt
+        self.tach_pin.irq(trigger=Pin.IRQ_FALLING | Pin.IRQ_RISING, handler=self._tach_isr_ref, hard=True)
         
         # RPM számítás változók
         self.current_rpm = 0
+        self.raw_rpm = 0 # Az utolsó ablak szűretlen értéke
         self.last_measure_time = time.ticks_ms()
-        self.rpm_history = [0] * config.MOVING_AVERAGE_SAMPLES # Ring buffer
-        self.history_index = 0
+        self._last_window_us = time.ticks_us()
+        self.window_stats = array('i', (0, 0, 0, 0, 0x3FFFFFFF, 0))
+        
+        # Hardver időzítős ablak: pillanatkép + másolat (a feldolgozó oldal foglalás nélkül olvas)
+        self._timer = None
+        self.window_flag = None
+        self._snap = array('i', (0, 0, 0, 0, 0, 0))
+        self._win = array('i', (0, 0, 0, 0, 0, 0))
+        self._win_seq = 0
+        self._window_cb_ref = self._window_cb
+        # Szűrő láncok: mind előre felépítve, a váltás csak referencia csere (a második magon is)
+        self.rpm_filters = [rpm_filters.build(spec) for spec in rpm_filters.PRESETS]
+        self.rpm_filter = self.rpm_filters[0]
+        self.filter_index = 0
+        
+        # Trend gyűrűpuffer a grafikonhoz (RPM és PWM % mérésenként)
+        self.trend_rpm = array('H', [0] * config.TREND_SAMPLES)
+        self.trend_duty = bytearray(config.TREND_SAMPLES)
+        self.trend_seq = 0  # Eddig rögzített minták száma
         
         # Állapot
         self.current_duty_percent = 0
@@ -30,61 +113,362 @@ class FanController:
         # Target RPM logika
         self.target_rpm = 0
         self.target_mode_active = False
+        
+        if config.WINDOW_TIMER:
+            self.start_window_timer()
+
+    def start_window_timer(self):
+        """Periodikus hard időzítő indítása; az ablakokat a callback zárja, a jelzés window_flag-en jön."""
+        import uasyncio as asyncio
+        self.window_flag = asyncio.ThreadSafeFlag()
+        self._tach_taken = self.tach_counter
+        self._last_window_us = time.ticks_us()
+        self._timer = Timer()
+        self._timer.init(mode=Timer.PERIODIC, period=config.RPM_UPDATE_INTERVAL_MS,
+                         callback=self._window_cb_ref, hard=True)
+
+    def stop_window_timer(self):
+        if self._timer is not None:
+            self._timer.deinit()
+            self._timer = None
+
+    def window_timer_hits(self):
+        """Az ablak időzítő eddigi lefutásai (diagnosztikához)."""
+        return self._snap[_SNAP_SEQ] >> 1
+
+    def last_latch_us(self):
+        """Az utolsó időzítős ablakzárás ticks_us időpontja."""
+        return self._snap[_SNAP_US]
+
+    def _window_cb(self, timer):
+        """Hard időzítő callback: a számlálók és az idő egyidejű pillanatképe. Nem foglal memóriát."""
+        s = self._snap
+        s[_SNAP_SEQ] = (s[_SNAP_SEQ] + 1) & 0x3FFFFFFF
+        s[_SNAP_COUNT] = self.tach_counter
+        s[_SNAP_CAP] = self.cap_idx
+        s[_SNAP_US] = time.ticks_us()
+        s[_SNAP_MS] = time.ticks_ms()
+        s[_SNAP_GEN] = self.cap_gen
+        s[_SNAP_SEQ] = (s[_SNAP_SEQ] + 1) & 0x3FFFFFFF
+        self.window_flag.set()
 
     def _tach_isr(self, pin):
-        """Megszakítás kezelő a fordulatszám jeladóhoz."""
-        self.tach_counter += 1
+        """
+        Megszakítás kezelő a fordulatszám jeladóhoz, mindkét élre (hard IRQ, nem foglal memóriát).
+        Rögzítés alatt időbélyeg (30 bites ticks_us, páros) | szint az alsó biten a pufferbe;
+        egyébként a lefutó élek (impulzusok) számlálása.
+        """
+        if self.capturing:
+            i = self.cap_idx
+            if i < self.cap_len:
+                self.cap_buf[i] = (time.ticks_us() & 0x3FFFFFFE) | pin.value()
+                self.cap_idx = i + 1
+        elif not pin.value():
+            self.tach_counter = (self.tach_counter + 1) & 0x3FFFFFFF
+
+    def _capture_cmd(self):
+        """Az aktuális PWM parancs rögzítése (128 us felbontás; az alsó 7 bit a kitöltés %)."""
+        i = self.cap_cmd_idx
+        if i < len(self.cap_cmds):
+            self.cap_cmds[i] = (time.ticks_us() & 0x3FFFFF80) | self.current_duty_percent
+            self.cap_cmd_idx = i + 1
+
+    def _sent(self, ticket):
+        """A vezérlő magnak küldött parancs nyugtázási sorszáma; hamis (és figyelmeztetés), ha eldobódott."""
+        if ticket < 0:
+            logger.warn("Parancs eldobva (teli parancs gyuru)")
+            return False
+        return True
+
+    def _capture_ticket(self, ticket):
+        """Rögzítés parancs: a sorszámát capture_done() figyeli."""
+        if not self._sent(ticket):
+            return False
+        self._cap_ticket = ticket
+        return True
+
+    def capture_done(self):
+        """Az utolsó rögzítés parancs végrehajtódott: a pufferek és a cap_* mezők olvashatók."""
+        return self.remote is None or self.remote.done(self._cap_ticket)
+
+    def start_capture(self, owner):
+        """
+        Él rögzítés indítása (a puffer a CAPTURE_EDGES méretig telik meg). A puffer az owner-é marad
+        a release_capture()-ig; más gazda, vagy végrehajtatlan előző rögzítés parancs esetén nem indít
+        (hamisat ad). A pufferek itt, a UI magon foglalódnak.
+        """
+        if (self.cap_owner is not None and self.cap_owner is not owner) or not self.capture_done():
+            return False
+        if self.cap_buf is None:
+            self.cap_buf = array('I', (0 for _ in range(config.CAPTURE_EDGES)))
+            self.cap_cmds = array('I', (0 for _ in range(config.CAPTURE_CMDS)))
+        if self.remote is not None:
+            if not self._capture_ticket(self.remote.command_capture_start()):
+                return False
+        else:
+            self._start_capture()
+        self.cap_owner = owner
+        return True
+
+    def stop_capture(self, owner):
+        """Rögzítés vége; a rögzített élek száma a végrehajtás után (capture_done()) a cap_idx."""
+        if owner is not self.cap_owner:
+            return False
+        if self.remote is not None:
+            return self._capture_ticket(self.remote.command_capture_stop())
+        self._stop_capture()
+        return True
+
+    def release_capture(self, owner):
+        """A rögzítő pufferek elengedése a kiírás után; ezzel a gazda is elengedi a puffert."""
+        if owner is not self.cap_owner:
+            return False
+        if self.remote is not None:
+            if not self._capture_ticket(self.remote.command_capture_release()):
+                return False
+        else:
+            self._release_capture()
+        self.cap_owner = None
+        return True
+
+    def _start_capture(self):
+        if self.cap_buf is None:
+            return
+        self.cap_len = len(self.cap_buf)
+        self.cap_idx = 0
+        self.cap_cmd_idx = 0
+        self._cap_taken = 0
+        self.cap_start_us = time.ticks_us() & 0x3FFFFFFE
+        self.capturing = True # Az IRQ ettől a pufferbe ír (a mezők már beállítva)
+        self.cap_gen = (self.cap_gen + 1) & 0x3FFFFFFF
+        self._capture_cmd() # Kiinduló kitöltés
+
+    def _stop_capture(self):
+        if not self.capturing:
+            return
+        self.capturing = False # Az IRQ ettől ismét számlál
+        self.cap_end_us = time.ticks_us() & 0x3FFFFFFE
+        self.cap_gen = (self.cap_gen + 1) & 0x3FFFFFFF
+
+    def _release_capture(self):
+        self.cap_len = 0
+        self.cap_buf = None
+        self.cap_cmds = None
+
+    def pulses_since(self, mark):
+        """Impulzusok a mark (a tach_counter korábbi értéke) óta; él rögzítés alatt a számláló áll."""
+        return (self.tach_counter - mark) & 0x3FFFFFFF
 
     def set_duty_percent(self, percent):
-        """PWM kitöltési tényező beállítása %-ban."""
+        """
+        PWM kitöltési tényező beállítása %-ban (második magos módban a vezérlő magon hajtódik végre,
+        változatlan értéknél parancs nélkül). Hamis, ha a parancs eldobódott (retry_commands() pótolja).
+        """
+        percent = max(0, min(100, percent))
+        if self.remote is not None:
+            if percent == self._duty_sent and self._target_sent < 0:
+                self._duty_retry = _NO_RETRY # Cél módban a vezérlő mag állítja, ott mindig küldjük
+                return True
+            return self._send_duty(percent)
+        self._apply_duty(percent)
+        return True
+
+    def _send_duty(self, percent):
+        if not self._sent(self.remote.command_duty(percent)):
+            self._duty_retry = percent
+            return False
+        self._duty_retry = _NO_RETRY
+        self._duty_sent = percent
+        return True
+
+    def retry_commands(self):
+        """Az eldobott beállítás parancsok újraküldése (a UI hurok hívja második magos módban)."""
+        if self.remote is None:
+            return
+        if self._target_retry != _NO_RETRY:
+            self._send_target(self._target_retry)
+        if self._duty_retry != _NO_RETRY:
+            self._send_duty(self._duty_retry)
+        if self._filter_retry != _NO_RETRY:
+            self.select_filter(self._filter_retry)
+
+    def _apply_duty(self, percent):
+        """A PWM tényleges beállítása (egész aritmetikával, memóriafoglalás nélkül)."""
+        previous = self.current_duty_percent if self.capturing else -1
         self.current_duty_percent = max(0, min(100, percent))
-        duty_u16 = int((self.current_duty_percent / 100) * 65535)
-        self.pwm.duty_u16(duty_u16)
+        self.pwm.duty_u16(fixmath.duty_u16(self.current_duty_percent))
+        if previous >= 0 and previous != self.current_duty_percent:
+            self._capture_cmd() # Csak a tényleges változást rögzítjük
         # Reset stall if speed changed significantly (optional logic)
 
     def calculate_rpm(self):
-        """RPM számítása és mozgóátlag frissítése. (Periodikusan hívandó)"""
+        """RPM számítása és mozgóátlag frissítése. (Periodikusan hívandó)
+        Igazat ad, ha új mérési ablak zárult (friss current_rpm)."""
+        if self._timer is not None:
+            return self._timer_window()
         now = time.ticks_ms()
         dt = time.ticks_diff(now, self.last_measure_time)
+        if dt < config.RPM_UPDATE_INTERVAL_MS:
+            return False
+        self.last_measure_time = now
+        now_us = time.ticks_us()
+        self._window_stat(time.ticks_diff(now_us, self._last_window_us), 0)
+        self._last_window_us = now_us
+        count = self._take_pulses(self.tach_counter, self.cap_idx, self.cap_gen)
+        if count < 0:
+            return False
+        self._update_rpm(fixmath.rpm_from_window(count, dt * 1000, config.TACH_PULSES_PER_REV))
+        return True
+
+    def _timer_window(self):
+        """Az időzítő által zárt ablak feldolgozása (a pillanatkép konzisztens másolatával)."""
+        s = self._snap
+        w = self._win
+        while True:
+            seq = s[_SNAP_SEQ]
+            if seq & 1:
+                continue # A callback épp ír (csak másik magról fordulhat elő)
+            w[_SNAP_COUNT] = s[_SNAP_COUNT]
+            w[_SNAP_CAP] = s[_SNAP_CAP]
+            w[_SNAP_US] = s[_SNAP_US]
+            w[_SNAP_MS] = s[_SNAP_MS]
+            w[_SNAP_GEN] = s[_SNAP_GEN]
+            if s[_SNAP_SEQ] == seq:
+                break
+        if seq == self._win_seq:
+            return False
+        missed = (((seq - self._win_seq) & 0x3FFFFFFF) >> 1) - 1
+        self._win_seq = seq
+        dt_us = time.ticks_diff(w[_SNAP_US], self._last_window_us)
+        self._last_window_us = w[_SNAP_US]
+        self.last_measure_time = w[_SNAP_MS]
+        # Kihagyott ablak esetén is pontos: a monoton számláló különbsége a teljes dt_us-ra vonatkozik
+        self._window_stat(dt_us // (missed + 1), missed)
+        count = self._take_pulses(w[_SNAP_COUNT], w[_SNAP_CAP], w[_SNAP_GEN])
+        if count < 0:
+            return False
+        self._update_rpm(fixmath.rpm_from_window(count, dt_us, config.TACH_PULSES_PER_REV))
+        return True
+
+    def _take_pulses(self, counter, cap_idx, gen):
+        """
+        Impulzusok száma az előző ablak óta (rögzítés alatt a rögzített élekből). A számláló és az
+        él index a pillanatkép generációjához tartozik: ha az ablak alatt rögzítés indult vagy állt le,
+        a két érték nem összevethető, ezért az alapokat újraillesztjük és az ablakot eldobjuk (-1).
+        """
+        if gen != self._win_gen:
+            self._win_gen = gen
+            self._tach_taken = counter
+            self._cap_taken = cap_idx & ~1 if gen & 1 else 0
+            return -1
+        if gen & 1:
+            # Rögzítés alatt a számláló IRQ nem fut: két él egy impulzus
+            count = (cap_idx - self._cap_taken) // 2
+            self._cap_taken += count * 2
+            return count
+        count = (counter - self._tach_taken) & 0x3FFFFFFF
+        self._tach_taken = counter
+        return count
+
+    def _window_stat(self, dt_us, missed):
+        """Ablakhossz jitter: eltérés a névleges RPM_UPDATE_INTERVAL_MS-tól."""
+        st = self.window_stats
+        err = abs(dt_us - config.RPM_UPDATE_INTERVAL_MS * 1000)
+        st[W_COUNT] += 1
+        st[W_ERR_SUM] += err
+        if err > st[W_ERR_MAX]:
+            st[W_ERR_MAX] = err
+        st[W_MISSED] += missed
+        if dt_us < st[W_MIN_US]:
+            st[W_MIN_US] = dt_us
+        if dt_us > st[W_MAX_US]:
+            st[W_MAX_US] = dt_us
+
+    def reset_window_stats(self):
+        """
+        Ablak statisztika nullázása (második magos módban a vezérlő mag jitter statisztikájával együtt).
+        Hamis, ha a parancs eldobódott.
+        """
+        if self.remote is not None:
+            return self._sent(self.remote.reset_stats())
+        self._reset_window_stats()
+        return True
+
+    def _reset_window_stats(self):
+        st = self.window_stats
+        st[W_COUNT] = st[W_ERR_SUM] = st[W_ERR_MAX] = st[W_MISSED] = st[W_MAX_US] = 0
+        st[W_MIN_US] = 0x3FFFFFFF
+
+    def _update_rpm(self, raw_rpm):
+        """Közös feldolgozás egy lezárt ablak után: mozgóátlag, trend, elakadás, cél szabályzás."""
+        # Szűrés (0 értékeket is beleértve, ha a venti áll)
+        self.raw_rpm = raw_rpm
+        self.current_rpm = self.rpm_filter.update(raw_rpm)
         
-        if dt >= config.RPM_UPDATE_INTERVAL_MS:
-            # Atomic read and reset
-            count = self.tach_counter
-            self.tach_counter = 0
-            self.last_measure_time = now
-            
-            # RPM képlet: (impulzusok / impulzus_per_fordulat) * (60000 / eltelt_idő_ms)
-            raw_rpm = int((count / config.TACH_PULSES_PER_REV) * (60000 / dt))
-            
-            # Mozgóátlag frissítése
-            self.rpm_history[self.history_index] = raw_rpm
-            self.history_index = (self.history_index + 1) % config.MOVING_AVERAGE_SAMPLES
-            
-            # Átlagolás (0 értékeket is beleértve, ha a venti áll)
-            self.current_rpm = int(sum(self.rpm_history) / len(self.rpm_history))
+        # Trend puffer frissítése
+        slot = self.trend_seq % config.TREND_SAMPLES
+        self.trend_rpm[slot] = min(self.current_rpm, 65535)
+        self.trend_duty[slot] = self.current_duty_percent
+        self.trend_seq += 1
+        
+        # Stall detektálás
+        if self.current_duty_percent > config.STALL_THRESHOLD_DUTY and self.current_rpm == 0:
+            self.stall_detected = True
+        else:
+            self.stall_detected = False
             
-            # Stall detektálás
-            if self.current_duty_percent > config.STALL_THRESHOLD_DUTY and self.current_rpm == 0:
-                self.stall_detected = True
-            else:
-                self.stall_detected = False
-                
-            # Target RPM szabályozás (egyszerű feedback)
-            if self.target_mode_active:
-                self._adjust_for_target()
+        # Target RPM szabályozás (egyszerű feedback)
+        if self.target_mode_active:
+            self._adjust_for_target()
+
+    def select_filter(self, index):
+        """RPM szűrő lánc választása (rpm_filters.PRESETS index, pl. rpm_filters.mode_index(állapot))."""
+        if self.remote is not None:
+            ok = self._sent(self.remote.command_filter(index))
+            self._filter_retry = _NO_RETRY if ok else index
+            return ok
+        self._apply_filter(index)
+        return True
+
+    def _apply_filter(self, index):
+        if index == self.filter_index:
+            return
+        chain = self.rpm_filters[index]
+        chain.reset(self.current_rpm) # Az új lánc a jelenlegi értékről indul, nincs ugrás
+        self.rpm_filter = chain
+        self.filter_index = index
 
     def set_target_rpm(self, rpm):
-        """Cél RPM beállítása."""
+        """Cél RPM beállítása; hamis, ha a parancs eldobódott (retry_commands() pótolja)."""
+        if self.remote is not None:
+            return self._send_target(max(0, rpm))
         self.target_rpm = rpm
         self.target_mode_active = True
+        return True
         
     def disable_target_mode(self):
+        if self.remote is not None:
+            return self._send_target(-1)
         self.target_mode_active = False
+        return True
+
+    def _send_target(self, rpm):
+        """Cél RPM parancs (rpm < 0: cél mód ki) csak változáskor."""
+        if rpm == self._target_sent:
+            self._target_retry = _NO_RETRY
+            return True
+        if not self._sent(self.remote.command_target(rpm)):
+            self._target_retry = rpm
+            return False
+        self._target_retry = _NO_RETRY
+        self._target_sent = rpm
+        self._duty_sent = -1 # A cél módban a vezérlő mag állította a PWM-et: a következő kitöltést küldeni kell
+        return True
 
     def _adjust_for_target(self):
         """Egyszerű szabályozás a cél RPM eléréséhez."""
         if self.target_rpm <= 0:
-            self.set_duty_percent(0)
+            self._apply_duty(0)
             return
 
         error = self.target_rpm - self.current_rpm
@@ -93,8 +477,8 @@ class FanController:
         if abs(error) > config.TARGET_RPM_TOLERANCE:
             step = 1 if abs(error) < 500 else 5 # Dinamikus lépésköz
             if error > 0:
-                self.set_duty_percent(self.current_duty_percent + step)
+                self._apply_duty(self.current_duty_percent + step)
             else:
-                self.set_duty_percent(self.current_duty_percent - step)
+                self._apply_duty(self.current_duty_percent - step)
 
-# Utolsó módosítás: 2026. február 05. 22:15:00
\ No newline at end of file
+# Utolsó módosítás: 2026. október 19. 23:15:00
\ No newline at end of file
@@ -0,0 +1,85 @@
+# Fájl helye: /fb_mirror.py
+# Funkció: A kijelző tartalmának tükrözése a soros portra (távoli felügyelet, képernyő felvétel).
+# Az SSD1306 meghajtó lap szintű különbség maszkját használja: csak a változott lapok mennek ki,
+# futáshossz kódolva (RLE), időnként teljes kulcskép. Megjelenítés hoston: tools/oled_viewer.py.
+#
+# Sorok: laponként "#FB,<sorszám>,<lap>,<hex RLE>" ([darab, bájt] párok), majd a kép végén
+# "#FE,<sorszám>,<K|D>,<szélesség>,<magasság>" (K: kulcskép, minden lap benne van; D: különbség).
+
+import micropython
+import ubinascii
+import time
+import uasyncio as asyncio
+import config
+
+
+@micropython.viper
+def _rle(src: ptr8, start: int, n: int, dst: ptr8) -> int:
+    """Egy lap futáshossz kódolása [darab (1-255), bájt] párokba; a kimenet hossza bájtban."""
+    o = 0
+    i = start
+    end = start + n
+    while i < end:
+        v = src[i]
+        run = 1
+        while i + run < end and run < 255 and src[i + run] == v:
+            run += 1
+        dst[o] = run
+        dst[o + 1] = v
+        o += 2
+        i += run
+    return o
+
+
+class FrameMirror:
+    def __init__(self, display):
+        self.display = display
+        self.enabled = False
+        self.interval = config.MIRROR_INTERVAL_MS
+        self.seq = 0
+        self.keyframe_due = True
+        self.last_keyframe = time.ticks_ms()
+        self.rle = bytearray(2 * config.OLED_WIDTH)  # Legrosszabb eset: minden bájt külön futás
+
+    def start(self, interval_ms=0):
+        if interval_ms:
+            self.interval = max(50, interval_ms)
+        self.enabled = True
+        self.keyframe_due = True  # A néző az első teljes képtől tud rajzolni
+
+    def stop(self):
+        self.enabled = False
+
+    def send(self):
+        """A legutóbbi küldés óta változott lapok kiírása (kulcsképnél mind)."""
+        oled = self.display.oled
+        if oled is None:
+            self.keyframe_due = True
+            return
+        mask = oled.mirror_dirty
+        oled.mirror_dirty = 0
+        now = time.ticks_ms()
+        key = self.keyframe_due or time.ticks_diff(now, self.last_keyframe) >= config.MIRROR_KEYFRAME_MS
+        if key:
+            mask = (1 << oled.pages) - 1
+            self.keyframe_due = False
+            self.last_keyframe = now
+        if not mask:
+            return
+        width = oled.width
+        mv = memoryview(self.rle)
+        for p in range(oled.pages):
+            if (mask >> p) & 1:
+                # Az árnyék puffer pontosan a panelen lévő képet tartja
+                n = _rle(oled.shadow, p * width, width, self.rle)
+                print("#FB,%d,%d,%s" % (self.seq, p, ubinascii.hexlify(mv[:n]).decode()))
+        print("#FE,%d,%s,%d,%d" % (self.seq, "K" if key else "D", width, oled.height))
+        self.seq = (self.seq + 1) & 0xFFFF
+
+    async def run(self):
+        while True:
+            if self.enabled and self.display.available:
+                self.send()
+            await asyncio.sleep_ms(self.interval)
+
+# Utolsó módosítás: 2026. október 19. 19:00:00
@@ -0,0 +1,90 @@
+# Fájl helye: /fixmath.py
+# Funkció: Skálázott egész aritmetika a mérési, szűrési és szabályzó úthoz. A magok viper / native
+# kódra fordulnak, kis egészekkel és előre foglalt tömbökkel dolgoznak, így hívásuk nem foglal
+# memóriát (a második magon és megszakítás közeli úton is használhatók).
+# Viperben csak összeadás, szorzás, eltolás és összehasonlítás van; az osztást a native függvények végzik.
+
+import micropython
+from array import array
+
+
+@micropython.native
+def rpm_from_window(count, dt_us, ppr):
+    """
+    Impulzusszám és ablakhossz -> RPM. 100 us egységben számolunk, hogy a szorzat kis egész
+    maradjon (count < ~1700 impulzus / ablak-ig nincs bigint foglalás).
+    """
+    d = dt_us // 100
+    if d < 1:
+        d = 1
+    return count * 600000 // (ppr * d)
+
+
+@micropython.native
+def duty_u16(percent):
+    """Kitöltés % (0-100, vágva) -> PWM duty_u16 érték."""
+    if percent < 0:
+        percent = 0
+    elif percent > 100:
+        percent = 100
+    return percent * 65535 // 100
+
+
+@micropython.native
+def temp_c10(raw_u16):
+    """RP2040 belső hőmérő nyers értéke -> tized °C. T = 27 - (V - 0.706) / 0.001721; µV ~ raw * 1611 / 32."""
+    micro_volt = raw_u16 * 1611 // 32
+    return (270 * 1721 - (micro_volt - 706000) * 10) // 1721
+
+
+@micropython.viper
+def ema_step(acc: int, x: int, shift: int) -> int:
+    """EMA lépés 2^shift-szeres skálán: acc += x - acc / 2^shift (az érték acc >> shift)."""
+    return acc + x - (acc >> shift)
+
+
+@micropython.viper
+def _ring_push(buf: ptr32, state: ptr32, n: int, x: int) -> int:
+    i = state[1]
+    state[0] = state[0] + x - buf[i]
+    buf[i] = x
+    i += 1
+    if i >= n:
+        i = 0
+    state[1] = i
+    return state[0]
+
+
+@micropython.viper
+def median(src: ptr32, tmp: ptr32, n: int) -> int:
+    """n elem mediánja (beszúrásos rendezés a tmp tömbben; kis n-re ez a leggyorsabb)."""
+    for i in range(n):
+        v = src[i]
+        j = i
+        while j > 0 and tmp[j - 1] > v:
+            tmp[j] = tmp[j - 1]
+            j -= 1
+        tmp[j] = v
+    return tmp[n >> 1]
+
+
+class MovingAverage:
+    """Mozgóátlag futó összeggel: O(1) lépésenként, a sum() / len() helyett. Induláskor nullákkal telt."""
+    def __init__(self, n):
+        self.n = n
+        self.buf = array('i', (0 for _ in range(n)))
+        self.state = array('i', (0, 0))  # [futó összeg, következő index]
+
+    @micropython.native
+    def push(self, x):
+        """Új minta; az átlagot adja."""
+        return _ring_push(self.buf, self.state, self.n, x) // self.n
+
+    def reset(self, x=0):
+        """Újraindítás úgy, mintha minden korábbi minta x lett volna."""
+        for i in range(self.n):
+            self.buf[i] = x
+        self.state[0] = x * self.n
+        self.state[1] = 0
+
+# Utolsó módosítás: 2026. október 19. 19:30:00
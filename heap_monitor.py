@@ -0,0 +1,108 @@
+# Fájl helye: /heap_monitor.py
+# Funkció: Determinisztikus szemétgyűjtés ütemezése és heap telemetria (szabad memória, legnagyobb blokk, GC idő).
+
+import gc
+import time
+import config
+import logger
+
+
+class HeapMonitor:
+    def __init__(self):
+        # Biztonsági háló: ennyi foglalás után a MicroPython magától is gyűjt
+        gc.threshold(config.GC_THRESHOLD_BYTES)
+        gc.collect()
+
+        now = time.ticks_ms()
+        self.last_collect_time = now
+        self.last_report_time = now
+
+        # Statisztikák
+        self.collections = 0
+        self.last_gc_us = 0
+        self.max_gc_us = 0
+        self.total_gc_us = 0
+        self.min_free = gc.mem_free()
+        self.largest_block = 0
+
+    def collect_if_due(self, window_start):
+        """
+        Gyűjtés üresjárati résben: a hívó közvetlenül a kijelző frissítése után hívja.
+        Csak akkor fut, ha lejárt az intervallum és egy RPM mérési ablak épp most kezdődött,
+        így a GC szünet nem esik az ablak lezárásának közelébe.
+        """
+        now = time.ticks_ms()
+        if time.ticks_diff(now, self.last_collect_time) < config.GC_INTERVAL_MS:
+            return False
+        if time.ticks_diff(now, window_start) > config.GC_WINDOW_SLACK_MS:
+            return False
+        self.collect()
+        return True
+
+    def collect(self):
+        """Explicit gyűjtés időméréssel."""
+        t0 = time.ticks_us()
+        gc.collect()
+        dt = time.ticks_diff(time.ticks_us(), t0)
+
+        self.last_collect_time = time.ticks_ms()
+        self.collections += 1
+        self.last_gc_us = dt
+        self.total_gc_us += dt
+        if dt > self.max_gc_us:
+            self.max_gc_us = dt
+        free = gc.mem_free()
+        if free < self.min_free:
+            self.min_free = free
+
+    def probe_largest_block(self):
+        """
+        Legnagyobb összefüggő szabad blokk becslése felezéses próbafoglalással.
+        Drága (kb. 15-20 próba, mindegyik GC-t válthat ki, és nem igazodik az RPM ablakhoz), ezért csak
+        a soros 'heap' parancs hívja; az időszakos jelentés az utolsó lekérdezett értéket mutatja.
+        """
+        lo = 0
+        hi = gc.mem_free()
+        while hi - lo > 64:
+            mid = (lo + hi) // 2
+            try:
+                probe = bytearray(mid)
+                del probe
+                lo = mid
+            except MemoryError:
+                hi = mid
+        gc.collect()
+        self.largest_block = lo
+        return lo
+
+    def stats(self):
+        """Aktuális heap állapot szótárban (soros port / diagnosztikai képernyő)."""
+        avg = self.total_gc_us // self.collections if self.collections else 0
+        return {
+            "free": gc.mem_free(),
+            "alloc": gc.mem_alloc(),
+            "min_free": self.min_free,
+            "largest": self.largest_block,
+            "gc_count": self.collections,
+            "gc_last_us": self.last_gc_us,
+            "gc_avg_us": avg,
+            "gc_max_us": self.max_gc_us,
+        }
+
+    def report_if_due(self):
+        """
+        Időszakos heap jelentés a naplóba (DEBUG szinten); próbafoglalás nélkül. A logger szabálya
+        szerint konstans formátum és meglévő számok (bejegyzésenként legfeljebb 3), szótár és f-string nélkül.
+        """
+        if not logger.enabled(logger.DEBUG):
+            return
+        now = time.ticks_ms()
+        if time.ticks_diff(now, self.last_report_time) < config.HEAP_REPORT_INTERVAL_MS:
+            return
+        self.last_report_time = now
+        n = self.collections
+        logger.debug("HEAP free={} min={} largest={}", gc.mem_free(), self.min_free, self.largest_block)
+        logger.debug("HEAP gc={} last={}us max={}us", n, self.last_gc_us, self.max_gc_us)
+        logger.debug("HEAP gc avg={}us", self.total_gc_us // n if n else 0)
+
+# Utolsó módosítás: 2026. október 19. 23:45:00
\ No newline at end of file
@@ -1,42 +1,145 @@
 # Fájl helye: /inputs.py
-# Funkció: Gombok kezelése aszinkron módon, dinamikusan állítható pergésmentesítéssel.
+# Funkció: Gombok kezelése megszakítással és időzítős pergésmentesítéssel (tétlenül nincs lekérdezés),
+# gesztus felismeréssel: rövid, hosszú, gyorsuló ismétlés és dupla nyomás, típusos eseményekként.
 
-from machine import Pin
+from machine import Pin, Timer
+from micropython import const
 import uasyncio as asyncio
 import time
+import config
+
+# Ébredési késés mérés (instrument); const(0) esetén a fordító kihagyja
+_INSTR = const(1)
+if _INSTR:
+    import instrument
+    _PROBE = instrument.probe("button")
+
+# Gesztus események (a callback első paramétere)
+PRESS = const(1)    # Rövid nyomás (felengedéskor; dupla felismerésnél a dupla ablak lejártakor)
+LONG = const(2)     # Hosszú nyomás (tartás közben, egyszer)
+REPEAT = const(3)   # Automatikus ismétlés a hosszú nyomás után, gyorsulva
+DOUBLE = const(4)   # Dupla nyomás (a két rövid nyomás helyett érkezik, PRESS nélkül)
 
 class Button:
     def __init__(self, pin_num, callback, debounce_ms=200):
         self.pin = Pin(pin_num, Pin.IN, Pin.PULL_UP)
         self.callback = callback
+        # Két elfogadott lenyomás közötti minimális idő (a felhasználói "érzékenység" beállítás)
         self.debounce_ms = debounce_ms
-        self.last_press_time = 0
-        self._is_pressed = False
-        
-        # Háttérfolyamat indítása a gomb figyelésére
-        asyncio.create_task(self._monitor())
+
+        # Stabil (pergésmentesített) állapot és az utolsó stabil él ideje
+        self._pressed = False
+        self._edge_time = 0
+        self._edge_us = 0
+        self._last_down = time.ticks_add(time.ticks_ms(), -debounce_ms - 1)
+        self._last_click = time.ticks_add(time.ticks_ms(), -config.BUTTON_DOUBLE_MS - 1)
+        self._click_armed = False  # Függő rövid nyomás: a PRESS a dupla ablak lejártáig visszatartva
+        # Dupla nyomás felismerés; kikapcsolva a PRESS késleltetés nélkül megy (pl. menükben)
+        self.double = False
+        self.irq_count = 0
+
+        # Él megszakítás -> egylövetű időzítő (stabilizálódás) -> flag -> gesztus feladat
+        self._flag = asyncio.ThreadSafeFlag()
+        self._timer = Timer()
+        self._settle_ref = self._settle_cb  # Előre lekötött metódus, hogy az IRQ-ban ne foglaljunk
+        self.pin.irq(trigger=Pin.IRQ_FALLING | Pin.IRQ_RISING, handler=self._edge_isr)
+
+        # Háttérfolyamat indítása a gesztusok felismerésére
+        asyncio.create_task(self._gesture_loop())
 
     def update_debounce(self, new_ms):
         """Debounce érték frissítése futás közben."""
         self.debounce_ms = new_ms
 
-    async def _monitor(self):
+    def _edge_isr(self, pin):
+        """Minden élnél újraindítja a stabilizálási időzítőt; pergés alatt tehát nem mintavételez."""
+        self.irq_count += 1
+        self._timer.init(mode=Timer.ONE_SHOT, period=config.BUTTON_SETTLE_MS, callback=self._settle_ref)
+
+    def _settle_cb(self, timer):
+        """A szint BUTTON_SETTLE_MS óta stabil: ha változott, jelezzük a gesztus feladatnak."""
+        pressed = self.pin.value() == 0  # Aktív alacsony (PULL_UP miatt 0 ha lenyomva)
+        if pressed != self._pressed:
+            self._pressed = pressed
+            self._edge_time = time.ticks_ms()
+            self._edge_us = time.ticks_us()
+            self._flag.set()
+
+    def _emit(self, event, count=0):
+        if self.callback:
+            if _INSTR:
+                t0 = time.ticks_us()
+            self.callback(event, count) # Callback hívása
+            if _INSTR:
+                _PROBE.stop(t0)
+
+    async def _wait_edge(self, timeout_ms):
+        """Következő stabil élre várás időkorláttal; False, ha lejárt az idő."""
+        try:
+            await asyncio.wait_for_ms(self._flag.wait(), timeout_ms)
+            return True
+        except asyncio.TimeoutError:
+            return False
+
+    def _flush_click(self):
+        """A visszatartott rövid nyomás kiadása (lejárt a dupla ablak, vagy hosszú nyomás jött)."""
+        if self._click_armed:
+            self._click_armed = False
+            self._emit(PRESS)
+
+    async def _gesture_loop(self):
         while True:
-            current_val = self.pin.value()
-            
-            # Aktív alacsony (PULL_UP miatt 0 ha lenyomva)
-            if current_val == 0:
-                now = time.ticks_ms()
-                # Csak akkor érzékeljük, ha eltelt a debounce idő az előző óta
-                if not self._is_pressed and time.ticks_diff(now, self.last_press_time) > self.debounce_ms:
-                    self.last_press_time = now
-                    self._is_pressed = True
-                    if self.callback:
-                        self.callback() # Callback hívása
+            if self._click_armed:
+                # Függő rövid nyomás: a második lenyomásra csak a dupla ablak végéig várunk
+                remaining = config.BUTTON_DOUBLE_MS - time.ticks_diff(time.ticks_ms(), self._last_click)
+                if remaining <= 0 or not await self._wait_edge(remaining):
+                    self._flush_click()
+                    continue
+            else:
+                await self._flag.wait()
+            if _INSTR:
+                _PROBE.start(self._edge_us) # Késés a stabil éltől a feladat ébredéséig
+            if not self._pressed:
+                continue # Felengedés, amit már lekezeltünk
+
+            # A kontaktus pergést a BUTTON_SETTLE_MS stabilizálás szűri; a felhasználói érzékenység
+            # csak a dupla nyomásra nem esélyes ismételt lenyomásokat dobja el
+            down_time = self._edge_time
+            double = self._click_armed and time.ticks_diff(down_time, self._last_click) < config.BUTTON_DOUBLE_MS
+            if not double and time.ticks_diff(down_time, self._last_down) <= self.debounce_ms:
+                # Túl gyors ismételt lenyomás: kivárjuk a felengedést és eldobjuk
+                while self._pressed:
+                    await self._flag.wait()
+                continue
+            self._last_down = down_time
+
+            # Tartás figyelése: LONG, majd gyorsuló REPEAT események
+            held = False
+            repeats = 0
+            timeout = config.BUTTON_LONG_MS
+            while self._pressed:
+                if await self._wait_edge(timeout) or not self._pressed:
+                    continue
+                if not held:
+                    held = True
+                    self._flush_click() # Az előző rövid nyomás nem lett dupla
+                    self._emit(LONG)
+                    timeout = config.BUTTON_REPEAT_START_MS
+                else:
+                    repeats += 1
+                    self._emit(REPEAT, repeats)
+                    timeout = max(config.BUTTON_REPEAT_MIN_MS, timeout * config.BUTTON_REPEAT_ACCEL // 100)
+            if held:
+                continue
+
+            # Rövid nyomás: dupla, ha függő rövid nyomás volt; különben visszatartjuk (ha kell dupla)
+            if double:
+                self._click_armed = False
+                self._emit(DOUBLE)
+            elif self.double:
+                self._click_armed = True
+                self._last_click = down_time
             else:
-                # Felengedéskor reseteljük a belső állapotot, de az időzítőt nem
-                self._is_pressed = False
-                
-            await asyncio.sleep_ms(20) # Poll interval
+                self._emit(PRESS)
 
-# Utolsó módosítás: 2026. február 06. 09:05:00
\ No newline at end of file
+# Utolsó módosítás: 2026. október 19. 21:15:00
\ No newline at end of file
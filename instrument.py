@@ -0,0 +1,114 @@
+# Fájl helye: /instrument.py
+# Funkció: Eseményhurok mérés: feladatonként az iterációk futási ideje és az ébredési késés
+# fix méretű log2 hisztogramokban, valamint az IRQ források találatszámai. Soros portról ('instr')
+# és a rejtett diagnosztikai képernyőről (ABOUT-ban SELECT hosszan) kérdezhető le.
+# Kikapcsolás: a mért modulok (main.py, inputs.py) elején `_INSTR = const(0)`; a fordító ekkor
+# a mérő ágakat kihagyja, és ez a modul be sem töltődik.
+
+from array import array
+import time
+
+BUCKETS = 20  # [0]: < 2 us, [i]: 2^i .. 2^(i+1) us, [19]: >= ~0,5 s
+
+
+def _bucket(us):
+    b = 0
+    while us > 1 and b < BUCKETS - 1:
+        us >>= 1
+        b += 1
+    return b
+
+
+class Probe:
+    """Egy feladat mérőpontja. start() / stop() foglalás nélkül (kis egészek, előre foglalt tömbök)."""
+    def __init__(self, name):
+        self.name = name
+        self.dur = array('I', (0 for _ in range(BUCKETS)))
+        self.late = array('I', (0 for _ in range(BUCKETS)))
+        self.n = 0
+        self.dur_max = 0
+        self.late_max = 0
+        self.deadline = 0
+        self.armed = False
+
+    def start(self, expected_us=-1):
+        """Iteráció kezdete; a késés a stop()-ban beállított (vagy megadott) várt ébredéshez képest."""
+        now = time.ticks_us()
+        if expected_us >= 0:
+            self.deadline = expected_us
+            self.armed = True
+        if self.armed:
+            late = time.ticks_diff(now, self.deadline)
+            if late < 0:
+                late = 0
+            self.late[_bucket(late)] += 1
+            if late > self.late_max:
+                self.late_max = late
+            self.armed = False
+        return now
+
+    def stop(self, t0, sleep_ms=-1):
+        """Iteráció vége; ha a feladat most sleep_ms-ig alszik, az a következő várt ébredés."""
+        now = time.ticks_us()
+        dur = time.ticks_diff(now, t0)
+        self.dur[_bucket(dur)] += 1
+        if dur > self.dur_max:
+            self.dur_max = dur
+        self.n += 1
+        if sleep_ms >= 0:
+            self.deadline = time.ticks_add(now, sleep_ms * 1000)
+            self.armed = True
+
+    def reset(self):
+        for i in range(BUCKETS):
+            self.dur[i] = 0
+            self.late[i] = 0
+        self.n = 0
+        self.dur_max = 0
+        self.late_max = 0
+
+
+PROBES = []
+ISR_SOURCES = []  # (név, függvény ami a találatszámot adja)
+
+
+def probe(name):
+    """Mérőpont létrehozása és regisztrálása (modul betöltéskor / inicializáláskor)."""
+    p = Probe(name)
+    PROBES.append(p)
+    return p
+
+
+def isr_source(name, counter_fn):
+    ISR_SOURCES.append((name, counter_fn))
+
+
+def _hist(h):
+    return " ".join(f"{i}:{h[i]}" for i in range(BUCKETS) if h[i])
+
+
+def report_lines():
+    """Soros riport: mérőpontonként egy sor, hisztogram rekeszek 'log2(us):darab' alakban."""
+    lines = []
+    for p in PROBES:
+        lines.append(f"I,{p.name},n={p.n},dur_max={p.dur_max}us,late_max={p.late_max}us,"
+                     f"dur=[{_hist(p.dur)}],late=[{_hist(p.late)}]")
+    lines.append("I,isr," + ",".join(f"{name}={fn()}" for name, fn in ISR_SOURCES))
+    return lines
+
+
+def screen_rows(page):
+    """
+    Diagnosztikai képernyő sorai (16 karakter, 4 sor): 0. oldal a feladatok legnagyobb futási
+    ideje (r) és ébredési késése (l) ms-ban, 1. oldal az IRQ találatok.
+    """
+    if page == 0:
+        return [f"{p.name[:6]:<6}r{p.dur_max // 1000:<4}l{p.late_max // 1000}" for p in PROBES[:4]]
+    return [f"{name[:8]:<8}{fn():>8}" for name, fn in ISR_SOURCES[:4]]
+
+
+def reset():
+    for p in PROBES:
+        p.reset()
+
+# Utolsó módosítás: 2026. október 19. 18:30:00
\ No newline at end of file
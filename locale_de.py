@@ -0,0 +1,58 @@
+# Fájl helye: /locale_de.py
+# Funkció: A német nyelvű szövegek. Forrás fájl: a firmware a tools/build_locales.py által generált lstr_xx.py-t használja.
+
+STRINGS = {
+    "app_name": "Pandafix",
+    "app_sub": "Luefter Test",
+    "init_hw": "HW Init...",
+    "error_init": "Init Fehler!",
+    "menu_title": "MODUS WAEHLEN",
+    "mode_auto": "AUTO TEST",
+    "mode_manual": "MANUELL TEST",
+    "mode_target": "ZIEL RPM",
+    "mode_endurance": "DAUERTEST",
+    "mode_step": "SPRUNGANTWORT",
+    "mode_batch": "SERIENTEST",
+    "mode_settings": "EINSTELLUNGEN",
+    "mode_about": "UEBER UNS",
+    "mode_language": "SPRACHE",
+    "set_lang": "SPRACHE AUSWAEHLEN",
+    "set_step": "PWM SCHRITTGROESSE",
+    "set_debounce": "TASTEN EMPFINDLICHKEIT",
+    "pwm": "PWM",
+    "rpm": "RPM",
+    "target": "ZIEL",
+    "temp": "Temp",
+    "stall_alert": "FEHLER! (STALL)",
+    "batch_wait": "LUEFTER EINST.",
+    "batch_pass": "OK",
+    "batch_fail": "FEHLER",
+    "btn_nav": "A:Wahl B:Menu",
+    "btn_back": "B: Zurueck",
+    "saved": "Gespeichert!",
+    "unit_ms": "ms",
+    "unit_pct": "%",
+    "back": "Zurueck",
+    "lang_name": "Deutsch",
+    "about_text": [
+        "Pandafix",
+        "Fan Tester",
+        "----------------",
+        "Erstellt von:",
+        "pandafix.hu",
+        "Dev: EkE",
+        "",
+        "Funktionen:",
+        "- PWM Luefter-",
+        "  steuerung",
+        "- RPM Messung",
+        "- OLED Anzeige",
+        "- Auto & Manuell",
+        "  Modus",
+        "",
+        "Danke fuer",
+        "die Nutzung!"
+    ]
+}
+
+# Utolsó módosítás: 2026. október 19. 20:15:00
\ No newline at end of file
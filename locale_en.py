@@ -0,0 +1,62 @@
+# Fájl helye: /locale_en.py
+# Funkció: Az angol nyelvű szövegek. Forrás fájl: a firmware a tools/build_locales.py által generált lstr_xx.py-t használja.
+
+STRINGS = {
+    "app_name": "Pandafix",
+    "app_sub": "Fan Tester",
+    "init_hw": "HW Init...",
+    "error_init": "Init Error!",
+    "menu_title": "SELECT MODE",
+    "mode_auto": "AUTO TEST",
+    "mode_manual": "MANUAL TEST",
+    "mode_target": "TARGET RPM",
+    "mode_endurance": "ENDURANCE",
+    "mode_step": "STEP RESPONSE",
+    "mode_batch": "BATCH TEST",
+    "mode_settings": "SETTINGS",
+    "mode_about": "ABOUT",
+    "mode_language": "LANGUAGE",
+    "set_lang": "LANGUAGE SELECT",
+    "set_step": "PWM STEP SIZE",
+    "set_debounce": "BUTTON SENSITIVITY",
+    "pwm": "PWM",
+    "rpm": "RPM",
+    "target": "TGT",
+    "temp": "Temp",
+    "stall_alert": "ERROR! (STALL)",
+    "batch_wait": "INSERT FAN",
+    "batch_pass": "PASS",
+    "batch_fail": "FAIL",
+    "btn_nav": "A:Select B:Menu",
+    "btn_back": "B: Back",
+    "saved": "Saved!",
+    "unit_ms": "ms",
+    "unit_pct": "%",
+    "back": "Back to Menu",
+    "lang_name": "English",
+    "about_text": [
+        "Pandafix",
+        "Fan Tester",
+        "----------------",
+        "Created by:",
+        "pandafix.hu",
+        "Dev: EkE",
+        "",
+        "Features:",
+        "- Universal PWM",
+        "  Fan Control",
+        "- Precise RPM",
+        "  Measurement",
+        "- OLED Display",
+        "  with Animation",
+        "- Auto & Manual",
+        "  Test Modes",
+        "- Target RPM",
+        "  PID Control",
+        "",
+        "Thank you",
+        "for using!"
+    ]
+}
+
+# Utolsó módosítás: 2026. október 19. 20:15:00
\ No newline at end of file
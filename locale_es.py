@@ -0,0 +1,54 @@
+# Fájl helye: /locale_es.py
+# Funkció: A spanyol nyelvű szövegek. Forrás fájl: a firmware a tools/build_locales.py által generált lstr_xx.py-t használja.
+
+STRINGS = {
+    "app_name": "Pandafix",
+    "app_sub": "Fan Tester",
+    "init_hw": "Inic. HW...",
+    "error_init": "Error Init!",
+    "menu_title": "SELECC. MODO",
+    "mode_auto": "TEST AUTO",
+    "mode_manual": "TEST MANUAL",
+    "mode_target": "RPM OBJETIVO",
+    "mode_endurance": "RESISTENCIA",
+    "mode_step": "RESP. ESCALON",
+    "mode_batch": "PRUEBA SERIE",
+    "mode_settings": "AJUSTES",
+    "mode_about": "ACERCA DE",
+    "mode_language": "IDIOMA",
+    "set_lang": "SELECCIONAR IDIOMA",
+    "set_step": "TAMANO DE PASO PWM",
+    "set_debounce": "SENSIBILIDAD BOTON",
+    "pwm": "PWM",
+    "rpm": "RPM",
+    "target": "OBJ",
+    "temp": "Temp",
+    "stall_alert": "ERROR! (STALL)",
+    "batch_wait": "CONECTE VENTIL.",
+    "batch_pass": "OK",
+    "batch_fail": "FALLO",
+    "btn_nav": "A:Sel B:Menu",
+    "btn_back": "B: Atras",
+    "saved": "Guardado!",
+    "unit_ms": "ms",
+    "unit_pct": "%",
+    "back": "Atras",
+    "lang_name": "Espanol",
+    "about_text": [
+        "Pandafix",
+        "Fan Tester",
+        "----------------",
+        "Creado por:",
+        "pandafix.hu",
+        "Dev: EkE",
+        "",
+        "Funciones:",
+        "- Control PWM",
+        "- Lectura RPM",
+        "- Pantalla OLED",
+        "",
+        "Gracias!"
+    ]
+}
+
+# Utolsó módosítás: 2026. október 19. 20:15:00
\ No newline at end of file
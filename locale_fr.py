@@ -0,0 +1,54 @@
+# Fájl helye: /locale_fr.py
+# Funkció: A francia nyelvű szövegek. Forrás fájl: a firmware a tools/build_locales.py által generált lstr_xx.py-t használja.
+
+STRINGS = {
+    "app_name": "Pandafix",
+    "app_sub": "Testeur Vent.",
+    "init_hw": "Init Mat...",
+    "error_init": "Erreur Init!",
+    "menu_title": "MODE",
+    "mode_auto": "TEST AUTO",
+    "mode_manual": "MANUEL",
+    "mode_target": "CIBLE RPM",
+    "mode_endurance": "ENDURANCE",
+    "mode_step": "REP. INDICIELLE",
+    "mode_batch": "TEST SERIE",
+    "mode_settings": "PARAMETRES",
+    "mode_about": "A PROPOS",
+    "mode_language": "LANGUE",
+    "set_lang": "CHOIX DE LA LANGUE",
+    "set_step": "TAILLE DE L'ETAPE PWM",
+    "set_debounce": "SENSIBILITE BOUTON",
+    "pwm": "PWM",
+    "rpm": "RPM",
+    "target": "CIBL",
+    "temp": "Temp",
+    "stall_alert": "ERREUR (STALL)",
+    "batch_wait": "BRANCHER VENTIL.",
+    "batch_pass": "OK",
+    "batch_fail": "ECHEC",
+    "btn_nav": "A:Sel B:Menu",
+    "btn_back": "B: Retour",
+    "saved": "Enregistre!",
+    "unit_ms": "ms",
+    "unit_pct": "%",
+    "back": "Retour",
+    "lang_name": "Francais",
+    "about_text": [
+        "Pandafix",
+        "Fan Tester",
+        "----------------",
+        "Cree par:",
+        "pandafix.hu",
+        "Dev: EkE",
+        "",
+        "Fonctions:",
+        "- Controle PWM",
+        "- Lecture RPM",
+        "- Ecran OLED",
+        "",
+        "Merci!"
+    ]
+}
+
+# Utolsó módosítás: 2026. október 19. 20:15:00
\ No newline at end of file
@@ -0,0 +1,62 @@
+# Fájl helye: /locale_hu.py
+# Funkció: A magyar nyelvű szövegek. Forrás fájl: a firmware a tools/build_locales.py által generált lstr_xx.py-t használja.
+
+STRINGS = {
+    "app_name": "Pandafix",
+    "app_sub": "Fan Tester",
+    "init_hw": "Hardver init...",
+    "error_init": "Init hiba!",
+    "menu_title": "MOD VALASZTAS",
+    "mode_auto": "AUTO TESZT",
+    "mode_manual": "KEZI TESZT",
+    "mode_target": "CEL RPM TARTAS",
+    "mode_endurance": "TARTOS TESZT",
+    "mode_step": "UGRASVALASZ",
+    "mode_batch": "SOROZAT TESZT",
+    "mode_settings": "BEALLITASOK",
+    "mode_about": "NEVJEGY",
+    "mode_language": "NYELV",
+    "set_lang": "NYELV KIVALASZTASA",
+    "set_step": "PWM LEPTEK MERETE",
+    "set_debounce": "GOMB ERZEKENYSEG",
+    "pwm": "PWM",
+    "rpm": "RPM",
+    "target": "CEL",
+    "temp": "Hom.",
+    "stall_alert": "HIBA! (STALL)",
+    "batch_wait": "VENTI BEDUGASA",
+    "batch_pass": "MEGFELELT",
+    "batch_fail": "HIBAS",
+    "btn_nav": "A:Valaszt B:Menu",
+    "btn_back": "B: Vissza",
+    "saved": "Beallitas Mentve!",
+    "unit_ms": "ms",
+    "unit_pct": "%",
+    "back": "Vissza a Menube",
+    "lang_name": "Magyar",
+    "about_text": [
+        "Pandafix",
+        "Fan Tester",
+        "----------------",
+        "Keszitette:",
+        "pandafix.hu",
+        "Fejleszto: EkE",
+        "",
+        "Funkciok:",
+        "- Univerzalis",
+        "  PWM vezerles",
+        "- Pontos RPM",
+        "  meres",
+        "- OLED Kijelzo",
+        "  animacioval",
+        "- Auto es Kezi",
+        "  teszt modok",
+        "- Cel fordulatszam",
+        "  tartas (PID)",
+        "",
+        "Koszonom, hogy",
+        "hasznalod!"
+    ]
+}
+
+# Utolsó módosítás: 2026. október 19. 20:15:00
\ No newline at end of file
@@ -0,0 +1,54 @@
+# Fájl helye: /locale_it.py
+# Funkció: Az olasz nyelvű szövegek. Forrás fájl: a firmware a tools/build_locales.py által generált lstr_xx.py-t használja.
+
+STRINGS = {
+    "app_name": "Pandafix",
+    "app_sub": "Fan Tester",
+    "init_hw": "Init HW...",
+    "error_init": "Errore Init!",
+    "menu_title": "MODALITA",
+    "mode_auto": "TEST AUTO",
+    "mode_manual": "MANUALE",
+    "mode_target": "TARGET RPM",
+    "mode_endurance": "DURATA",
+    "mode_step": "RISP. GRADINO",
+    "mode_batch": "TEST SERIE",
+    "mode_settings": "IMPOSTAZIONI",
+    "mode_about": "INFO",
+    "mode_language": "LINGUA",
+    "set_lang": "SELEZIONE LINGUA",
+    "set_step": "DIMENSIONE PASSO PWM",
+    "set_debounce": "SENSIBILITA TASTO",
+    "pwm": "PWM",
+    "rpm": "RPM",
+    "target": "OBIET",
+    "temp": "Temp",
+    "stall_alert": "ERRORE (STALL)",
+    "batch_wait": "INSERIRE VENTOLA",
+    "batch_pass": "OK",
+    "batch_fail": "GUASTO",
+    "btn_nav": "A:Sel B:Menu",
+    "btn_back": "B: Indietro",
+    "saved": "Salvato!",
+    "unit_ms": "ms",
+    "unit_pct": "%",
+    "back": "Indietro",
+    "lang_name": "Italiano",
+    "about_text": [
+        "Pandafix",
+        "Fan Tester",
+        "----------------",
+        "Creato da:",
+        "pandafix.hu",
+        "Dev: EkE",
+        "",
+        "Funzioni:",
+        "- Controllo PWM",
+        "- Lettura RPM",
+        "- Schermo OLED",
+        "",
+        "Grazie!"
+    ]
+}
+
+# Utolsó módosítás: 2026. október 19. 20:15:00
\ No newline at end of file
@@ -1,279 +1,39 @@
 # Fájl helye: /locales.py
-# Funkció: A rendszer összes támogatott nyelvi fordításának tárolása. Bővített szövegekkel.
+# Funkció: Nyelvi index és lusta betöltés. Mindig csak az aktív nyelv string poolja van használatban,
+# a nyelvválasztóhoz elég ez a kis, állandóan betöltött névtábla.
+# A szövegek forrása a locale_xx.py; a futás közben használt lstr_xx.py / strid.py fájlokat
+# a tools/build_locales.py generálja belőlük (build időben ellenőrizve a hiányzó kulcsokat).
 
-LOCALES = {
-    "en": {
-        "app_name": "Pandafix",
-        "app_sub": "Fan Tester",
-        "init_hw": "HW Init...",
-        "error_init": "Init Error!",
-        "menu_title": "SELECT MODE",
-        "mode_auto": "AUTO TEST",
-        "mode_manual": "MANUAL TEST",
-        "mode_target": "TARGET RPM",
-        "mode_settings": "SETTINGS",
-        "mode_about": "ABOUT",
-        "set_lang": "LANGUAGE SELECT",
-        "set_step": "PWM STEP SIZE",
-        "set_debounce": "BUTTON SENSITIVITY",
-        "pwm": "PWM",
-        "rpm": "RPM",
-        "target": "TGT",
-        "temp": "Temp",
-        "stall_alert": "ERROR! (STALL)",
-        "btn_nav": "A:Select B:Menu",
-        "btn_back": "B: Back",
-        "saved": "Saved!",
-        "unit_ms": "ms",
-        "back": "Back to Menu",
-        "lang_name": "English",
-        "about_text": [
-            "Pandafix",
-            "Fan Tester",
-            "----------------",
-            "Created by:",
-            "pandafix.hu",
-            "Dev: EkE",
-            "",
-            "Features:",
-            "- Universal PWM",
-            "  Fan Control",
-            "- Precise RPM",
-            "  Measurement",
-            "- OLED Display",
-            "  with Animation",
-            "- Auto & Manual",
-            "  Test Modes",
-            "- Target RPM",
-            "  PID Control",
-            "",
-            "Thank you",
-            "for using!"
-        ]
-    },
-    "hu": {
-        "app_name": "Pandafix",
-        "app_sub": "Fan Tester",
-        "init_hw": "Hardver init...",
-        "error_init": "Init hiba!",
-        "menu_title": "MOD VALASZTAS",
-        "mode_auto": "AUTO TESZT",
-        "mode_manual": "KEZI TESZT",
-        "mode_target": "CEL RPM TARTAS",
-        "mode_settings": "BEALLITASOK",
-        "mode_about": "NEVJEGY",
-        "set_lang": "NYELV KIVALASZTASA",
-        "set_step": "PWM LEPTEK MERETE",
-        "set_debounce": "GOMB ERZEKENYSEG",
-        "pwm": "PWM",
-        "rpm": "RPM",
-        "target": "CEL",
-        "temp": "Hom.",
-        "stall_alert": "HIBA! (STALL)",
-        "btn_nav": "A:Valaszt B:Menu",
-        "btn_back": "B: Vissza",
-        "saved": "Beallitas Mentve!",
-        "unit_ms": "ms",
-        "back": "Vissza a Menube",
-        "lang_name": "Magyar",
-        "about_text": [
-            "Pandafix",
-            "Fan Tester",
-            "----------------",
-            "Keszitette:",
-            "pandafix.hu",
-            "Fejleszto: EkE",
-            "",
-            "Funkciok:",
-            "- Univerzalis",
-            "  PWM vezerles",
-            "- Pontos RPM",
-            "  meres",
-            "- OLED Kijelzo",
-            "  animacioval",
-            "- Auto es Kezi",
-            "  teszt modok",
-            "- Cel fordulatszam",
-            "  tartas (PID)",
-            "",
-            "Koszonom, hogy",
-            "hasznalod!"
-        ]
-    },
-    "de": {
-        "app_name": "Pandafix",
-        "app_sub": "Luefter Test",
-        "init_hw": "HW Init...",
-        "error_init": "Init Fehler!",
-        "menu_title": "MODUS WAEHLEN",
-        "mode_auto": "AUTO TEST",
-        "mode_manual": "MANUELL TEST",
-        "mode_target": "ZIEL RPM",
-        "mode_settings": "EINSTELLUNGEN",
-        "mode_about": "UEBER UNS",
-        "set_lang": "SPRACHE AUSWAEHLEN",
-        "set_step": "PWM SCHRITTGROESSE",
-        "set_debounce": "TASTEN EMPFINDLICHKEIT",
-        "pwm": "PWM",
-        "rpm": "RPM",
-        "target": "ZIEL",
-        "temp": "Temp",
-        "stall_alert": "FEHLER! (STALL)",
-        "btn_nav": "A:Wahl B:Menu",
-        "btn_back": "B: Zurueck",
-        "saved": "Gespeichert!",
-        "unit_ms": "ms",
-        "back": "Zurueck",
-        "lang_name": "Deutsch",
-        "about_text": [
-            "Pandafix",
-            "Fan Tester",
-            "----------------",
-            "Erstellt von:",
-            "pandafix.hu",
-            "Dev: EkE",
-            "",
-            "Funktionen:",
-            "- PWM Luefter-",
-            "  steuerung",
-            "- RPM Messung",
-            "- OLED Anzeige",
-            "- Auto & Manuell",
-            "  Modus",
-            "",
-            "Danke fuer",
-            "die Nutzung!"
-        ]
-    },
-    "es": {
-        "app_name": "Pandafix",
-        "app_sub": "Fan Tester",
-        "init_hw": "Inic. HW...",
-        "error_init": "Error Init!",
-        "menu_title": "SELECC. MODO",
-        "mode_auto": "TEST AUTO",
-        "mode_manual": "TEST MANUAL",
-        "mode_target": "RPM OBJETIVO",
-        "mode_settings": "AJUSTES",
-        "mode_about": "ACERCA DE",
-        "set_lang": "SELECCIONAR IDIOMA",
-        "set_step": "TAMANO DE PASO PWM",
-        "set_debounce": "SENSIBILIDAD BOTON",
-        "pwm": "PWM",
-        "rpm": "RPM",
-        "target": "OBJ",
-        "temp": "Temp",
-        "stall_alert": "ERROR! (STALL)",
-        "btn_nav": "A:Sel B:Menu",
-        "btn_back": "B: Atras",
-        "saved": "Guardado!",
-        "unit_ms": "ms",
-        "back": "Atras",
-        "lang_name": "Espanol",
-        "about_text": [
-            "Pandafix",
-            "Fan Tester",
-            "----------------",
-            "Creado por:",
-            "pandafix.hu",
-            "Dev: EkE",
-            "",
-            "Funciones:",
-            "- Control PWM",
-            "- Lectura RPM",
-            "- Pantalla OLED",
-            "",
-            "Gracias!"
-        ]
-    },
-    "fr": {
-        "app_name": "Pandafix",
-        "app_sub": "Testeur Vent.",
-        "init_hw": "Init Mat...",
-        "error_init": "Erreur Init!",
-        "menu_title": "MODE",
-        "mode_auto": "TEST AUTO",
-        "mode_manual": "MANUEL",
-        "mode_target": "CIBLE RPM",
-        "mode_settings": "PARAMETRES",
-        "mode_about": "A PROPOS",
-        "set_lang": "CHOIX DE LA LANGUE",
-        "set_step": "TAILLE DE L'ETAPE PWM",
-        "set_debounce": "SENSIBILITE BOUTON",
-        "pwm": "PWM",
-        "rpm": "RPM",
-        "target": "CIBL",
-        "temp": "Temp",
-        "stall_alert": "ERREUR (STALL)",
-        "btn_nav": "A:Sel B:Menu",
-        "btn_back": "B: Retour",
-        "saved": "Enregistre!",
-        "unit_ms": "ms",
-        "back": "Retour",
-        "lang_name": "Francais",
-        "about_text": [
-            "Pandafix",
-            "Fan Tester",
-            "----------------",
-            "Cree par:",
-            "pandafix.hu",
-            "Dev: EkE",
-            "",
-            "Fonctions:",
-            "- Controle PWM",
-            "- Lecture RPM",
-            "- Ecran OLED",
-            "",
-            "Merci!"
-        ]
-    },
-    "it": {
-        "app_name": "Pandafix",
-        "app_sub": "Fan Tester",
-        "init_hw": "Init HW...",
-        "error_init": "Errore Init!",
-        "menu_title": "MODALITA",
-        "mode_auto": "TEST AUTO",
-        "mode_manual": "MANUALE",
-        "mode_target": "TARGET RPM",
-        "mode_settings": "IMPOSTAZIONI",
-        "mode_about": "INFO",
-        "set_lang": "SELEZIONE LINGUA",
-        "set_step": "DIMENSIONE PASSO PWM",
-        "set_debounce": "SENSIBILITA TASTO",
-        "pwm": "PWM",
-        "rpm": "RPM",
-        "target": "OBIET",
-        "temp": "Temp",
-        "stall_alert": "ERRORE (STALL)",
-        "btn_nav": "A:Sel B:Menu",
-        "btn_back": "B: Indietro",
-        "saved": "Salvato!",
-        "unit_ms": "ms",
-        "back": "Indietro",
-        "lang_name": "Italiano",
-        "about_text": [
-            "Pandafix",
-            "Fan Tester",
-            "----------------",
-            "Creato da:",
-            "pandafix.hu",
-            "Dev: EkE",
-            "",
-            "Funzioni:",
-            "- Controllo PWM",
-            "- Lettura RPM",
-            "- Schermo OLED",
-            "",
-            "Grazie!"
-        ]
-    }
+import sys
+
+DEFAULT_LANG = "en"
+
+# Nyelvkód -> megjelenített név (a választó képernyő ebből dolgozik, nem tölt be nyelvet)
+LANG_NAMES = {
+    "en": "English",
+    "hu": "Magyar",
+    "de": "Deutsch",
+    "es": "Espanol",
+    "fr": "Francais",
+    "it": "Italiano",
 }
 
+def get_lang_name(lang_code):
+    """Nyelv megjelenített neve betöltés nélkül."""
+    return LANG_NAMES.get(lang_code, lang_code)
+
 def get_locale(lang_code):
-    """Visszaadja a kért nyelv szótárát, vagy az alapértelmezettet ha nem létezik."""
-    if lang_code in LOCALES:
-        return LOCALES[lang_code]
-    return LOCALES["en"] # Fallback
+    """
+    Betölti a kért nyelv string poolját (lstr_xx), vagy az alapértelmezettet.
+    Egy strid azonosítókkal indexelhető tuple-t ad vissza. A modult utána kivesszük
+    a sys.modules-ből, így csak addig él, amíg a hívó tartja.
+    """
+    if lang_code not in LANG_NAMES:
+        lang_code = DEFAULT_LANG # Fallback
+    mod_name = "lstr_" + lang_code
+    mod = __import__(mod_name)
+    strings = mod.STRINGS
+    del sys.modules[mod_name]
+    return strings
 
-# Utolsó módosítás: 2026. február 06. 09:45:00
\ No newline at end of file
+# Utolsó módosítás: 2026. október 19. 12:30:00
\ No newline at end of file
@@ -0,0 +1,170 @@
+# Fájl helye: /logger.py
+# Funkció: Strukturált, alacsony terhelésű naplózás. A bejegyzések (idő, szint, formátum, legfeljebb
+# 3 argumentum) előre foglalt RAM gyűrűbe kerülnek; a szöveg formázása és a kiírás (soros port,
+# opcionálisan flash fájl) csak a háttér feladatban, adagokban történik, így a hívó nem blokkol
+# az USB CDC-n. Az azonos üzenet gyors ismétlődését összevonjuk (rate limit).
+#
+# Használat: logger.warn("Display Error in loop: {}", e) - a formátum konstans szöveg, az argumentumok
+# meglévő objektumok, így a hívás nem foglal; a szint alatti hívás az első összehasonlításnál visszatér.
+# LOG_LEVEL = OFF esetén a gyűrű le sem foglalódik.
+
+from array import array
+import os
+import time
+import uasyncio as asyncio
+import config
+
+DEBUG = 0
+INFO = 1
+WARN = 2
+ERROR = 3
+OFF = 4
+LEVEL_NAMES = "DIWE"
+
+level = config.LOG_LEVEL
+
+_slots = config.LOG_RING_SLOTS if level < OFF else 0
+_ms = array('I', (0 for _ in range(_slots)))
+_lvl = bytearray(_slots)
+_fmt = [None] * _slots
+_a = [None] * _slots
+_b = [None] * _slots
+_c = [None] * _slots
+_head = 0       # A következő írandó rekord
+_count = 0      # Olvasatlan rekordok
+dropped = 0     # Tele gyűrű miatt felülírt (elveszett) rekordok
+
+# Ismétlés összevonás: az utolsó üzenet formátuma, szintje, ideje, és hányszor nyeltük le azóta
+_last_fmt = None
+_last_lvl = 0
+_last_ms = 0
+_repeats = 0
+
+
+def _put(lvl, fmt, a, b, c):
+    global _head, _count, dropped
+    i = _head
+    _ms[i] = time.ticks_ms()
+    _lvl[i] = lvl
+    _fmt[i] = fmt
+    _a[i] = a
+    _b[i] = b
+    _c[i] = c
+    _head = (i + 1) % _slots
+    if _count < _slots:
+        _count += 1
+    else:
+        dropped += 1
+
+
+def _flush_repeats():
+    global _repeats
+    if _repeats:
+        _put(_last_lvl, "... elozo uzenet meg {}x", _repeats, None, None)
+        _repeats = 0
+
+
+def _log(lvl, fmt, a, b, c):
+    global _last_fmt, _last_lvl, _last_ms, _repeats
+    now = time.ticks_ms()
+    if fmt is _last_fmt and time.ticks_diff(now, _last_ms) < config.LOG_REPEAT_MS:
+        _repeats += 1
+        return
+    _flush_repeats()
+    _last_fmt = fmt
+    _last_lvl = lvl
+    _last_ms = now
+    _put(lvl, fmt, a, b, c)
+
+
+def debug(fmt, a=None, b=None, c=None):
+    if level <= DEBUG:
+        _log(DEBUG, fmt, a, b, c)
+
+
+def info(fmt, a=None, b=None, c=None):
+    if level <= INFO:
+        _log(INFO, fmt, a, b, c)
+
+
+def warn(fmt, a=None, b=None, c=None):
+    if level <= WARN:
+        _log(WARN, fmt, a, b, c)
+
+
+def error(fmt, a=None, b=None, c=None):
+    if level <= ERROR:
+        _log(ERROR, fmt, a, b, c)
+
+
+def enabled(lvl):
+    """Drága argumentum előállítása előtt: kerülne-e egyáltalán bejegyzés ezen a szinten."""
+    return level <= lvl
+
+
+def set_level(lvl):
+    """Futás közbeni szintváltás (a gyűrű mérete az induláskor dől el)."""
+    global level
+    level = lvl if _slots else OFF
+
+
+def _pop():
+    """A legrégebbi bejegyzés szövegként ("ms L üzenet") és szintje; a hivatkozásokat elengedi."""
+    global _count
+    i = (_head - _count) % _slots
+    fmt = _fmt[i]
+    try:
+        msg = fmt.format(_a[i], _b[i], _c[i])
+    except Exception:
+        msg = fmt
+    _fmt[i] = _a[i] = _b[i] = _c[i] = None
+    _count -= 1
+    return _lvl[i], "%d %s %s" % (_ms[i], LEVEL_NAMES[_lvl[i]], msg)
+
+
+def _write_file(lines):
+    try:
+        try:
+            # Méret korlát: a teli fájl egy generációnyi előzménnyé válik
+            if os.stat(config.LOG_FILE)[6] > config.LOG_FILE_MAX_BYTES:
+                os.rename(config.LOG_FILE, config.LOG_FILE + ".old")
+        except OSError:
+            pass
+        with open(config.LOG_FILE, "a") as f:
+            for line in lines:
+                f.write(line)
+                f.write("\n")
+    except OSError:
+        pass  # A napló írási hibája nem állíthatja meg a tesztert
+
+
+def drain(limit=0):
+    """Legfeljebb limit (0: mind) bejegyzés kiírása; a flash fájlba LOG_FILE_LEVEL felettiek kerülnek."""
+    global dropped
+    if _repeats and time.ticks_diff(time.ticks_ms(), _last_ms) >= config.LOG_REPEAT_MS:
+        _flush_repeats()
+    if dropped:
+        print("%d W naplo gyuru megtelt, %d bejegyzes elveszett" % (time.ticks_ms(), dropped))
+        dropped = 0
+    to_file = []
+    n = 0
+    while _count and (not limit or n < limit):
+        lvl, line = _pop()
+        if config.LOG_SERIAL:
+            print(line)
+        if config.LOG_FILE and lvl >= config.LOG_FILE_LEVEL:
+            to_file.append(line)
+        n += 1
+    if to_file:
+        _write_file(to_file)
+    return n
+
+
+async def run():
+    """Háttér kiürítés: kis adagokban, hogy a soros port ne tartsa fel a többi feladatot."""
+    while True:
+        if _count or dropped or _repeats:
+            drain(config.LOG_DRAIN_BATCH)
+        await asyncio.sleep_ms(config.LOG_DRAIN_MS)
+
+# Utolsó módosítás: 2026. október 19. 18:45:00
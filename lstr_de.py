@@ -0,0 +1,60 @@
+# Fájl helye: /lstr_de.py
+# Funkció: Deutsch string pool, strid szerint indexelve.
+# GENERÁLT FÁJL - ne szerkeszd kézzel! Forrás: locale_de.py, generátor: tools/build_locales.py
+
+# Konstans tuple: frozen modulként a flash-ben marad, futás közben sem szótár, sem másolat nem készül.
+STRINGS = (
+    "Pandafix",  # 0: app_name
+    "Luefter Test",  # 1: app_sub
+    "HW Init...",  # 2: init_hw
+    "Init Fehler!",  # 3: error_init
+    "MODUS WAEHLEN",  # 4: menu_title
+    "AUTO TEST",  # 5: mode_auto
+    "MANUELL TEST",  # 6: mode_manual
+    "ZIEL RPM",  # 7: mode_target
+    "DAUERTEST",  # 8: mode_endurance
+    "SPRUNGANTWORT",  # 9: mode_step
+    "SERIENTEST",  # 10: mode_batch
+    "EINSTELLUNGEN",  # 11: mode_settings
+    "UEBER UNS",  # 12: mode_about
+    "SPRACHE",  # 13: mode_language
+    "SPRACHE AUSWAEHLEN",  # 14: set_lang
+    "PWM SCHRITTGROESSE",  # 15: set_step
+    "TASTEN EMPFINDLICHKEIT",  # 16: set_debounce
+    "PWM",  # 17: pwm
+    "RPM",  # 18: rpm
+    "ZIEL",  # 19: target
+    "Temp",  # 20: temp
+    "FEHLER! (STALL)",  # 21: stall_alert
+    "LUEFTER EINST.",  # 22: batch_wait
+    "OK",  # 23: batch_pass
+    "FEHLER",  # 24: batch_fail
+    "A:Wahl B:Menu",  # 25: btn_nav
+    "B: Zurueck",  # 26: btn_back
+    "Gespeichert!",  # 27: saved
+    "ms",  # 28: unit_ms
+    "%",  # 29: unit_pct
+    "Zurueck",  # 30: back
+    "Deutsch",  # 31: lang_name
+    (
+        "Pandafix",
+        "Fan Tester",
+        "----------------",
+        "Erstellt von:",
+        "pandafix.hu",
+        "Dev: EkE",
+        "",
+        "Funktionen:",
+        "- PWM Luefter-",
+        "  steuerung",
+        "- RPM Messung",
+        "- OLED Anzeige",
+        "- Auto & Manuell",
+        "  Modus",
+        "",
+        "Danke fuer",
+        "die Nutzung!",
+    ),  # 32: about_text
+)
+
+# Utolsó módosítás: 2026. október 19. 20:15:00
\ No newline at end of file
@@ -0,0 +1,64 @@
+# Fájl helye: /lstr_en.py
+# Funkció: English string pool, strid szerint indexelve.
+# GENERÁLT FÁJL - ne szerkeszd kézzel! Forrás: locale_en.py, generátor: tools/build_locales.py
+
+# Konstans tuple: frozen modulként a flash-ben marad, futás közben sem szótár, sem másolat nem készül.
+STRINGS = (
+    "Pandafix",  # 0: app_name
+    "Fan Tester",  # 1: app_sub
+    "HW Init...",  # 2: init_hw
+    "Init Error!",  # 3: error_init
+    "SELECT MODE",  # 4: menu_title
+    "AUTO TEST",  # 5: mode_auto
+    "MANUAL TEST",  # 6: mode_manual
+    "TARGET RPM",  # 7: mode_target
+    "ENDURANCE",  # 8: mode_endurance
+    "STEP RESPONSE",  # 9: mode_step
+    "BATCH TEST",  # 10: mode_batch
+    "SETTINGS",  # 11: mode_settings
+    "ABOUT",  # 12: mode_about
+    "LANGUAGE",  # 13: mode_language
+    "LANGUAGE SELECT",  # 14: set_lang
+    "PWM STEP SIZE",  # 15: set_step
+    "BUTTON SENSITIVITY",  # 16: set_debounce
+    "PWM",  # 17: pwm
+    "RPM",  # 18: rpm
+    "TGT",  # 19: target
+    "Temp",  # 20: temp
+    "ERROR! (STALL)",  # 21: stall_alert
+    "INSERT FAN",  # 22: batch_wait
+    "PASS",  # 23: batch_pass
+    "FAIL",  # 24: batch_fail
+    "A:Select B:Menu",  # 25: btn_nav
+    "B: Back",  # 26: btn_back
+    "Saved!",  # 27: saved
+    "ms",  # 28: unit_ms
+    "%",  # 29: unit_pct
+    "Back to Menu",  # 30: back
+    "English",  # 31: lang_name
+    (
+        "Pandafix",
+        "Fan Tester",
+        "----------------",
+        "Created by:",
+        "pandafix.hu",
+        "Dev: EkE",
+        "",
+        "Features:",
+        "- Universal PWM",
+        "  Fan Control",
+        "- Precise RPM",
+        "  Measurement",
+        "- OLED Display",
+        "  with Animation",
+        "- Auto & Manual",
+        "  Test Modes",
+        "- Target RPM",
+        "  PID Control",
+        "",
+        "Thank you",
+        "for using!",
+    ),  # 32: about_text
+)
+
+# Utolsó módosítás: 2026. október 19. 20:15:00
\ No newline at end of file
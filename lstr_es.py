@@ -0,0 +1,56 @@
+# Fájl helye: /lstr_es.py
+# Funkció: Espanol string pool, strid szerint indexelve.
+# GENERÁLT FÁJL - ne szerkeszd kézzel! Forrás: locale_es.py, generátor: tools/build_locales.py
+
+# Konstans tuple: frozen modulként a flash-ben marad, futás közben sem szótár, sem másolat nem készül.
+STRINGS = (
+    "Pandafix",  # 0: app_name
+    "Fan Tester",  # 1: app_sub
+    "Inic. HW...",  # 2: init_hw
+    "Error Init!",  # 3: error_init
+    "SELECC. MODO",  # 4: menu_title
+    "TEST AUTO",  # 5: mode_auto
+    "TEST MANUAL",  # 6: mode_manual
+    "RPM OBJETIVO",  # 7: mode_target
+    "RESISTENCIA",  # 8: mode_endurance
+    "RESP. ESCALON",  # 9: mode_step
+    "PRUEBA SERIE",  # 10: mode_batch
+    "AJUSTES",  # 11: mode_settings
+    "ACERCA DE",  # 12: mode_about
+    "IDIOMA",  # 13: mode_language
+    "SELECCIONAR IDIOMA",  # 14: set_lang
+    "TAMANO DE PASO PWM",  # 15: set_step
+    "SENSIBILIDAD BOTON",  # 16: set_debounce
+    "PWM",  # 17: pwm
+    "RPM",  # 18: rpm
+    "OBJ",  # 19: target
+    "Temp",  # 20: temp
+    "ERROR! (STALL)",  # 21: stall_alert
+    "CONECTE VENTIL.",  # 22: batch_wait
+    "OK",  # 23: batch_pass
+    "FALLO",  # 24: batch_fail
+    "A:Sel B:Menu",  # 25: btn_nav
+    "B: Atras",  # 26: btn_back
+    "Guardado!",  # 27: saved
+    "ms",  # 28: unit_ms
+    "%",  # 29: unit_pct
+    "Atras",  # 30: back
+    "Espanol",  # 31: lang_name
+    (
+        "Pandafix",
+        "Fan Tester",
+        "----------------",
+        "Creado por:",
+        "pandafix.hu",
+        "Dev: EkE",
+        "",
+        "Funciones:",
+        "- Control PWM",
+        "- Lectura RPM",
+        "- Pantalla OLED",
+        "",
+        "Gracias!",
+    ),  # 32: about_text
+)
+
+# Utolsó módosítás: 2026. október 19. 20:15:00
\ No newline at end of file
@@ -0,0 +1,56 @@
+# Fájl helye: /lstr_fr.py
+# Funkció: Francais string pool, strid szerint indexelve.
+# GENERÁLT FÁJL - ne szerkeszd kézzel! Forrás: locale_fr.py, generátor: tools/build_locales.py
+
+# Konstans tuple: frozen modulként a flash-ben marad, futás közben sem szótár, sem másolat nem készül.
+STRINGS = (
+    "Pandafix",  # 0: app_name
+    "Testeur Vent.",  # 1: app_sub
+    "Init Mat...",  # 2: init_hw
+    "Erreur Init!",  # 3: error_init
+    "MODE",  # 4: menu_title
+    "TEST AUTO",  # 5: mode_auto
+    "MANUEL",  # 6: mode_manual
+    "CIBLE RPM",  # 7: mode_target
+    "ENDURANCE",  # 8: mode_endurance
+    "REP. INDICIELLE",  # 9: mode_step
+    "TEST SERIE",  # 10: mode_batch
+    "PARAMETRES",  # 11: mode_settings
+    "A PROPOS",  # 12: mode_about
+    "LANGUE",  # 13: mode_language
+    "CHOIX DE LA LANGUE",  # 14: set_lang
+    "TAILLE DE L'ETAPE PWM",  # 15: set_step
+    "SENSIBILITE BOUTON",  # 16: set_debounce
+    "PWM",  # 17: pwm
+    "RPM",  # 18: rpm
+    "CIBL",  # 19: target
+    "Temp",  # 20: temp
+    "ERREUR (STALL)",  # 21: stall_alert
+    "BRANCHER VENTIL.",  # 22: batch_wait
+    "OK",  # 23: batch_pass
+    "ECHEC",  # 24: batch_fail
+    "A:Sel B:Menu",  # 25: btn_nav
+    "B: Retour",  # 26: btn_back
+    "Enregistre!",  # 27: saved
+    "ms",  # 28: unit_ms
+    "%",  # 29: unit_pct
+    "Retour",  # 30: back
+    "Francais",  # 31: lang_name
+    (
+        "Pandafix",
+        "Fan Tester",
+        "----------------",
+        "Cree par:",
+        "pandafix.hu",
+        "Dev: EkE",
+        "",
+        "Fonctions:",
+        "- Controle PWM",
+        "- Lecture RPM",
+        "- Ecran OLED",
+        "",
+        "Merci!",
+    ),  # 32: about_text
+)
+
+# Utolsó módosítás: 2026. október 19. 20:15:00
\ No newline at end of file
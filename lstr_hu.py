@@ -0,0 +1,64 @@
+# Fájl helye: /lstr_hu.py
+# Funkció: Magyar string pool, strid szerint indexelve.
+# GENERÁLT FÁJL - ne szerkeszd kézzel! Forrás: locale_hu.py, generátor: tools/build_locales.py
+
+# Konstans tuple: frozen modulként a flash-ben marad, futás közben sem szótár, sem másolat nem készül.
+STRINGS = (
+    "Pandafix",  # 0: app_name
+    "Fan Tester",  # 1: app_sub
+    "Hardver init...",  # 2: init_hw
+    "Init hiba!",  # 3: error_init
+    "MOD VALASZTAS",  # 4: menu_title
+    "AUTO TESZT",  # 5: mode_auto
+    "KEZI TESZT",  # 6: mode_manual
+    "CEL RPM TARTAS",  # 7: mode_target
+    "TARTOS TESZT",  # 8: mode_endurance
+    "UGRASVALASZ",  # 9: mode_step
+    "SOROZAT TESZT",  # 10: mode_batch
+    "BEALLITASOK",  # 11: mode_settings
+    "NEVJEGY",  # 12: mode_about
+    "NYELV",  # 13: mode_language
+    "NYELV KIVALASZTASA",  # 14: set_lang
+    "PWM LEPTEK MERETE",  # 15: set_step
+    "GOMB ERZEKENYSEG",  # 16: set_debounce
+    "PWM",  # 17: pwm
+    "RPM",  # 18: rpm
+    "CEL",  # 19: target
+    "Hom.",  # 20: temp
+    "HIBA! (STALL)",  # 21: stall_alert
+    "VENTI BEDUGASA",  # 22: batch_wait
+    "MEGFELELT",  # 23: batch_pass
+    "HIBAS",  # 24: batch_fail
+    "A:Valaszt B:Menu",  # 25: btn_nav
+    "B: Vissza",  # 26: btn_back
+    "Beallitas Mentve!",  # 27: saved
+    "ms",  # 28: unit_ms
+    "%",  # 29: unit_pct
+    "Vissza a Menube",  # 30: back
+    "Magyar",  # 31: lang_name
+    (
+        "Pandafix",
+        "Fan Tester",
+        "----------------",
+        "Keszitette:",
+        "pandafix.hu",
+        "Fejleszto: EkE",
+        "",
+        "Funkciok:",
+        "- Univerzalis",
+        "  PWM vezerles",
+        "- Pontos RPM",
+        "  meres",
+        "- OLED Kijelzo",
+        "  animacioval",
+        "- Auto es Kezi",
+        "  teszt modok",
+        "- Cel fordulatszam",
+        "  tartas (PID)",
+        "",
+        "Koszonom, hogy",
+        "hasznalod!",
+    ),  # 32: about_text
+)
+
+# Utolsó módosítás: 2026. október 19. 20:15:00
\ No newline at end of file
@@ -0,0 +1,56 @@
+# Fájl helye: /lstr_it.py
+# Funkció: Italiano string pool, strid szerint indexelve.
+# GENERÁLT FÁJL - ne szerkeszd kézzel! Forrás: locale_it.py, generátor: tools/build_locales.py
+
+# Konstans tuple: frozen modulként a flash-ben marad, futás közben sem szótár, sem másolat nem készül.
+STRINGS = (
+    "Pandafix",  # 0: app_name
+    "Fan Tester",  # 1: app_sub
+    "Init HW...",  # 2: init_hw
+    "Errore Init!",  # 3: error_init
+    "MODALITA",  # 4: menu_title
+    "TEST AUTO",  # 5: mode_auto
+    "MANUALE",  # 6: mode_manual
+    "TARGET RPM",  # 7: mode_target
+    "DURATA",  # 8: mode_endurance
+    "RISP. GRADINO",  # 9: mode_step
+    "TEST SERIE",  # 10: mode_batch
+    "IMPOSTAZIONI",  # 11: mode_settings
+    "INFO",  # 12: mode_about
+    "LINGUA",  # 13: mode_language
+    "SELEZIONE LINGUA",  # 14: set_lang
+    "DIMENSIONE PASSO PWM",  # 15: set_step
+    "SENSIBILITA TASTO",  # 16: set_debounce
+    "PWM",  # 17: pwm
+    "RPM",  # 18: rpm
+    "OBIET",  # 19: target
+    "Temp",  # 20: temp
+    "ERRORE (STALL)",  # 21: stall_alert
+    "INSERIRE VENTOLA",  # 22: batch_wait
+    "OK",  # 23: batch_pass
+    "GUASTO",  # 24: batch_fail
+    "A:Sel B:Menu",  # 25: btn_nav
+    "B: Indietro",  # 26: btn_back
+    "Salvato!",  # 27: saved
+    "ms",  # 28: unit_ms
+    "%",  # 29: unit_pct
+    "Indietro",  # 30: back
+    "Italiano",  # 31: lang_name
+    (
+        "Pandafix",
+        "Fan Tester",
+        "----------------",
+        "Creato da:",
+        "pandafix.hu",
+        "Dev: EkE",
+        "",
+        "Funzioni:",
+        "- Controllo PWM",
+        "- Lettura RPM",
+        "- Schermo OLED",
+        "",
+        "Grazie!",
+    ),  # 32: about_text
+)
+
+# Utolsó módosítás: 2026. október 19. 20:15:00
\ No newline at end of file
@@ -1,33 +1,65 @@
 # Fájl helye: /main.py
 # Funkció: A rendszer inicializálása és a fő eseményhurok. Hibatűrő kijelző frissítés.
+# Gyors indulás: a splash azonnal megjelenik, a többi hardver init közben fut, és a splash
+# az init végén (nem fix időzítőre) ér véget. A boot fázisok időbélyegei lekérdezhetők.
+
+import time
+_BOOT_T0 = time.ticks_ms()  # Minden boot időbélyeg ehhez képest értendő
 
 import uasyncio as asyncio
+from micropython import const
 import config
-from fan_control import FanController
 from ui_display import DisplayManager
-from inputs import Button
 from settings_manager import SettingsManager
-import gc
-import time
-import locales
+import strid
+import logger
+import rpm_filters
+
+# Feladat időzítés mérés (instrument); const(0) esetén a fordító a mérő ágakat kihagyja
+_INSTR = const(1)
+if _INSTR:
+    import instrument
 
 class App:
     def __init__(self):
         print("Rendszer inditasa...")
+        self.boot_marks = []
+        self._mark_boot("import")
         
-        # Beállítások betöltése
+        # Beállítások betöltése (a nyelvhez kell a splash előtt)
         self.settings = SettingsManager()
+        self._mark_boot("settings")
         
-        # UI és Ventilátor init
+        # Kijelző és splash azonnal; a többi hardver a run() elején, a splash alatt indul
         self.display = DisplayManager(self.settings)
-        self.fan = FanController()
+        if self.display.available:
+            self.display.draw_splash()
+        else:
+            logger.info("Kijelzo nelkul (headless) indulas, vezerles a soros porton (help)")
+        self._mark_boot("splash")
+        
+        self.fan = None
+        self.control = None
+        # A lezárt mérési ablak értékei a UI-nak: egymagos módban maga a FanController,
+        # második magos módban a telemetria pillanatkép (control_core.WindowView)
+        self.meas = None
+        self.sensors = None
+        self.heap = None
+        self.console = None
+        self.mirror = None
+        self.results = None
+        self.recorder = None
+        self.endurance = None  # Tartós teszt (első indításkor jön létre, a statisztika megmarad)
+        self.step_test = None  # Ugrásválasz mérés (első indításkor jön létre)
+        self.batch = None      # Kézmentes sorozat teszt (első indításkor jön létre, a darabszám megmarad)
         
         # Főmenü struktúra
-        self.MAIN_MENU_KEYS = ["mode_auto", "mode_manual", "mode_target", "mode_settings", "mode_about"]
-        self.MAIN_MENU_IDS = ["AUTO", "MANUAL", "TARGET", "SETTINGS", "ABOUT"]
+        self.MAIN_MENU_KEYS = [strid.MODE_AUTO, strid.MODE_MANUAL, strid.MODE_TARGET, strid.MODE_ENDURANCE,
+                               strid.MODE_STEP, strid.MODE_BATCH, strid.MODE_SETTINGS, strid.MODE_ABOUT]
+        self.MAIN_MENU_IDS = ["AUTO", "MANUAL", "TARGET", "ENDURANCE", "STEP", "BATCH", "SETTINGS", "ABOUT"]
         
         # Beállítások menü struktúra
-        self.SETT_MENU_KEYS = ["set_lang", "set_step", "set_debounce", "back"]
+        self.SETT_MENU_KEYS = [strid.SET_LANG, strid.SET_STEP, strid.SET_DEBOUNCE, strid.BACK]
         self.SETT_MENU_IDS = ["LANG", "STEP", "DEBOUNCE", "BACK"]
         
         # Listák
@@ -56,21 +88,218 @@ class App:
         self.last_auto_step_time = 0
         self.target_rpm_list = [500, 800, 1000, 1200, 1500, 2000, 2500, 3000]
         self.target_rpm_idx = 2
+        self.graph_view = False  # Teszt módokban grafikon nézet a számok helyett
         
         # Gomb esemény flag-ek
         self.flag_menu_pressed = False
         self.flag_select_pressed = False
+        # Gesztusok (hosszú / ismétlés / dupla): (gomb, esemény, ismétlésszám)
+        self.gestures = []
 
-        # Gomb objektumok
+        # Gomb objektumok és opcionális forgó jeladó (a hardver init hozza létre)
+        self.btn_menu = None
+        self.btn_select = None
+        self.btn_encoder = None
+        self.encoder = None
+        
+        # Rejtett diagnosztikai képernyő oldala és a feladatok mérőpontjai
+        self.diag_page = 0
+        if _INSTR:
+            self.p_logic = instrument.probe("logic")
+            self.p_display = instrument.probe("disp")
+            self.p_fan = instrument.probe("fan")
+
+    def _mark_boot(self, phase):
+        """Boot fázis időbélyegének rögzítése (ms a main.py importálásától)."""
+        self.boot_marks.append((phase, time.ticks_diff(time.ticks_ms(), _BOOT_T0)))
+
+    def boot_report(self):
+        """A boot fázisok listája: [(fázis, ms), ...]."""
+        return self.boot_marks
+
+    async def _init_hardware(self):
+        """
+        A splash alatt futó init. A modulokat itt, első használatkor importáljuk,
+        és minden lépés után visszaadjuk a vezérlést az ütemezőnek.
+        """
+        # A ventilátor legyen az első: lebegő PWM lábon a 4 tűs ventilátor teljes fordulaton pörögne
+        from fan_control import FanController
+        self.fan = FanController()
+        self.meas = self.fan
+        if config.CONTROL_CORE:
+            # Mérés és szabályzás a második magon, a UI terhelésétől függetlenül
+            from control_core import ControlCore
+            self.control = ControlCore(self.fan)
+            self.control.start()
+            self.meas = self.control.view
+        self._mark_boot("fan")
+        await asyncio.sleep_ms(0)
+        
+        from sensors import SensorSampler
+        self.sensors = SensorSampler()
+        self.display.sensors = self.sensors
+        self._mark_boot("sensors")
+        await asyncio.sleep_ms(0)
+        
+        from inputs import Button, PRESS
+        self.EV_PRESS = PRESS
         initial_debounce = self.settings.get("debounce_ms")
         self.btn_menu = Button(config.PIN_MENU, self._cb_menu_press, initial_debounce)
         self.btn_select = Button(config.PIN_SELECT, self._cb_select_press, initial_debounce)
+        if config.PIN_ENC_A is not None:
+            from encoder import RotaryEncoder
+            self.encoder = RotaryEncoder(config.PIN_ENC_A, config.PIN_ENC_B)
+            if config.PIN_ENC_SW is not None:
+                # A jeladó nyomógombja a SELECT gombbal egyenértékű
+                self.btn_encoder = Button(config.PIN_ENC_SW, self._cb_select_press, initial_debounce)
+        self._mark_boot("buttons")
+        await asyncio.sleep_ms(0)
+        
+        from heap_monitor import HeapMonitor
+        self.heap = HeapMonitor()
+        self._mark_boot("heap")
+        
+        from result_log import ResultLog, StepRecorder
+        self.results = ResultLog()
+        self.recorder = StepRecorder(self.results)
+        self._mark_boot("results")
+        
+        from serial_console import SerialConsole
+        self.console = SerialConsole(self)
+        from fb_mirror import FrameMirror
+        self.mirror = FrameMirror(self.display)
+        self._mark_boot("console")
+        
+        if _INSTR:
+            instrument.isr_source("tach", lambda: self.fan.tach_counter)
+            instrument.isr_source("window", self.fan.window_timer_hits)
+            instrument.isr_source("buttons", lambda: self.btn_menu.irq_count + self.btn_select.irq_count)
+            if self.encoder is not None:
+                instrument.isr_source("encoder", lambda: self.encoder.irq_count)
+            self.console.register("instr", self._cmd_instr, "instr [reset] - feladat idozitesek, IRQ szamlalok")
+
+    def _cmd_instr(self, args):
+        if args and args[0] == "reset":
+            instrument.reset()
+            self.console.reply("OK")
+            return
+        for line in instrument.report_lines():
+            self.console.reply(line)
+
+    def _cb_menu_press(self, event, count):
+        if event == self.EV_PRESS:
+            self.flag_menu_pressed = True
+        else:
+            self.gestures.append(("MENU", event, count))
+
+    def _cb_select_press(self, event, count):
+        if event == self.EV_PRESS:
+            self.flag_select_pressed = True
+        else:
+            self.gestures.append(("SELECT", event, count))
 
-    def _cb_menu_press(self):
-        self.flag_menu_pressed = True
+    def _ramp_step(self, count):
+        """Tartott gombnál a lépésköz az ismétlések számával gyorsul."""
+        if count < 5:
+            return 1
+        if count < 15:
+            return 2
+        return 5
 
-    def _cb_select_press(self):
-        self.flag_select_pressed = True
+    def _handle_gestures(self, current_time):
+        """
+        Gesztusok feldolgozása:
+        - menükben MENU hosszan: visszafelé lépés
+        - kézi módban SELECT / MENU hosszan: PWM folyamatos növelése / csökkentése
+        - cél módban SELECT / MENU hosszan: cél RPM növelése / csökkentése
+        - teszt módokban SELECT dupla: grafikon / szám nézet váltás
+        """
+        from inputs import LONG, REPEAT, DOUBLE
+        while self.gestures:
+            button, event, count = self.gestures.pop(0)
+            held = event == LONG or event == REPEAT
+            direction = 1 if button == "SELECT" else -1
+            
+            if event == DOUBLE and button == "SELECT" and self.state.startswith("RUN_"):
+                self.graph_view = not self.graph_view
+            
+            elif event == LONG and button == "SELECT" and self.state == "RUN_ENDURANCE":
+                # Új tartós teszt: statisztika és ellenőrzőpont törlése
+                self.endurance.reset(current_time)
+            
+            elif event == LONG and button == "SELECT" and self.state == "RUN_STEP":
+                # Ugrásválasz mérés újraindítása (a rekordok a flash naplóban megmaradnak)
+                self.step_test.stop()
+                self.step_test.start(current_time)
+            
+            elif event == LONG and button == "SELECT" and self.state == "RUN_BATCH":
+                self.batch.reset_counts() # Új sorozat (darabszámok nullázása)
+            
+            elif _INSTR and event == LONG and button == "SELECT" and self.state == "ABOUT":
+                self.diag_page = 0
+                self._change_state("DIAG")
+            
+            elif held and self.state == "RUN_MANUAL":
+                step = self._ramp_step(count)
+                self.fan.set_duty_percent(self.fan.current_duty_percent + direction * step)
+            
+            elif held and self.state == "RUN_TARGET":
+                step = self._ramp_step(count) * config.TARGET_RPM_RAMP_STEP
+                rpm = max(0, min(config.TARGET_RPM_MAX, self.fan.target_rpm + direction * step))
+                self.fan.set_target_rpm(rpm)
+            
+            elif held and button == "MENU":
+                self._step_selection(current_time, -1)
+
+    def _handle_encoder(self, current_time):
+        """
+        Forgó jeladó: kézi módban PWM %, cél módban cél RPM folyamatos állítása
+        (sebességfüggő lépéssel), menükben a kijelölés léptetése detentenként.
+        """
+        if self.state == "RUN_MANUAL":
+            delta = self.encoder.take()
+            if delta:
+                self.fan.set_duty_percent(self.fan.current_duty_percent + delta)
+        elif self.state == "RUN_TARGET":
+            delta = self.encoder.take()
+            if delta:
+                rpm = self.fan.target_rpm + delta * config.ENCODER_RPM_STEP
+                self.fan.set_target_rpm(max(0, min(config.TARGET_RPM_MAX, rpm)))
+        else:
+            delta = self.encoder.take_raw()
+            if delta:
+                self._step_selection(current_time, delta)
+
+    def _step_selection(self, current_time, direction):
+        """Az aktuális menü / választó kijelölésének léptetése (negatív irány: visszafelé)."""
+        if self.state == "MENU":
+            self.menu_idx = (self.menu_idx + direction) % len(self.MAIN_MENU_KEYS)
+        elif self.state == "SETTINGS_MENU":
+            self.settings_menu_idx = (self.settings_menu_idx + direction) % len(self.SETT_MENU_KEYS)
+        elif self.state == "SELECT_LANG":
+            self.lang_sel_idx = (self.lang_sel_idx + direction) % len(self.LANG_CODES)
+        elif self.state == "SELECT_STEP":
+            self.step_sel_idx = (self.step_sel_idx + direction) % len(self.STEP_OPTIONS)
+        elif self.state == "SELECT_DEBOUNCE":
+            self.debounce_sel_idx = (self.debounce_sel_idx + direction) % len(self.DEBOUNCE_OPTIONS)
+        else:
+            return
+        self.last_menu_change_time = current_time # Scroll reset
+
+    def _manual_next_step(self):
+        """A következő PWM lépcső a jelenlegi (akár rámpázott) kitöltés felett, a végén körbe."""
+        duty = self.fan.current_duty_percent
+        for i in range(len(self.pwm_steps)):
+            if self.pwm_steps[i] > duty:
+                return i
+        return 0
+
+    def _next_target_rpm(self):
+        """A következő előre definiált cél RPM a jelenlegi cél felett, a végén körbe."""
+        for i in range(len(self.target_rpm_list)):
+            if self.target_rpm_list[i] > self.fan.target_rpm:
+                return i
+        return 0
         
     def _init_selector_indices(self):
         """Beállítja a kiválasztó indexeket."""
@@ -98,77 +327,197 @@ class App:
         now = time.ticks_ms()
         self.state_start_time = now
         self.last_menu_change_time = now
+        if self.fan is not None:
+            self.fan.select_filter(rpm_filters.mode_index(new_state))
+        # A SELECT dupla nyomás csak teszt módokban kell; máshol a rövid nyomás ne késsen
+        double = new_state.startswith("RUN_")
+        for btn in (self.btn_select, self.btn_encoder):
+            if btn is not None:
+                btn.double = double
 
     async def run(self):
         """Fő aszinkron hurok."""
-        self.display.draw_splash()
-        await asyncio.sleep_ms(config.SPLASH_TIME_MS)
+        await self._init_hardware()
+        
+        # A splash csak addig marad, amíg az init tart (opcionális minimummal)
+        remaining = config.SPLASH_MIN_MS - time.ticks_diff(time.ticks_ms(), _BOOT_T0)
+        if remaining > 0:
+            await asyncio.sleep_ms(remaining)
         self._change_state("MENU")
         self._init_selector_indices()
         
         # Indítjuk a folyamatos feladatokat
         asyncio.create_task(self._task_update_fan())
+        asyncio.create_task(self.sensors.run())
+        asyncio.create_task(self._task_settings())
+        asyncio.create_task(self.results.run())
         asyncio.create_task(self._task_display())
+        asyncio.create_task(self.console.run())
+        asyncio.create_task(self.console.run_telemetry())
+        asyncio.create_task(self.mirror.run())
+        asyncio.create_task(logger.run())
+        
+        self._mark_boot("ready")
+        if logger.enabled(logger.DEBUG):
+            logger.debug("Boot: {}", self.boot_report())
         
         # Fő logikai hurok
         while True:
+            if _INSTR:
+                t0 = self.p_logic.start()
             await self._handle_logic()
+            if _INSTR:
+                self.p_logic.stop(t0, 50)
             await asyncio.sleep_ms(50)
 
+    def _on_window(self):
+        """Lezárt mérési ablak feldolgozása a UI magon: eredmény napló és tartós teszt statisztika."""
+        self.recorder.sample(self.state, self.meas, self.sensors.temp_c10)
+        if self.endurance is not None:
+            self.endurance.sample(self.meas)
+
     async def _task_update_fan(self):
-        """RPM mérés."""
+        """
+        RPM mérés; minden lezárt ablak a lépcsőnkénti eredmény összesítőbe kerül.
+        Második magos módban itt csak a vezérlő mag telemetria gyűrűjét ürítjük; egymagos módban
+        a hardver időzítő jelzésére ébredünk (nincs sleep alapú lekérdezés).
+        """
         while True:
-            self.fan.calculate_rpm()
+            if self.control is None and self.fan.window_flag is not None:
+                await self.fan.window_flag.wait()
+                if _INSTR:
+                    t0 = self.p_fan.start(self.fan.last_latch_us()) # Késés az ablak zárásától
+                if self.fan.calculate_rpm():
+                    self._on_window()
+                if _INSTR:
+                    self.p_fan.stop(t0)
+                continue
+            
+            if _INSTR:
+                t0 = self.p_fan.start()
+            if self.control is not None:
+                self.fan.retry_commands() # Teli parancs gyűrű miatt eldobott beállítások pótlása
+                while self.control.poll_window():
+                    self._on_window()
+                if not self.control.flags[0]:
+                    # A vezérlő mag hibával leállt: visszaállunk az egymagos mérésre
+                    logger.error("Vezerlo mag leallt: {}", self.control.error)
+                    self.fan.remote = None
+                    self.control = None
+                    self.meas = self.fan
+            elif self.fan.calculate_rpm():
+                self._on_window()
+            if _INSTR:
+                self.p_fan.stop(t0, 100)
             await asyncio.sleep_ms(100)
 
-    async def _task_display(self):
-        """Képernyő frissítése hibatűréssel."""
+    async def _task_settings(self):
+        """Beállítások késleltetett, összevont kiírása a fő hurkon kívül."""
         while True:
-            try:
-                if self.state == "MENU":
-                    self.display.draw_menu("menu_title", self.MAIN_MENU_KEYS, self.menu_idx, self.last_menu_change_time)
-                
-                elif self.state == "SETTINGS_MENU":
-                     self.display.draw_menu("mode_settings", self.SETT_MENU_KEYS, self.settings_menu_idx, self.last_menu_change_time)
-                
-                elif self.state == "ABOUT":
-                    self.display.draw_about_screen(self.state_start_time)
+            self.settings.flush_if_due()
+            await asyncio.sleep_ms(200)
 
-                elif self.state == "SELECT_LANG":
-                    self.display.draw_language_selector(self.LANG_CODES, self.lang_sel_idx, self.last_menu_change_time)
-                
-                elif self.state == "SELECT_STEP":
-                    val = self.STEP_OPTIONS[self.step_sel_idx]
-                    self.display.draw_value_selector("set_step", val, "%")
-                
-                elif self.state == "SELECT_DEBOUNCE":
-                    val = self.DEBOUNCE_OPTIONS[self.debounce_sel_idx]
-                    self.display.draw_value_selector("set_debounce", val, "unit_ms")
-                    
-                elif self.state == "MESSAGE_SAVED":
-                    self.display.draw_message("saved")
-                    
-                elif self.state == "RUN_AUTO":
-                    self.display.draw_test_screen("mode_auto", self.fan.current_duty_percent, self.fan.current_rpm, self.fan.stall_detected)
-                    
-                elif self.state == "RUN_MANUAL":
-                    self.display.draw_test_screen("mode_manual", self.fan.current_duty_percent, self.fan.current_rpm, self.fan.stall_detected)
-                    
-                elif self.state == "RUN_TARGET":
-                     self.display.draw_test_screen("mode_target", self.fan.current_duty_percent, self.fan.current_rpm, self.fan.stall_detected, target_rpm=self.target_rpm_list[self.target_rpm_idx])
+    async def _task_display(self):
+        """
+        Képernyő frissítése hibatűréssel. Kijelző nélkül (headless) nem renderel,
+        hanem a háttérben, exponenciális visszalépéssel újrapróbálja a buszt.
+        """
+        retry_delay = config.DISPLAY_RETRY_MIN_MS
+        next_retry = time.ticks_ms()
+        while True:
+            if _INSTR:
+                t0 = self.p_display.start()
+            if not self.display.available:
+                now = time.ticks_ms()
+                if time.ticks_diff(now, next_retry) >= 0:
+                    if self.display.connect():
+                        logger.info("Kijelzo ujra elerheto")
+                        retry_delay = config.DISPLAY_RETRY_MIN_MS
+                    else:
+                        next_retry = time.ticks_add(now, retry_delay)
+                        retry_delay = min(retry_delay * 2, config.DISPLAY_RETRY_MAX_MS)
+                self.heap.collect_if_due(self.fan.last_measure_time)
+                self.heap.report_if_due()
+                if _INSTR:
+                    self.p_display.stop(t0, config.HEADLESS_IDLE_MS)
+                await asyncio.sleep_ms(config.HEADLESS_IDLE_MS)
+                continue
             
+            try:
+                self._render_frame()
             except Exception as e:
-                # Ha hiba van a kijelzésben, ne álljon meg a program, csak írjuk ki soros portra
-                print(f"Display Error in loop: {e}")
+                # Ha hiba van a kijelzésben, ne álljon meg a program; a napló az ismétlődést összevonja
+                logger.warn("Display Error in loop: {}", e)
             
+            # A kijelző épp frissült: ez a GC üresjárati rése
+            self.heap.collect_if_due(self.fan.last_measure_time)
+            self.heap.report_if_due()
+            
+            if _INSTR:
+                self.p_display.stop(t0, 50)
             await asyncio.sleep_ms(50) # 20 FPS
 
+    def _render_frame(self):
+        """Az aktuális állapothoz tartozó képernyő kirajzolása."""
+        if self.state == "MENU":
+            self.display.draw_menu(strid.MENU_TITLE, self.MAIN_MENU_KEYS, self.menu_idx, self.last_menu_change_time)
+        
+        elif self.state == "SETTINGS_MENU":
+             self.display.draw_menu(strid.MODE_SETTINGS, self.SETT_MENU_KEYS, self.settings_menu_idx, self.last_menu_change_time)
+        
+        elif self.state == "ABOUT":
+            self.display.draw_about_screen(self.state_start_time)
+        
+        elif _INSTR and self.state == "DIAG":
+            self.display.draw_diag_screen(instrument.screen_rows(self.diag_page))
+
+        elif self.state == "SELECT_LANG":
+            self.display.draw_language_selector(self.LANG_CODES, self.lang_sel_idx, self.last_menu_change_time)
+        
+        elif self.state == "SELECT_STEP":
+            val = self.STEP_OPTIONS[self.step_sel_idx]
+            self.display.draw_value_selector(strid.SET_STEP, val, strid.UNIT_PCT)
+        
+        elif self.state == "SELECT_DEBOUNCE":
+            val = self.DEBOUNCE_OPTIONS[self.debounce_sel_idx]
+            self.display.draw_value_selector(strid.SET_DEBOUNCE, val, strid.UNIT_MS)
+            
+        elif self.state == "MESSAGE_SAVED":
+            self.display.draw_message(strid.SAVED)
+            
+        elif self.state.startswith("RUN_") and self.graph_view:
+            self.display.draw_graph_screen(self.fan, self.meas.current_rpm)
+            
+        elif self.state == "RUN_AUTO":
+            self.display.draw_test_screen(strid.MODE_AUTO, self.meas.current_duty_percent, self.meas.current_rpm, self.meas.stall_detected)
+            
+        elif self.state == "RUN_MANUAL":
+            self.display.draw_test_screen(strid.MODE_MANUAL, self.meas.current_duty_percent, self.meas.current_rpm, self.meas.stall_detected)
+            
+        elif self.state == "RUN_ENDURANCE":
+            self.display.draw_endurance_screen(self.endurance, self.meas.current_rpm, self.meas.stall_detected)
+            
+        elif self.state == "RUN_STEP":
+            self.display.draw_step_screen(self.step_test, self.meas.current_rpm)
+            
+        elif self.state == "RUN_BATCH":
+            self.display.draw_batch_screen(self.batch, self.meas.current_rpm)
+            
+        elif self.state == "RUN_TARGET":
+             self.display.draw_test_screen(strid.MODE_TARGET, self.meas.current_duty_percent, self.meas.current_rpm, self.meas.stall_detected, target_rpm=self.meas.target_rpm)
+
     async def _handle_logic(self):
         """Állapotgép logika."""
         current_time = time.ticks_ms()
         
+        if self.gestures:
+            self._handle_gestures(current_time)
+        if self.encoder is not None:
+            self._handle_encoder(current_time)
+        
         # --- FŐMENÜ ---
         if self.state == "MENU":
+            # Második magos módban csak változáskor megy parancs (eldobásnál a következő hívás pótolja)
             self.fan.set_duty_percent(0)
             self.fan.disable_target_mode()
             
@@ -179,6 +528,7 @@ class App:
                 
             if self.flag_select_pressed:
                 mode = self.MAIN_MENU_IDS[self.menu_idx]
+                self.graph_view = False
                 if mode == "AUTO":
                     self._change_state("RUN_AUTO")
                     self.pwm_steps = [0, 20, 40, 60, 80, 100]
@@ -194,6 +544,24 @@ class App:
                 elif mode == "TARGET":
                     self._change_state("RUN_TARGET")
                     self.fan.set_target_rpm(self.target_rpm_list[self.target_rpm_idx])
+                elif mode == "ENDURANCE":
+                    self._change_state("RUN_ENDURANCE")
+                    if self.endurance is None:
+                        from endurance import EnduranceTest
+                        self.endurance = EnduranceTest(self.fan)
+                    self.endurance.start(current_time)
+                elif mode == "STEP":
+                    self._change_state("RUN_STEP")
+                    if self.step_test is None:
+                        from step_response import StepResponseTest
+                        self.step_test = StepResponseTest(self.fan)
+                    self.step_test.start(current_time)
+                elif mode == "BATCH":
+                    self._change_state("RUN_BATCH")
+                    if self.batch is None:
+                        from batch import BatchTester
+                        self.batch = BatchTester(self.fan)
+                    self.batch.start(current_time)
                 elif mode == "SETTINGS":
                     self._change_state("SETTINGS_MENU")
                     self.settings_menu_idx = 0
@@ -254,6 +622,8 @@ class App:
                 self.settings.set("debounce_ms", new_deb)
                 self.btn_menu.update_debounce(new_deb)
                 self.btn_select.update_debounce(new_deb)
+                if self.btn_encoder is not None:
+                    self.btn_encoder.update_debounce(new_deb)
                 self._save_and_exit_submenu(current_time)
         
         # --- ABOUT ---
@@ -264,6 +634,15 @@ class App:
                 self.flag_menu_pressed = False
                 self.flag_select_pressed = False
 
+        # --- REJTETT DIAGNOSZTIKA (ABOUT-ban SELECT hosszan) ---
+        elif self.state == "DIAG":
+            if self.flag_menu_pressed:
+                self._change_state("MENU")
+                self.flag_menu_pressed = False
+            if self.flag_select_pressed:
+                self.diag_page ^= 1
+                self.flag_select_pressed = False
+
         # --- EGYÉB TESZT MÓDOK ---
         elif self.state == "MESSAGE_SAVED":
             if time.ticks_diff(current_time, self.saved_message_start) > 1500:
@@ -286,23 +665,49 @@ class App:
                 self._change_state("MENU")
                 self.flag_menu_pressed = False
             if self.flag_select_pressed:
-                self.manual_pwm_idx = (self.manual_pwm_idx + 1) % len(self.pwm_steps)
+                self.manual_pwm_idx = self._manual_next_step()
                 self.fan.set_duty_percent(self.pwm_steps[self.manual_pwm_idx])
                 self.flag_select_pressed = False
 
+        elif self.state == "RUN_ENDURANCE":
+            if self.flag_menu_pressed:
+                self.endurance.stop()
+                self._change_state("MENU")
+                self.flag_menu_pressed = False
+            if self.flag_select_pressed:
+                self.endurance.next_view()
+                self.flag_select_pressed = False
+            self.endurance.tick(current_time)
+
+        elif self.state == "RUN_STEP":
+            if self.flag_menu_pressed:
+                self.step_test.stop()
+                self._change_state("MENU")
+                self.flag_menu_pressed = False
+            if self.flag_select_pressed:
+                self.step_test.next_view()
+                self.flag_select_pressed = False
+            self.step_test.tick(current_time)
+
+        elif self.state == "RUN_BATCH":
+            # Kézmentes: a ventilátor be- és kidugása vezérli, a gombok csak a kilépéshez kellenek
+            if self.flag_menu_pressed:
+                self.batch.stop()
+                self._change_state("MENU")
+                self.flag_menu_pressed = False
+            self.flag_select_pressed = False
+            self.batch.tick(current_time)
+
         elif self.state == "RUN_TARGET":
             if self.flag_menu_pressed:
                 self._change_state("MENU")
                 self.fan.disable_target_mode()
                 self.flag_menu_pressed = False
             if self.flag_select_pressed:
-                self.target_rpm_idx = (self.target_rpm_idx + 1) % len(self.target_rpm_list)
+                self.target_rpm_idx = self._next_target_rpm()
                 self.fan.set_target_rpm(self.target_rpm_list[self.target_rpm_idx])
                 self.flag_select_pressed = False
 
-        if current_time % 10000 < 50:
-            gc.collect()
-
     def _save_and_exit_submenu(self, current_time):
         """Beállítás mentése utáni logika."""
         self.state = "MESSAGE_SAVED"
@@ -314,16 +719,35 @@ if __name__ == "__main__":
     try:
         asyncio.run(app.run())
     except KeyboardInterrupt:
+        logger.drain()
         print("Leallitas...")
+        if app.control is not None:
+            app.control.stop()
+        if app.fan is not None:
+            app.fan.stop_window_timer()
+        app.settings.save()
+        if app.results is not None:
+            app.results.flush()
+        if app.endurance is not None:
+            app.endurance.stop()
+        if app.step_test is not None:
+            app.step_test.stop()
+        if app.batch is not None:
+            app.batch.stop()
         from machine import PWM, Pin
         pwm = PWM(Pin(config.PIN_PWM))
         pwm.duty_u16(0)
     except Exception as e:
+        logger.drain()
         print("Hiba:", e)
         import sys
         sys.print_exception(e)
+        if app.control is not None:
+            app.control.stop()
+        if app.fan is not None:
+            app.fan.stop_window_timer()
         from machine import PWM, Pin
         pwm = PWM(Pin(config.PIN_PWM))
         pwm.duty_u16(0)
 
-# Utolsó módosítás: 2026. február 06. 09:40:00
\ No newline at end of file
+# Utolsó módosítás: 2026. október 19. 23:15:00
\ No newline at end of file
@@ -0,0 +1,225 @@
+# Fájl helye: /result_log.py
+# Funkció: Teszt eredmények tömör, bináris gyűrűnaplója a flash-en. Fix méretű (struct) rekordok
+# lépcsőnként; az írás RAM pufferen át, lap méretű kötegekben, a vezérlési úton kívül történik.
+
+from micropython import const
+import struct
+import os
+import time
+import uasyncio as asyncio
+import config
+import logger
+
+# Rekord: seq, teszt azonosító, mód, PWM %, átlag / min / max RPM, beállási idő (ms),
+# elakadások száma, hőmérséklet (°C). 16 bájt, így egy 256 bájtos lapba pontosan 16 fér.
+_REC_FMT = "<HHBBHHHHBb"
+REC_SIZE = const(16)
+SETTLE_NONE = const(0xFFFF)  # A lépcső alatt nem állt be
+
+# Teszt állapot -> rekord mód kód (0: nem teszt, nem naplózunk)
+MODE_CODES = {"RUN_AUTO": 1, "RUN_MANUAL": 2, "RUN_TARGET": 3, "RUN_ENDURANCE": 4}
+MODE_TARGET = const(3)
+
+
+class ResultLog:
+    def __init__(self, filename="results.bin"):
+        self.filename = filename
+        self.capacity = config.RESULT_LOG_RECORDS
+        # RAM puffer egy flash lapnyi rekordnak; tele vagy tétlen puffer kerül kiírásra
+        self.buf = bytearray(config.RESULT_LOG_PAGE)
+        self.buf_len = 0
+        self.dirty_since = 0
+        self.flush_requested = False
+        # A flash-en lévő gyűrű állapota
+        self.count = 0       # Érvényes rekordok száma
+        self.head = 0        # A következő írandó rekord helye
+        self.next_seq = 0
+        self.last_test_id = 0
+        self._scan()
+
+    def _scan(self):
+        """
+        A gyűrű fejének megkeresése induláskor: a rekordok sorszáma egyesével nő,
+        így az első szakadás a legrégebbi rekord helye. Csonka farkat felülírunk.
+        """
+        try:
+            size = os.stat(self.filename)[6]
+        except OSError:
+            return
+        n = min(size // REC_SIZE, self.capacity)
+        if n == 0:
+            return
+        rec = bytearray(REC_SIZE)
+        head = n % self.capacity
+        prev = None
+        last = None
+        with open(self.filename, "rb") as f:
+            for i in range(n):
+                f.readinto(rec)
+                seq, test_id = struct.unpack_from("<HH", rec)
+                if prev is not None and seq != (prev + 1) & 0xFFFF:
+                    head = i
+                    break
+                prev = seq
+                last = (seq, test_id)
+        self.count = n
+        self.head = head
+        self.next_seq = (last[0] + 1) & 0xFFFF
+        self.last_test_id = last[1]
+        logger.debug("Eredmeny naplo: {} rekord, fej {}, utolso teszt {}", n, head, self.last_test_id)
+
+    def append(self, test_id, mode, duty, mean, rpm_min, rpm_max, settle_ms, stalls, temp_c):
+        """Rekord hozzáadása a RAM pufferhez (flash írás nélkül, ha van hely)."""
+        if self.buf_len + REC_SIZE > len(self.buf):
+            self.flush() # Csak ha a háttér feladat nem ért oda (nagyon ritka)
+        if self.buf_len == 0:
+            self.dirty_since = time.ticks_ms()
+        struct.pack_into(_REC_FMT, self.buf, self.buf_len, self.next_seq, test_id, mode, duty,
+                         min(mean, 65535), min(rpm_min, 65535), min(rpm_max, 65535),
+                         min(settle_ms, SETTLE_NONE), min(stalls, 255), max(-128, min(127, temp_c)))
+        self.buf_len += REC_SIZE
+        self.next_seq = (self.next_seq + 1) & 0xFFFF
+        self.last_test_id = test_id
+
+    def flush(self):
+        """A puffer kiírása a gyűrű fejétől; a fájl végén körbefordul."""
+        if not self.buf_len:
+            return
+        records = self.buf_len // REC_SIZE
+        mv = memoryview(self.buf)
+        try:
+            try:
+                f = open(self.filename, "r+b")
+            except OSError:
+                f = open(self.filename, "wb")
+            with f:
+                first = min(records, self.capacity - self.head)
+                f.seek(self.head * REC_SIZE)
+                f.write(mv[:first * REC_SIZE])
+                if first < records:
+                    f.seek(0)
+                    f.write(mv[first * REC_SIZE:self.buf_len])
+        except OSError as e:
+            logger.error("Hiba az eredmeny naplo irasakor: {}", e)
+            return
+        self.head = (self.head + records) % self.capacity
+        self.count = min(self.count + records, self.capacity)
+        self.buf_len = 0
+        self.flush_requested = False
+
+    async def run(self):
+        """Háttér kiírás: tele puffer, teszt vége, vagy RESULT_LOG_FLUSH_MS tétlenség után."""
+        while True:
+            if self.buf_len and (self.flush_requested
+                                 or self.buf_len + REC_SIZE > len(self.buf)
+                                 or time.ticks_diff(time.ticks_ms(), self.dirty_since) >= config.RESULT_LOG_FLUSH_MS):
+                self.flush()
+            await asyncio.sleep_ms(250)
+
+    def size(self):
+        """Rekordok száma a pufferrel együtt."""
+        return self.count + self.buf_len // REC_SIZE
+
+    def records(self):
+        """Az összes rekord időrendben (flash, majd a még ki nem írt puffer), tuple-ökként."""
+        rec = bytearray(REC_SIZE)
+        start = self.head if self.count == self.capacity else 0
+        try:
+            with open(self.filename, "rb") as f:
+                f.seek(start * REC_SIZE)
+                for i in range(self.count):
+                    if start + i == self.capacity:
+                        f.seek(0)
+                    f.readinto(rec)
+                    yield struct.unpack(_REC_FMT, rec)
+        except OSError:
+            pass
+        for off in range(0, self.buf_len, REC_SIZE):
+            yield struct.unpack_from(_REC_FMT, self.buf, off)
+
+    def clear(self):
+        """A napló törlése (a sorszámok és teszt azonosítók folytatódnak)."""
+        self.buf_len = 0
+        self.count = 0
+        self.head = 0
+        try:
+            os.remove(self.filename)
+        except OSError:
+            pass
+
+
+class StepRecorder:
+    """
+    Lépcsőnkénti összesítés a mérési ablakokból. Egy lépcső a PWM % (cél módban a cél RPM)
+    egy értéke; a statisztika a beállás utáni ablakokból készül.
+    """
+    def __init__(self, log):
+        self.log = log
+        self.test_id = log.last_test_id
+        self.mode = 0
+        self.key = -1
+        self._start(0)
+
+    def _start(self, now):
+        self.step_start = now
+        self.settle_ms = SETTLE_NONE
+        self.prev_rpm = -1
+        self.n = 0
+        self.total = 0
+        self.rpm_min = 0
+        self.rpm_max = 0
+        self.last_rpm = 0
+        self.last_duty = 0
+        self.stalls = 0
+        self.was_stalled = False
+
+    def sample(self, state, fan, temp_c10):
+        """Új mérési ablak (FanController.calculate_rpm() igaz visszatérése után)."""
+        mode = MODE_CODES.get(state, 0)
+        now = fan.last_measure_time
+        key = fan.target_rpm if mode == MODE_TARGET else fan.current_duty_percent
+        if mode != self.mode or key != self.key:
+            self._finish(temp_c10)
+            if mode != self.mode:
+                if mode:
+                    self.test_id = (self.test_id + 1) & 0xFFFF
+                else:
+                    self.log.flush_requested = True # Teszt vége: ne várjunk a teljes lapra
+            self.mode = mode
+            self.key = key
+            self._start(now)
+        if not mode:
+            return
+
+        rpm = fan.current_rpm
+        self.last_rpm = rpm
+        self.last_duty = fan.current_duty_percent
+        if fan.stall_detected and not self.was_stalled:
+            self.stalls += 1
+        self.was_stalled = fan.stall_detected
+
+        if self.settle_ms == SETTLE_NONE:
+            if self.prev_rpm >= 0 and abs(rpm - self.prev_rpm) <= config.RESULT_SETTLE_BAND_RPM:
+                self.settle_ms = time.ticks_diff(now, self.step_start)
+            self.prev_rpm = rpm
+            if self.settle_ms == SETTLE_NONE:
+                return
+        if self.n == 0 or rpm < self.rpm_min:
+            self.rpm_min = rpm
+        if rpm > self.rpm_max:
+            self.rpm_max = rpm
+        self.total += rpm
+        self.n += 1
+
+    def _finish(self, temp_c10):
+        """A lezárt lépcső rekordjának átadása a naplónak (ha volt mérés)."""
+        if not self.mode or self.prev_rpm < 0:
+            return
+        if self.n:
+            mean = self.total // self.n
+        else:
+            mean = self.rpm_min = self.rpm_max = self.last_rpm
+        self.log.append(self.test_id, self.mode, self.last_duty, mean, self.rpm_min, self.rpm_max,
+                        self.settle_ms, self.stalls, (temp_c10 + 5) // 10)
+
+# Utolsó módosítás: 2026. október 19. 19:45:00
\ No newline at end of file
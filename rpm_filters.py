@@ -0,0 +1,135 @@
+# Fájl helye: /rpm_filters.py
+# Funkció: Cserélhető RPM szűrő lánc a mérési ablakok nyers értékeire: futó összeges mozgóátlag (SMA),
+# exponenciális átlag (EMA), medián (tüskeszűrés) és egyszerű 1-D Kalman szűrő. Mind egész aritmetikával,
+# előre foglalt tömbökkel dolgozik, így a második magon is foglalás nélkül fut.
+# A lánc módonként választható (config.RPM_FILTER_MODES): cél módban kis késés, kijelzésnél sima számok.
+# Leírás: "median3,sma5" - balról jobbra alkalmazott szűrők, a szám a szűrő paramétere.
+
+from array import array
+import fixmath
+import config
+
+
+class Sma:
+    """Mozgóátlag n mintán, futó összeggel (O(1) lépésenként)."""
+    def __init__(self, n):
+        self.avg = fixmath.MovingAverage(n)
+
+    def update(self, x):
+        return self.avg.push(x)
+
+    def reset(self, x):
+        self.avg.reset(x)
+
+
+class Ema:
+    """Exponenciális átlag 1/2^shift súllyal; az állapot 2^shift-szeres skálán (nincs kerekítési sodródás)."""
+    def __init__(self, shift):
+        self.shift = shift
+        self.acc = 0
+
+    def update(self, x):
+        self.acc = fixmath.ema_step(self.acc, x, self.shift)
+        return self.acc >> self.shift
+
+    def reset(self, x):
+        self.acc = x << self.shift
+
+
+class Median:
+    """Medián az utolsó n mintán: egy-egy kiugró ablakot (zavar, hiányzó impulzus) teljesen elnyel."""
+    def __init__(self, n):
+        self.n = n
+        self.buf = array('i', (0 for _ in range(n)))
+        self.tmp = array('i', (0 for _ in range(n)))
+        self.idx = 0
+
+    def update(self, x):
+        self.buf[self.idx] = x
+        self.idx = (self.idx + 1) % self.n
+        return fixmath.median(self.buf, self.tmp, self.n)
+
+    def reset(self, x):
+        for i in range(self.n):
+            self.buf[i] = x
+        self.idx = 0
+
+
+class Kalman:
+    """
+    1-D Kalman szűrő állandó állapot modellel: q a folyamat, r a mérés zaja (rpm^2 / ablak).
+    Az erősítés 1/256 egységben; r legfeljebb ~4e6 lehet, hogy a szorzatok kis egészek maradjanak.
+    Ha az újítás négyzete 9 * (p + r) fölött van (3 szigma, pl. PWM lépcső), a szűrő az új mérésre
+    ugrik: így állandósult állapotban simít, lépcsőnél mégsem késik. Impulzus nélküli ablak (0) biztos
+    megállás, arra is azonnal ugrik (az elakadás jelzés nem késik).
+    """
+    def __init__(self, q, r):
+        self.q = q
+        self.r = r
+        self.x = 0
+        self.p = r
+
+    def update(self, z):
+        p = self.p + self.q
+        innov = z - self.x
+        if z == 0 or innov * innov > 9 * (p + self.r):
+            self.x = z
+            self.p = self.r
+            return z
+        k = (p << 8) // (p + self.r)
+        self.x += k * innov >> 8
+        self.p = (256 - k) * p >> 8
+        return self.x
+
+    def reset(self, x):
+        self.x = x
+        self.p = self.r
+
+
+class Chain:
+    def __init__(self, spec, filters):
+        self.spec = spec
+        self.filters = filters
+
+    def update(self, x):
+        for f in self.filters:
+            x = f.update(x)
+        return x
+
+    def reset(self, x):
+        for f in self.filters:
+            f.reset(x)
+
+
+def build(spec):
+    """Szűrő lánc a leírásból, pl. "median3,sma5", "ema2", "kalman". Üres leírás: átengedés."""
+    filters = []
+    for part in spec.split(","):
+        part = part.strip()
+        name = part.rstrip("0123456789")
+        arg = int(part[len(name):]) if len(part) > len(name) else 0
+        if name == "sma":
+            filters.append(Sma(arg or config.MOVING_AVERAGE_SAMPLES))
+        elif name == "ema":
+            filters.append(Ema(arg or 2))
+        elif name == "median":
+            filters.append(Median(arg or 3))
+        elif name == "kalman":
+            filters.append(Kalman(config.RPM_KALMAN_Q, config.RPM_KALMAN_R))
+        elif name:
+            raise ValueError("ismeretlen RPM szuro: " + part)
+    return Chain(spec, filters)
+
+
+# A választható láncok: [0] az alapértelmezett, utána a módokhoz rendeltek (ismétlés nélkül)
+PRESETS = [config.RPM_FILTER_DEFAULT]
+for _spec in config.RPM_FILTER_MODES.values():
+    if _spec not in PRESETS:
+        PRESETS.append(_spec)
+
+
+def mode_index(state):
+    """Az állapothoz (pl. "RUN_TARGET") tartozó lánc indexe a PRESETS-ben."""
+    return PRESETS.index(config.RPM_FILTER_MODES.get(state, config.RPM_FILTER_DEFAULT))
+
+# Utolsó módosítás: 2026. október 19. 19:30:00
@@ -0,0 +1,69 @@
+# Fájl helye: /sensors.py
+# Funkció: Háttérben futó ADC mintavételező túlmintavételezéssel; gyorsítótárazott, fixpontos
+# hőmérséklet, tápfeszültség, áram és teljesítmény értékek a UI és a naplózás számára.
+
+from machine import ADC, Pin
+import uasyncio as asyncio
+import config
+import fixmath
+
+
+class SensorSampler:
+    def __init__(self):
+        self.temp_adc = ADC(4)   # RP2040 belső hőmérő
+        self.supply_adc = ADC(Pin(config.ADC_SUPPLY_PIN)) if config.ADC_SUPPLY_PIN is not None else None
+        self.current_adc = ADC(Pin(config.ADC_CURRENT_PIN)) if config.ADC_CURRENT_PIN is not None else None
+        self.has_power = self.supply_adc is not None and self.current_adc is not None
+
+        # Publikált (gyorsítótárazott) értékek - olvasásuk ingyenes, csak egész számok
+        self.temp_c10 = 0      # Hőmérséklet tized °C-ban
+        self.temp_c = 0        # Hőmérséklet egész °C-ban (kijelzőhöz)
+        self.supply_mv = 0     # Ventilátor tápfeszültség mV-ban
+        self.current_ma = 0    # Ventilátor áramfelvétel mA-ben
+        self.power_mw = 0      # Teljesítmény mW-ban
+        self.sample_count = 0
+
+        # Simító szűrő állapota (EMA, 2^SENSOR_EMA_SHIFT-szeres skálán)
+        self._temp_ema = -1
+        self.sample()
+
+    def _oversample(self, adc):
+        """SENSOR_OVERSAMPLE darab mérés átlaga (decimálás egy értékre), 0..65535."""
+        total = 0
+        for _ in range(config.SENSOR_OVERSAMPLE):
+            total += adc.read_u16()
+        return total // config.SENSOR_OVERSAMPLE
+
+    def _pin_mv(self, raw):
+        """ADC nyers érték -> lábfeszültség mV-ban (3.3 V referencia)."""
+        return raw * 3300 // 65535
+
+    def sample(self):
+        """Egy mintavételi kör: minden csatorna túlmintavételezése és a publikált értékek frissítése."""
+        raw = self._oversample(self.temp_adc)
+        # EMA a dekimált értékeken: ema += (x - ema) / 2^k, skálázott egészként
+        shift = config.SENSOR_EMA_SHIFT
+        if self._temp_ema < 0:
+            self._temp_ema = raw << shift
+        else:
+            self._temp_ema = fixmath.ema_step(self._temp_ema, raw, shift)
+
+        self.temp_c10 = fixmath.temp_c10(self._temp_ema >> shift)
+        self.temp_c = self.temp_c10 // 10
+
+        if self.supply_adc is not None:
+            self.supply_mv = self._pin_mv(self._oversample(self.supply_adc)) * config.ADC_SUPPLY_DIVIDER
+        if self.current_adc is not None:
+            self.current_ma = self._pin_mv(self._oversample(self.current_adc)) * config.ADC_CURRENT_MA_PER_V // 1000
+        if self.has_power:
+            self.power_mw = self.supply_mv * self.current_ma // 1000
+
+        self.sample_count += 1
+
+    async def run(self):
+        """Háttérfeladat: periodikus mintavétel, a renderelési úttól függetlenül."""
+        while True:
+            self.sample()
+            await asyncio.sleep_ms(config.SENSOR_SAMPLE_INTERVAL_MS)
+
+# Utolsó módosítás: 2026. október 19. 19:15:00
\ No newline at end of file
@@ -0,0 +1,244 @@
+# Fájl helye: /serial_console.py
+# Funkció: Soros (USB CDC) parancssor és telemetria. Kijelző nélküli (headless) működésben
+# ezen keresztül vezérelhető a teszter, de kijelzővel is mindig elérhető.
+
+import sys
+import time
+import uasyncio as asyncio
+import config
+import logger
+
+
+class SerialConsole:
+    def __init__(self, app):
+        self.app = app
+        self.telemetry_on = False
+        self.telemetry_interval = config.TELEMETRY_INTERVAL_MS
+        # Parancs -> (kezelő, rövid leírás); más modulok a register()-rel bővíthetik
+        self.commands = {}
+        self.register("help", self._cmd_help, "parancsok listaja")
+        self.register("status", self._cmd_status, "aktualis allapot egy sorban")
+        self.register("menu", self._cmd_menu, "MENU gomb nyomas")
+        self.register("select", self._cmd_select, "SELECT gomb nyomas")
+        self.register("duty", self._cmd_duty, "duty <0-100> - PWM kezi modban")
+        self.register("target", self._cmd_target, "target <rpm> - cel RPM cel modban")
+        self.register("telemetry", self._cmd_telemetry, "telemetry on|off [ms]")
+        self.register("heap", self._cmd_heap, "heap statisztika")
+        self.register("boot", self._cmd_boot, "boot fazisok idozitese")
+        self.register("log", self._cmd_log, "log [dump|clear] - teszt eredmeny naplo")
+        self.register("jitter", self._cmd_jitter, "jitter [reset] - meresi ablak es vezerlo hurok idozitese")
+        self.register("capture", self._cmd_capture, "capture [ms] - TACH elek rogzitese es kiirasa")
+        self.register("endurance", self._cmd_endurance, "endurance [reset] - tartos teszt lepcso statisztika")
+        self.register("step", self._cmd_step, "step [log] - ugrasvalasz / kifutas eredmenyek")
+        self.register("batch", self._cmd_batch, "batch [reset] - sorozat teszt darabszam es utolso eredmeny")
+        self.register("mirror", self._cmd_mirror, "mirror on|off [ms] - kijelzo tukrozes (#FB sorok)")
+        self.register("loglevel", self._cmd_loglevel, "loglevel [0-4] - naplo szint (D,I,W,E,ki)")
+
+    def register(self, name, handler, help_text=""):
+        """Új parancs felvétele. A kezelő az argumentumok listáját kapja."""
+        self.commands[name] = (handler, help_text)
+
+    def reply(self, text):
+        print(text)
+
+    async def run(self):
+        """Sorok olvasása a soros portról és a parancsok végrehajtása."""
+        reader = asyncio.StreamReader(sys.stdin)
+        while True:
+            line = await reader.readline()
+            if not line:
+                await asyncio.sleep_ms(100)
+                continue
+            if isinstance(line, bytes):
+                line = line.decode()
+            parts = line.strip().split()
+            if not parts:
+                continue
+            entry = self.commands.get(parts[0].lower())
+            if entry is None:
+                self.reply(f"ERR ismeretlen parancs: {parts[0]} (help)")
+                continue
+            try:
+                entry[0](parts[1:])
+            except Exception as e:
+                self.reply(f"ERR {parts[0]}: {e}")
+
+    async def run_telemetry(self):
+        """Periodikus telemetria sor, ha be van kapcsolva (headless módban automatikusan)."""
+        while True:
+            if self.telemetry_on or not self.app.display.available:
+                self._cmd_status(None)
+            await asyncio.sleep_ms(self.telemetry_interval)
+
+    # --- Parancsok ---
+
+    def _cmd_help(self, args):
+        for name in self.commands:
+            self.reply(f"{name:<10} {self.commands[name][1]}")
+
+    def _cmd_status(self, args):
+        app = self.app
+        meas = app.meas
+        self.reply(f"T,{time.ticks_ms()},{app.state},{meas.current_duty_percent},{meas.current_rpm},"
+                   f"{int(meas.stall_detected)},{app.sensors.temp_c10},{int(app.display.available)}")
+
+    def _cmd_menu(self, args):
+        self.app.flag_menu_pressed = True
+
+    def _cmd_select(self, args):
+        self.app.flag_select_pressed = True
+
+    def _cmd_duty(self, args):
+        if self.app.state != "RUN_MANUAL":
+            self.reply("ERR csak kezi (MANUAL) modban")
+            return
+        # Eldobásnál a UI hurok újraküldi; a hívó erről is tudjon
+        self.reply("OK" if self.app.fan.set_duty_percent(int(args[0])) else "ERR teli parancs gyuru, ujrakuldes")
+
+    def _cmd_target(self, args):
+        if self.app.state != "RUN_TARGET":
+            self.reply("ERR csak cel (TARGET) modban")
+            return
+        self.reply("OK" if self.app.fan.set_target_rpm(int(args[0])) else "ERR teli parancs gyuru, ujrakuldes")
+
+    def _cmd_telemetry(self, args):
+        if args:
+            self.telemetry_on = args[0] == "on"
+        if len(args) > 1:
+            self.telemetry_interval = max(100, int(args[1]))
+        self.reply(f"OK telemetry={'on' if self.telemetry_on else 'off'} {self.telemetry_interval}ms")
+
+    def _cmd_heap(self, args):
+        self.app.heap.probe_largest_block()
+        s = self.app.heap.stats()
+        self.reply(" ".join(f"{k}={s[k]}" for k in s))
+
+    def _cmd_boot(self, args):
+        self.reply(" ".join(f"{name}={ms}ms" for name, ms in self.app.boot_report()))
+
+    def _cmd_log(self, args):
+        log = self.app.results
+        if not args:
+            self.reply(f"OK records={log.size()} capacity={log.capacity} test={log.last_test_id}")
+        elif args[0] == "dump":
+            # Tömeges export CSV sorokban; a fejléc a mezők sorrendjét adja meg
+            self.reply("L,seq,test,mode,duty,mean,min,max,settle_ms,stalls,temp_c")
+            n = 0
+            for r in log.records():
+                self.reply("R,%d,%d,%d,%d,%d,%d,%d,%d,%d,%d" % r)
+                n += 1
+            self.reply(f"OK {n}")
+        elif args[0] == "clear":
+            log.clear()
+            self.reply("OK")
+        else:
+            self.reply("ERR log [dump|clear]")
+
+    def _cmd_endurance(self, args):
+        test = self.app.endurance
+        if test is None:
+            self.reply("ERR a tartos teszt meg nem futott (menu: ENDURANCE)")
+            return
+        if args and args[0] == "reset":
+            test.reset(time.ticks_ms())
+            self.reply("OK")
+            return
+        for line in test.report_lines():
+            self.reply(line)
+
+    def _cmd_step(self, args):
+        import step_response
+        if args and args[0] == "log":
+            records = step_response.log_records()
+        elif self.app.step_test is not None:
+            records = self.app.step_test.results
+        else:
+            self.reply("ERR az ugrasvalasz meres meg nem futott (menu: STEP, vagy: step log)")
+            return
+        self.reply(step_response.REPORT_HEADER)
+        n = 0
+        for rec in records:
+            self.reply(step_response.report_line(rec))
+            n += 1
+        self.reply(f"OK {n}")
+
+    def _cmd_batch(self, args):
+        tester = self.app.batch
+        if tester is None:
+            self.reply("ERR a sorozat teszt meg nem futott (menu: BATCH)")
+            return
+        if args and args[0] == "reset":
+            tester.reset_counts()
+            self.reply("OK")
+            return
+        for line in tester.report_lines():
+            self.reply(line)
+
+    def _cmd_mirror(self, args):
+        mirror = self.app.mirror
+        if args and args[0] == "on":
+            mirror.start(int(args[1]) if len(args) > 1 else 0)
+        elif args and args[0] == "off":
+            mirror.stop()
+        self.reply(f"OK mirror={'on' if mirror.enabled else 'off'} {mirror.interval}ms")
+
+    def _cmd_loglevel(self, args):
+        if args:
+            logger.set_level(max(logger.DEBUG, min(logger.OFF, int(args[0]))))
+        self.reply(f"OK level={logger.level} dropped={logger.dropped}")
+
+    def _cmd_jitter(self, args):
+        fan = self.app.fan
+        control = self.app.control
+        if args and args[0] == "reset":
+            # Második magos módban a vezérlő mag nullázza (a jitterrel együtt)
+            self.reply("OK" if fan.reset_window_stats() else "ERR teli parancs gyuru")
+            return
+        # Mérési ablak hossza a névlegeshez képest (időzítővel zárt vagy lekérdezett ablak)
+        st = fan.window_stats
+        n = max(1, st[0])
+        source = "timer" if fan.window_flag is not None else "poll"
+        self.reply(f"J,window,{source},nominal={config.RPM_UPDATE_INTERVAL_MS * 1000}us,n={st[0]},"
+                   f"err_avg={st[1] // n}us,err_max={st[2]}us,missed={st[3]},min={st[4]}us,max={st[5]}us")
+        if control is not None:
+            ticks, late_avg, late_max, overruns, dropped = control.jitter_report()
+            self.reply(f"J,core1,period={control.period_us}us,ticks={ticks},late_avg={late_avg}us,"
+                       f"late_max={late_max}us,overruns={overruns},dropped={dropped}")
+
+    def _cmd_capture(self, args):
+        fan = self.app.fan
+        if not fan.start_capture(self):
+            self.reply("ERR a rogzito puffer foglalt (rogzites vagy ugrasvalasz meres folyamatban)")
+            return
+        window = int(args[0]) if args else config.CAPTURE_WINDOW_MS
+        asyncio.create_task(self._capture_task(window))
+        self.reply(f"OK capture {window}ms")
+
+    async def _capture_task(self, window_ms):
+        """Rögzítés az ablak végéig (vagy a puffer megteléséig), majd tömeges kiírás."""
+        fan = self.app.fan
+        while not fan.capture_done():
+            await asyncio.sleep_ms(5)
+        end = time.ticks_add(time.ticks_ms(), window_ms)
+        while time.ticks_diff(end, time.ticks_ms()) > 0 and fan.cap_idx < fan.cap_len:
+            await asyncio.sleep_ms(50)
+        # Teli parancs gyűrűnél a leállítás eldobódik: addig küldjük, amíg be nem kerül, különben
+        # a capture_done() az előző parancs nyugtájával teljesülne, és a még írt puffert olvasnánk
+        while not fan.stop_capture(self):
+            await asyncio.sleep_ms(5)
+        while not fan.capture_done(): # A pufferek csak a leállítás nyugtázása után olvashatók
+            await asyncio.sleep_ms(5)
+        n = fan.cap_idx
+        # Fejléc: élek száma, impulzus / fordulat, PWM %, kezdő ticks_us, PWM parancsok száma, záró ticks_us;
+        # utána soronként 16 nyers él (E), majd a PWM parancsok (D)
+        m = fan.cap_cmd_idx
+        self.reply(f"C,{n},{config.TACH_PULSES_PER_REV},{fan.current_duty_percent},{fan.cap_start_us},{m},{fan.cap_end_us}")
+        for prefix, buf, count in (("E,", fan.cap_buf, n), ("D,", fan.cap_cmds, m)):
+            for i in range(0, count, 16):
+                self.reply(prefix + ",".join(str(buf[j]) for j in range(i, min(count, i + 16))))
+                await asyncio.sleep_ms(0)
+        while not fan.release_capture(self): # A puffer gazdája csak sikeres elengedéssel szabadul
+            await asyncio.sleep_ms(5)
+        self.reply(f"OK {n}")
+
+# Utolsó módosítás: 2026. október 19. 23:55:00
\ No newline at end of file
@@ -1,59 +1,151 @@
 # Fájl helye: /settings_manager.py
-# Funkció: A felhasználói beállítások (pl. nyelv, pwm lépés, debounce) perzisztens tárolása JSON fájlban.
+# Funkció: A felhasználói beállítások (pl. nyelv, pwm lépés, debounce) perzisztens tárolása.
+# Késleltetett, összevont írás: a változások egy hozzáfűzős naplóba (settings.log) kerülnek,
+# amit időnként atomikusan (ideiglenes fájl + átnevezés) tömörítünk a settings.json pillanatképbe.
 
 import json
 import os
+import time
 import config
+import logger
+
+def _crc16(data):
+    """CRC-16/CCITT a napló rekordok épségének ellenőrzéséhez."""
+    crc = 0xFFFF
+    for b in data:
+        crc ^= b << 8
+        for _ in range(8):
+            if crc & 0x8000:
+                crc = ((crc << 1) ^ 0x1021) & 0xFFFF
+            else:
+                crc = (crc << 1) & 0xFFFF
+    return crc
 
 class SettingsManager:
     def __init__(self, filename="settings.json"):
         self.filename = filename
+        self.log_filename = filename.rsplit(".", 1)[0] + ".log"
+        self.tmp_filename = filename + ".tmp"
         # Alapértelmezett értékek
         self.settings = {
             "language": config.DEFAULT_LANGUAGE,
             "pwm_step": config.DEFAULT_PWM_STEP,
             "debounce_ms": config.DEFAULT_DEBOUNCE_MS
         }
+        # Még ki nem írt változások és az első ki nem írt változás ideje
+        self.pending = {}
+        self.dirty_since = 0
+        self.log_records = 0
         self.load()
 
+    def _exists(self, name):
+        try:
+            os.stat(name)
+            return True
+        except OSError:
+            return False
+
     def load(self):
-        """Beállítások betöltése fájlból."""
+        """Beállítások betöltése: pillanatkép, majd a napló ép rekordjainak visszajátszása."""
+        # A pillanatképet csak átnevezéssel cseréljük, így sosem lehet félig írt
         try:
-            # Ellenőrizzük, hogy létezik-e a fájl
-            try:
-                os.stat(self.filename)
-            except OSError:
-                return # Fájl nem létezik, maradnak az alapértelmezések
-
-            with open(self.filename, "r") as f:
-                data = json.load(f)
-                # Csak azokat a kulcsokat frissítjük, amik léteznek, vagy bővítjük
-                if data:
-                    self.settings.update(data)
-                    if config.DEBUG_MODE:
-                        print(f"Beállítások betöltve: {self.settings}")
+            if self._exists(self.filename):
+                with open(self.filename, "r") as f:
+                    data = json.load(f)
+                    if data:
+                        self.settings.update(data)
         except Exception as e:
-            if config.DEBUG_MODE:
-                print(f"Hiba a beállítások betöltésekor: {e}")
+            logger.error("Hiba a beállítások betöltésekor: {}", e)
 
-    def save(self):
-        """Beállítások mentése fájlba."""
+        # Napló visszajátszása; az első sérült (pl. áramszünetkor félbeszakadt) sornál megállunk
+        torn = False
+        try:
+            if self._exists(self.log_filename):
+                with open(self.log_filename, "r") as f:
+                    for line in f:
+                        record = self._parse_record(line)
+                        if record is None:
+                            torn = True
+                            break
+                        self.settings[record[0]] = record[1]
+                        self.log_records += 1
+        except Exception as e:
+            torn = True
+            logger.error("Hiba a beállítás napló olvasásakor: {}", e)
+
+        if torn:
+            # A sérült farok eldobása: az ép állapotot azonnal pillanatképbe tömörítjük
+            self.compact()
+
+        logger.debug("Beállítások betöltve: {}", self.settings)
+
+    def _parse_record(self, line):
+        """Egy napló sor ('cccc [kulcs, érték]\\n') ellenőrzése; hibás sornál None."""
+        if not line.endswith("\n") or len(line) < 6:
+            return None
+        payload = line[5:-1]
         try:
-            with open(self.filename, "w") as f:
+            if int(line[:4], 16) != _crc16(payload.encode()):
+                return None
+            record = json.loads(payload)
+        except ValueError:
+            return None
+        if not isinstance(record, list) or len(record) != 2:
+            return None
+        return record
+
+    def flush(self):
+        """A függő változások hozzáfűzése a naplóhoz; ha a napló túl hosszú, tömörítés."""
+        if not self.pending:
+            return
+        try:
+            with open(self.log_filename, "a") as f:
+                for key in self.pending:
+                    payload = json.dumps([key, self.pending[key]])
+                    f.write("%04x %s\n" % (_crc16(payload.encode()), payload))
+                    self.log_records += 1
+            self.pending = {}
+            logger.debug("Beállítások mentve: {}", self.settings)
+        except Exception as e:
+            logger.error("Hiba a beállítások mentésekor: {}", e)
+            return
+
+        if self.log_records >= config.SETTINGS_COMPACT_RECORDS:
+            self.compact()
+
+    def compact(self):
+        """Teljes állapot atomikus kiírása: ideiglenes fájl, átnevezés, majd a napló törlése."""
+        try:
+            with open(self.tmp_filename, "w") as f:
                 json.dump(self.settings, f)
-            if config.DEBUG_MODE:
-                print(f"Beállítások mentve: {self.settings}")
+            os.rename(self.tmp_filename, self.filename)
+            # Ha itt szakad meg, a megmaradt napló visszajátszása ugyanezt az állapotot adja
+            if self._exists(self.log_filename):
+                os.remove(self.log_filename)
+            self.log_records = 0
         except Exception as e:
-            if config.DEBUG_MODE:
-                print(f"Hiba a beállítások mentésekor: {e}")
+            logger.error("Hiba a beállítások tömörítésekor: {}", e)
+
+    def flush_if_due(self):
+        """Késleltetett írás: a változások SETTINGS_FLUSH_DELAY_MS után, összevonva kerülnek ki."""
+        if self.pending and time.ticks_diff(time.ticks_ms(), self.dirty_since) >= config.SETTINGS_FLUSH_DELAY_MS:
+            self.flush()
+
+    def save(self):
+        """Azonnali mentés (pl. leállításkor)."""
+        self.flush()
 
     def get(self, key):
         """Beállítás lekérdezése."""
         return self.settings.get(key)
 
     def set(self, key, value):
-        """Beállítás módosítása és mentése."""
+        """Beállítás módosítása; a flash írás később, összevonva történik."""
+        if self.settings.get(key) == value:
+            return # Nincs változás, nincs írás
         self.settings[key] = value
-        self.save()
+        if not self.pending:
+            self.dirty_since = time.ticks_ms()
+        self.pending[key] = value
 
-# Utolsó módosítás: 2026. február 06. 09:05:00
\ No newline at end of file
+# Utolsó módosítás: 2026. október 19. 18:45:00
\ No newline at end of file
@@ -1,7 +1,9 @@
 # Fájl helye: /ssd1306.py
-# Funkció: SSD1306 OLED kijelző meghajtó (Hivatalos MicroPython driver).
+# Funkció: SSD1306 OLED kijelző meghajtó (Hivatalos MicroPython driver), lap alapú különbség
+# frissítéssel: a show() csak a megváltozott 8 soros lapokat küldi ki (árnyék puffer alapján).
 
 from micropython import const
+import micropython
 import framebuf
 
 # register definitions
@@ -24,6 +26,22 @@ SET_VCOM_DESEL = const(0xDB)
 SET_CHARGE_PUMP = const(0x8D)
 
 
+@micropython.viper
+def _diff_pages(buf: ptr8, shadow: ptr8, width: int, pages: int) -> int:
+    """Lapok összevetése az árnyék pufferrel; a változottakat átmásolja, a maszkjukat adja."""
+    mask = 0
+    for p in range(pages):
+        base = p * width
+        changed = 0
+        for i in range(base, base + width):
+            if buf[i] != shadow[i]:
+                shadow[i] = buf[i]
+                changed = 1
+        if changed:
+            mask |= 1 << p
+    return mask
+
+
 class SSD1306(framebuf.FrameBuffer):
     def __init__(self, width, height, external_vcc):
         self.width = width
@@ -31,6 +49,10 @@ class SSD1306(framebuf.FrameBuffer):
         self.external_vcc = external_vcc
         self.pages = self.height // 8
         self.buffer = bytearray(self.pages * self.width)
+        self.shadow = bytearray(self.pages * self.width)  # A panelen lévő tartalom
+        self.full_refresh = True                          # Következő show() mindent küld
+        self.dirty = 0         # Az utolsó show() által kiküldött lapok maszkja
+        self.mirror_dirty = 0  # Gyűjtött maszk a tükrözéshez (a fogyasztó nullázza)
         super().__init__(self.buffer, self.width, self.height, framebuf.MONO_VLSB)
         self.init_display()
 
@@ -91,13 +113,40 @@ class SSD1306(framebuf.FrameBuffer):
             # displays with width of 64 pixels are shifted by 32
             x0 += 32
             x1 += 32
-        self.write_cmd(SET_COL_ADDR)
-        self.write_cmd(x0)
-        self.write_cmd(x1)
-        self.write_cmd(SET_PAGE_ADDR)
-        self.write_cmd(0)
-        self.write_cmd(self.pages - 1)
-        self.write_data(self.buffer)
+        all_pages = (1 << self.pages) - 1
+        dirty = _diff_pages(self.buffer, self.shadow, self.width, self.pages)
+        if self.full_refresh:
+            dirty = all_pages
+            self.full_refresh = False
+        self.dirty = dirty
+        self.mirror_dirty |= dirty
+        # Egymás melletti változott lapok egy átvitelben (vízszintes címzés, lap tartomány)
+        mv = memoryview(self.buffer)
+        p = 0
+        try:
+            while p < self.pages:
+                if not (dirty >> p) & 1:
+                    p += 1
+                    continue
+                p1 = p
+                while p1 + 1 < self.pages and (dirty >> (p1 + 1)) & 1:
+                    p1 += 1
+                self.write_cmd(SET_COL_ADDR)
+                self.write_cmd(x0)
+                self.write_cmd(x1)
+                self.write_cmd(SET_PAGE_ADDR)
+                self.write_cmd(p)
+                self.write_cmd(p1)
+                self.write_data(mv[p * self.width:(p1 + 1) * self.width])
+                p = p1 + 1
+        except OSError:
+            # Félbeszakadt átvitel: a panel tartalma bizonytalan, legközelebb minden lap megy
+            self.full_refresh = True
+            raise
+
+    def invalidate(self):
+        """A következő show() a teljes képet küldi (pl. panel újraindítás után)."""
+        self.full_refresh = True
 
 
 class SSD1306_I2C(SSD1306):
@@ -153,4 +202,4 @@ class SSD1306_SPI(SSD1306):
         self.spi.write(buf)
         self.cs(1)
 
-# Utolsó módosítás: 2026. február 05. 22:15:00
\ No newline at end of file
+# Utolsó módosítás: 2026. október 19. 19:00:00
\ No newline at end of file
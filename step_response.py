@@ -0,0 +1,283 @@
+# Fájl helye: /step_response.py
+# Funkció: Ugrásválasz és kifutás mérés: PWM lépcsők (pl. 0->100, 100->0, 30->70) alatt a TACH élek
+# időbélyegeiből (FanController él rögzítés) fordulatonkénti RPM, és abból késés (10 %), felfutási idő
+# (10-90 %), beállási idő, túllövés és a megállásig tartó kifutási idő. Az 1 s-os mérési ablaknál
+# sokkal finomabb felbontás; a kifutási idő a csapágy súrlódás olcsó mutatója.
+# Az eredmények tömör, fix méretű rekordokban a flash-re kerülnek (STEP_LOG_FILE).
+
+import struct
+import os
+import time
+import config
+import logger
+
+# Rekord: kiinduló / cél PWM %, kiinduló / végső / szélső RPM, késés, felfutás, beállás, kifutás (ms). 16 bájt.
+_REC_FMT = "<BBHHHHHHH"
+REC_SIZE = 16
+NONE = 0xFFFF   # Nem mérhető (nem ért el a szintig, nem állt be, nem állt meg)
+
+# Fázisok: kiinduló PWM tartása, előzmény rögzítés az ugrás előtt, rögzítés az ugrás után,
+# a leállítás nyugtázására várás, kész
+PREP = 0
+PRE = 1
+STEP = 2
+STOP = 3
+DONE = 4
+
+
+def _ms(us):
+    return min(us // 1000, NONE - 1)
+
+
+def _revolutions(buf, n, t_step, ppr):
+    """
+    Lefutó élekből fordulatonkénti RPM (ppr élnyi periódus, így a pólusok aszimmetriája kiesik),
+    3-as mediánnal a hibás élek ellen. Párokat ad: (idő az ugrástól us-ban, RPM).
+    """
+    ring = [0] * ppr
+    edges = 0
+    a = b = -1
+    for i in range(n):
+        v = buf[i]
+        if v & 1:
+            continue # Felfutó él
+        t = v & 0x3FFFFFFE
+        k = edges % ppr
+        if edges >= ppr:
+            rpm = min(60000000 // max(1, time.ticks_diff(t, ring[k])), NONE)
+            med = max(min(a, b), min(max(a, b), rpm)) if a >= 0 else rpm
+            a, b = b, rpm
+            yield time.ticks_diff(t, t_step), med
+        ring[k] = t
+        edges += 1
+
+
+def analyze(buf, n, t_step, t_end, ppr):
+    """
+    Egy lépcső kiértékelése a rögzített élekből. t_step az ugrás, t_end a rögzítés vége (ticks_us).
+    Visszaad: (rpm0, final, peak, delay_ms, rise_ms, settle_ms, coast_ms); a peak felfelé a maximum,
+    lefelé a minimum.
+    """
+    tail_us = config.STEP_TAIL_MS * 1000
+    gap_us = config.STEP_STOP_GAP_MS * 1000
+    end_rel = time.ticks_diff(t_end, t_step)
+
+    # 1. menet: kiinduló és végső RPM, utolsó él
+    pre_sum = pre_n = fin_sum = fin_n = 0
+    last = None
+    for t, rpm in _revolutions(buf, n, t_step, ppr):
+        if t < 0:
+            pre_sum += rpm
+            pre_n += 1
+        elif t >= end_rel - tail_us:
+            fin_sum += rpm
+            fin_n += 1
+        last = t
+    rpm0 = pre_sum // pre_n if pre_n else 0
+    stopped = last is None or end_rel - last >= gap_us
+    final = 0 if stopped else (fin_sum // fin_n if fin_n else rpm0)
+    coast_ms = _ms(last) if stopped and last is not None and last >= 0 and final < rpm0 else NONE
+
+    # 2. menet: 10 / 90 %-os szint átlépése, szélső érték, utolsó sávon kívüli minta
+    delta = final - rpm0
+    rising = delta > 0
+    lvl10 = rpm0 + delta // 10
+    lvl90 = rpm0 + delta * 9 // 10
+    band = max(final * config.STEP_SETTLE_BAND_PERMILLE // 1000, config.STEP_SETTLE_MIN_RPM)
+    t10 = t90 = -1
+    peak = rpm0
+    settle = -1      # Az utolsó sávon kívüli minta utáni első minta ideje
+    outside = True
+    for t, rpm in _revolutions(buf, n, t_step, ppr):
+        if t < 0:
+            continue
+        if rising:
+            if t10 < 0 and rpm >= lvl10:
+                t10 = t
+            if t90 < 0 and rpm >= lvl90:
+                t90 = t
+            peak = max(peak, rpm)
+        else:
+            if t10 < 0 and rpm <= lvl10:
+                t10 = t
+            if t90 < 0 and rpm <= lvl90:
+                t90 = t
+            peak = min(peak, rpm)
+        if abs(rpm - final) > band:
+            outside = True
+        elif outside:
+            outside = False
+            settle = t
+    if stopped:
+        # Megállásnál az utolsó él a beállás; a lassú kifutás 10 %-a alatt már nincs él
+        if last is not None and last >= 0:
+            if t90 < 0 and not rising:
+                t90 = last
+            settle = last
+            outside = False
+    if abs(delta) < config.STEP_SETTLE_MIN_RPM:
+        t10 = t90 = -1 # Nincs érdemi változás
+    delay_ms = _ms(t10) if t10 >= 0 else NONE
+    rise_ms = _ms(t90 - t10) if t10 >= 0 and t90 >= t10 else NONE
+    settle_ms = _ms(settle) if settle >= 0 and not outside else NONE
+    return rpm0, final, peak, delay_ms, rise_ms, settle_ms, coast_ms
+
+
+def overshoot_permille(rec):
+    """Túllövés (felfelé) / alullövés (lefelé) a változás ezrelékében."""
+    rpm0, final, peak = rec[2], rec[3], rec[4]
+    delta = abs(final - rpm0)
+    if not delta:
+        return 0
+    over = peak - final if final > rpm0 else final - peak
+    return max(0, over) * 1000 // delta
+
+
+class StepResponseTest:
+    """A lépcsők ütemezése a logikai hurokból; a rögzítés a FanController él pufferébe megy."""
+    def __init__(self, fan, steps=None):
+        self.fan = fan
+        self.steps = steps or config.STEP_RESPONSE_STEPS
+        self.results = []        # (kiinduló %, cél %, rpm0, final, peak, delay, rise, settle, coast)
+        self.active = False
+        self.idx = 0
+        self.phase = DONE
+        self.phase_start = 0
+        self.prep_ms = 0
+        self.t_step = 0
+        self._settled = False
+        self.view_idx = -1       # Kijelzett eredmény (-1: a legutóbbi)
+
+    def start(self, now, settled=False):
+        """settled: a ventilátor már állandósult a kiinduló PWM-en, nem kell várni (sorozat teszt)."""
+        self.results = []
+        self.idx = 0
+        self.view_idx = -1
+        self.active = True
+        self._settled = settled
+        self._begin_step(now)
+
+    def stop(self):
+        """Megszakítás: a saját rögzítés lezárása és a puffer elengedése."""
+        if self.fan.cap_owner is self: # Csak a saját rögzítést (más, pl. soros dump, érintetlen marad)
+            self.fan.stop_capture(self)
+            self.fan.release_capture(self)
+        self.active = False
+        self.phase = DONE
+
+    def _begin_step(self, now):
+        start_duty = self.steps[self.idx][0]
+        # Ha a PWM már a kiinduló értéken van (előző lépcső vége), elég az előzmény rögzítés
+        same = self.fan.current_duty_percent == start_duty and (self.idx or self._settled)
+        self.prep_ms = 0 if same else config.STEP_PREP_MS
+        self.fan.set_duty_percent(start_duty)
+        self.phase = PREP
+        self.phase_start = now
+
+    def tick(self, now):
+        """Periodikus (logikai hurok): fázisváltások, a lépcső végén kiértékelés."""
+        if not self.active:
+            return
+        fan = self.fan
+        elapsed = time.ticks_diff(now, self.phase_start)
+        if self.phase == PREP:
+            # Amíg a puffer másé (soros 'capture' és kiírása) vagy parancs függ, várunk
+            if elapsed >= self.prep_ms and fan.start_capture(self):
+                self.phase = PRE
+                self.phase_start = now
+        elif self.phase == PRE:
+            if not fan.capture_done():
+                self.phase_start = now # Az előzmény a rögzítés tényleges indulásától számít
+            elif elapsed >= config.STEP_PRETRIGGER_MS:
+                fan.set_duty_percent(self.steps[self.idx][1])
+                self.t_step = time.ticks_us() & 0x3FFFFFFE
+                self.phase = STEP
+                self.phase_start = now
+        elif self.phase == STEP:
+            if elapsed >= config.STEP_CAPTURE_MS or fan.cap_idx >= fan.cap_len or self._stopped():
+                if fan.stop_capture(self):
+                    self.phase = STOP
+        elif self.phase == STOP:
+            if fan.capture_done():
+                self._finish_step(now)
+
+    def _stopped(self):
+        """Lefelé lépcsőnél korai vége: az utolsó él óta STEP_STOP_GAP_MS eltelt (a ventilátor áll)."""
+        start_duty, end_duty = self.steps[self.idx]
+        i = self.fan.cap_idx
+        if end_duty >= start_duty or i == 0:
+            return False
+        last = self.fan.cap_buf[i - 1] & 0x3FFFFFFE
+        if time.ticks_diff(last, self.t_step) < 0:
+            last = self.t_step # Az ugrás óta egy él sem jött
+        return time.ticks_diff(time.ticks_us() & 0x3FFFFFFE, last) >= config.STEP_STOP_GAP_MS * 1000
+
+    def _finish_step(self, now):
+        fan = self.fan
+        n = fan.cap_idx
+        t_step = self.t_step
+        if fan.cap_cmd_idx > 1:
+            # A PWM váltás pontos ideje (második magos módban a vezérlő mag rögzíti)
+            t_step = fan.cap_cmds[fan.cap_cmd_idx - 1] & 0x3FFFFF80
+        rec = self.steps[self.idx] + analyze(fan.cap_buf, n, t_step, fan.cap_end_us, config.TACH_PULSES_PER_REV)
+        if n >= fan.cap_len:
+            logger.warn("Ugrasvalasz: a rogzito puffer megtelt ({} el)", n)
+        self.results.append(rec)
+        self._save(rec)
+        self.idx += 1
+        if self.idx < len(self.steps):
+            self._begin_step(now)
+        else:
+            fan.release_capture(self)
+            fan.set_duty_percent(0)
+            self.active = False
+            self.phase = DONE
+
+    def _save(self, rec):
+        """Rekord hozzáfűzése a naplóhoz; a méret korlát felett a régi egy generációnyi előzmény lesz."""
+        try:
+            try:
+                if os.stat(config.STEP_LOG_FILE)[6] >= config.STEP_LOG_MAX_BYTES:
+                    os.rename(config.STEP_LOG_FILE, config.STEP_LOG_FILE + ".old")
+            except OSError:
+                pass
+            with open(config.STEP_LOG_FILE, "ab") as f:
+                f.write(struct.pack(_REC_FMT, *rec))
+        except OSError as e:
+            logger.error("Hiba az ugrasvalasz mentesekor: {}", e)
+
+    def overshoot(self, rec):
+        return overshoot_permille(rec)
+
+    def view_result(self):
+        """A kijelzett eredmény, vagy None, ha még nincs kész lépcső."""
+        if not self.results:
+            return None
+        return self.results[self.view_idx if self.view_idx >= 0 else -1]
+
+    def next_view(self):
+        """Kijelzett eredmény léptetése: legutóbbi -> 1. -> 2. ... -> legutóbbi."""
+        self.view_idx += 1
+        if self.view_idx >= len(self.results):
+            self.view_idx = -1
+
+
+def report_line(rec):
+    return "S," + ",".join(str(v) for v in rec[:5]) + f",{overshoot_permille(rec)}," + ",".join(str(v) for v in rec[5:])
+
+
+REPORT_HEADER = "SL,from,to,rpm0,final,peak,overshoot_permille,delay_ms,rise_ms,settle_ms,coast_ms"
+
+
+def log_records():
+    """A flash napló rekordjai időrendben (az előző generációval együtt)."""
+    rec = bytearray(REC_SIZE)
+    for name in (config.STEP_LOG_FILE + ".old", config.STEP_LOG_FILE):
+        try:
+            with open(name, "rb") as f:
+                while f.readinto(rec) == REC_SIZE:
+                    yield struct.unpack(_REC_FMT, rec)
+        except OSError:
+            pass
+
+# Utolsó módosítás: 2026. október 19. 21:00:00
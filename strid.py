@@ -0,0 +1,43 @@
+# Fájl helye: /strid.py
+# Funkció: Szöveg azonosítók a nyelvi string poolokhoz (DisplayManager.get_text paramétere).
+# GENERÁLT FÁJL - ne szerkeszd kézzel! Forrás: locale_xx.py, generátor: tools/build_locales.py
+
+from micropython import const
+
+APP_NAME = const(0)
+APP_SUB = const(1)
+INIT_HW = const(2)
+ERROR_INIT = const(3)
+MENU_TITLE = const(4)
+MODE_AUTO = const(5)
+MODE_MANUAL = const(6)
+MODE_TARGET = const(7)
+MODE_ENDURANCE = const(8)
+MODE_STEP = const(9)
+MODE_BATCH = const(10)
+MODE_SETTINGS = const(11)
+MODE_ABOUT = const(12)
+MODE_LANGUAGE = const(13)
+SET_LANG = const(14)
+SET_STEP = const(15)
+SET_DEBOUNCE = const(16)
+PWM = const(17)
+RPM = const(18)
+TARGET = const(19)
+TEMP = const(20)
+STALL_ALERT = const(21)
+BATCH_WAIT = const(22)
+BATCH_PASS = const(23)
+BATCH_FAIL = const(24)
+BTN_NAV = const(25)
+BTN_BACK = const(26)
+SAVED = const(27)
+UNIT_MS = const(28)
+UNIT_PCT = const(29)
+BACK = const(30)
+LANG_NAME = const(31)
+ABOUT_TEXT = const(32)
+
+COUNT = const(33)
+
+# Utolsó módosítás: 2026. október 19. 20:15:00
\ No newline at end of file
@@ -0,0 +1,130 @@
+# Fájl helye: /tools/bench_device.py
+# Funkció: Eszközön futtatható mikro-benchmarkok (mpremote run tools/bench_device.py).
+# A kijelző busz nélkül, egy 128x32-es memória framebufferen mér, hogy csak a rajzolás költsége látsszon.
+
+import framebuf
+import time
+import gc
+from array import array
+import bigfont
+import fixmath
+import strid
+
+ITERATIONS = 1000
+
+
+def _bench(name, fn):
+    gc.collect()
+    alloc_before = gc.mem_alloc()
+    t0 = time.ticks_us()
+    for i in range(ITERATIONS):
+        fn(i)
+    dt = time.ticks_diff(time.ticks_us(), t0)
+    alloc = gc.mem_alloc() - alloc_before
+    print(f"{name:<28} {dt // ITERATIONS:>6} us/hivas  {alloc // ITERATIONS:>5} B/hivas")
+    return dt
+
+
+def bench_rpm_readout():
+    """Nagy számjegyes RPM vs. a korábbi oled.text + f-string út."""
+    buf = bytearray(128 * 32 // 8)
+    fb = framebuf.FrameBuffer(buf, 128, 32, framebuf.MONO_VLSB)
+
+    def text_path(i):
+        fb.text(f"RPM:{1000 + i}", 0, 22, 1)
+
+    def big_path(i):
+        bigfont.draw_number(fb, 1000 + i, 0, 8, 5)
+
+    t_text = _bench("oled.text RPM", text_path)
+    t_big = _bench("bigfont.draw_number RPM", big_path)
+    print("bigfont / text arany: {:.2f}".format(t_big / t_text))
+
+
+def bench_fixmath():
+    """
+    Fixpontos magok vs. a lebegőpontos / sum() alapú változatok. A fixpontos utaknak hívásonként
+    0 B-ot kell foglalniuk (a lebegőpontos értékek a heapen jönnek létre).
+    """
+    ppr = 2
+    history = [0] * 5
+    avg = fixmath.MovingAverage(5)
+    samples = array('i', (1180, 1210, 1195, 2400, 1205, 1190, 1200))
+    tmp = array('i', (0 for _ in range(len(samples))))
+
+    def rpm_float(i):
+        return int((i / ppr) * (60000 / 1000))
+
+    def rpm_fix(i):
+        return fixmath.rpm_from_window(i, 1000000, ppr)
+
+    def duty_float(i):
+        return int((i % 101) / 100 * 65535)
+
+    def duty_fix(i):
+        return fixmath.duty_u16(i % 101)
+
+    def avg_sum(i):
+        history[i % 5] = i
+        return sum(history) // len(history)
+
+    def avg_fix(i):
+        return avg.push(i)
+
+    def median_sorted(i):
+        return sorted(samples)[len(samples) // 2]
+
+    def median_fix(i):
+        return fixmath.median(samples, tmp, len(samples))
+
+    for name, slow, fast in (("rpm", rpm_float, rpm_fix), ("duty_u16", duty_float, duty_fix),
+                             ("mozgoatlag", avg_sum, avg_fix), ("median7", median_sorted, median_fix)):
+        t_slow = _bench(name + " (float/sum)", slow)
+        t_fast = _bench(name + " (fixmath)", fast)
+        print("  gyorsulas: {:.2f}x".format(t_slow / max(1, t_fast)))
+
+    gc.collect()
+    gc.disable()
+    before = gc.mem_alloc()
+    for i in range(ITERATIONS):
+        rpm_fix(i)
+        duty_fix(i)
+        avg_fix(i)
+        median_fix(i)
+    used = gc.mem_alloc() - before
+    gc.enable()
+    print(f"fixmath heap foglalas: {used} B / {4 * ITERATIONS} hivas")
+    assert used == 0, "A fixpontos ut memoriat foglal!"
+
+
+def check_test_screen_alloc(frames=200):
+    """
+    Teszt képernyő heap foglalása állandósult állapotban (valódi kijelzővel futtatandó).
+    Bemelegítés után a GC-t kikapcsolva mérjük, hogy a gyűjtés ne torzítson.
+    """
+    from settings_manager import SettingsManager
+    from sensors import SensorSampler
+    from ui_display import DisplayManager
+
+    display = DisplayManager(SettingsManager(), SensorSampler())
+    for i in range(10):
+        display.draw_test_screen(strid.MODE_MANUAL, 40, 1200 + i, False)
+
+    gc.collect()
+    gc.disable()
+    before = gc.mem_alloc()
+    for i in range(frames):
+        display.draw_test_screen(strid.MODE_MANUAL, 40, 1200 + i, False)
+        display.draw_test_screen(strid.MODE_TARGET, 55, 1800 + i, False, target_rpm=2000)
+    used = gc.mem_alloc() - before
+    gc.enable()
+    print(f"draw_test_screen heap foglalas: {used} B / {2 * frames} kepkocka")
+    assert used == 0, "A teszt kepernyo renderelese foglal memoriat!"
+
+
+if __name__ == "__main__":
+    bench_rpm_readout()
+    bench_fixmath()
+    check_test_screen_alloc()
+
+# Utolsó módosítás: 2026. október 19. 19:15:00
\ No newline at end of file
@@ -0,0 +1,127 @@
+# Fájl helye: /tools/build_locales.py
+# Funkció: Host oldali build lépés. A locale_xx.py forrásokból nyelvenként egy indexelt
+# string poolt (lstr_xx.py) és a közös azonosító táblát (strid.py) generálja, közben
+# ellenőrzi, hogy minden nyelvben minden kulcs megvan-e, és hogy a kód csak létező azonosítót használ.
+# Használat: python tools/build_locales.py  (a projekt gyökeréből vagy bárhonnan)
+
+import os
+import re
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+REFERENCE_LANG = "en"   # A kulcsok sorrendjét és teljes listáját ez a nyelv adja
+DATE_LINE = "# Utolsó módosítás: 2026. október 19. 20:15:00"
+
+
+def load_module_dict(path, name):
+    """Egy forrás modul adott nevű globális változójának beolvasása importálás nélkül."""
+    scope = {}
+    with open(path, encoding="utf-8") as f:
+        exec(compile(f.read(), path, "exec"), scope)
+    return scope[name]
+
+
+def load_sources():
+    lang_names = load_module_dict(os.path.join(ROOT, "locales.py"), "LANG_NAMES")
+    tables = {}
+    for code in lang_names:
+        tables[code] = load_module_dict(os.path.join(ROOT, f"locale_{code}.py"), "STRINGS")
+    return lang_names, tables
+
+
+def check_tables(lang_names, tables):
+    """Hiányzó / fölösleges kulcsok és típuseltérések gyűjtése minden nyelvre."""
+    errors = []
+    ref = tables[REFERENCE_LANG]
+    for code, table in tables.items():
+        for key in ref:
+            if key not in table:
+                errors.append(f"{code}: hianyzo kulcs '{key}'")
+            elif type(table[key]) is not type(ref[key]):
+                errors.append(f"{code}: '{key}' tipusa elter ({type(table[key]).__name__})")
+        for key in table:
+            if key not in ref:
+                errors.append(f"{code}: ismeretlen kulcs '{key}' (nincs a(z) {REFERENCE_LANG} tablaban)")
+        if table.get("lang_name") != lang_names[code]:
+            errors.append(f"{code}: lang_name nem egyezik a locales.LANG_NAMES ertekevel")
+    return errors
+
+
+def check_code_references(keys):
+    """A kódban használt strid.XXX azonosítók mind léteznek-e."""
+    errors = []
+    known = {k.upper() for k in keys}
+    pattern = re.compile(r"\bstrid\.([A-Z][A-Z0-9_]*)")
+    for name in sorted(os.listdir(ROOT)):
+        if not name.endswith(".py") or name == "strid.py":
+            continue
+        with open(os.path.join(ROOT, name), encoding="utf-8") as f:
+            for lineno, line in enumerate(f, 1):
+                for ident in pattern.findall(line):
+                    if ident not in known and ident != "COUNT":
+                        errors.append(f"{name}:{lineno}: ismeretlen szoveg azonosito strid.{ident}")
+    return errors
+
+
+def py_literal(value, indent):
+    if isinstance(value, list):
+        pad = " " * (indent + 4)
+        items = "".join(f"{pad}{py_literal(v, indent + 4)},\n" for v in value)
+        return "(\n" + items + " " * indent + ")"
+    return '"' + value.replace("\\", "\\\\").replace('"', '\\"') + '"'
+
+
+def write(path, text):
+    with open(path, "w", encoding="utf-8") as f:
+        f.write(text)
+
+
+def generate(lang_names, tables):
+    keys = list(tables[REFERENCE_LANG])
+
+    lines = [
+        "# Fájl helye: /strid.py",
+        "# Funkció: Szöveg azonosítók a nyelvi string poolokhoz (DisplayManager.get_text paramétere).",
+        "# GENERÁLT FÁJL - ne szerkeszd kézzel! Forrás: locale_xx.py, generátor: tools/build_locales.py",
+        "",
+        "from micropython import const",
+        "",
+    ]
+    for i, key in enumerate(keys):
+        lines.append(f"{key.upper()} = const({i})")
+    lines += ["", f"COUNT = const({len(keys)})", "", DATE_LINE]
+    write(os.path.join(ROOT, "strid.py"), "\n".join(lines))
+
+    for code, table in tables.items():
+        lines = [
+            f"# Fájl helye: /lstr_{code}.py",
+            f"# Funkció: {lang_names[code]} string pool, strid szerint indexelve.",
+            "# GENERÁLT FÁJL - ne szerkeszd kézzel! Forrás: locale_"
+            + code + ".py, generátor: tools/build_locales.py",
+            "",
+            "# Konstans tuple: frozen modulként a flash-ben marad, futás közben sem szótár, sem másolat nem készül.",
+            "STRINGS = (",
+        ]
+        for i, key in enumerate(keys):
+            lines.append(f"    {py_literal(table[key], 4)},  # {i}: {key}")
+        lines += [")", "", DATE_LINE]
+        write(os.path.join(ROOT, f"lstr_{code}.py"), "\n".join(lines))
+    return keys
+
+
+def main():
+    lang_names, tables = load_sources()
+    errors = check_tables(lang_names, tables)
+    errors += check_code_references(tables[REFERENCE_LANG])
+    if errors:
+        for e in errors:
+            print("HIBA:", e)
+        sys.exit(1)
+    keys = generate(lang_names, tables)
+    print(f"{len(tables)} nyelv, {len(keys)} szoveg azonosito generalva.")
+
+
+if __name__ == "__main__":
+    main()
+
+# Utolsó módosítás: 2026. október 19. 20:15:00
\ No newline at end of file
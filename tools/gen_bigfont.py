@@ -0,0 +1,124 @@
+# Fájl helye: /tools/gen_bigfont.py
+# Funkció: Host oldali generátor a bigfont.py nagy számjegy fontjához (16x24, MONO_VLSB).
+# Használat: python tools/gen_bigfont.py > bigfont.py
+
+GLYPH_W = 16
+GLYPH_H = 24
+INK_W = 14   # Tényleges rajzolt szélesség, a maradék 2 px betűköz
+
+# Szegmens téglalapok (x0, y0, x1, y1) - 7 szegmenses, vastag vonalas rajzolat
+SEGMENTS = {
+    "a": (0, 0, INK_W - 1, 2),
+    "b": (INK_W - 3, 0, INK_W - 1, 12),
+    "c": (INK_W - 3, 11, INK_W - 1, GLYPH_H - 1),
+    "d": (0, GLYPH_H - 3, INK_W - 1, GLYPH_H - 1),
+    "e": (0, 11, 2, GLYPH_H - 1),
+    "f": (0, 0, 2, 12),
+    "g": (0, 10, INK_W - 1, 12),
+}
+
+DIGITS = {
+    "0": "abcdef",
+    "1": "bc",
+    "2": "abged",
+    "3": "abgcd",
+    "4": "fgbc",
+    "5": "afgcd",
+    "6": "afgedc",
+    "7": "abc",
+    "8": "abcdefg",
+    "9": "abcdfg",
+    " ": "",
+}
+
+GLYPH_ORDER = "0123456789 "
+
+
+def render(segs):
+    """Egy karakter pixelmátrixa (sor-major, 0/1)."""
+    pix = [[0] * GLYPH_W for _ in range(GLYPH_H)]
+    for s in segs:
+        x0, y0, x1, y1 = SEGMENTS[s]
+        for y in range(y0, y1 + 1):
+            for x in range(x0, x1 + 1):
+                pix[y][x] = 1
+    return pix
+
+
+def to_mono_vlsb(pix):
+    """Pixelmátrix -> MONO_VLSB bájtok (lapok egymás után, lapon belül oszloponként)."""
+    out = bytearray()
+    for page in range(GLYPH_H // 8):
+        for x in range(GLYPH_W):
+            b = 0
+            for bit in range(8):
+                if pix[page * 8 + bit][x]:
+                    b |= 1 << bit
+            out.append(b)
+    return bytes(out)
+
+
+def main():
+    data = b"".join(to_mono_vlsb(render(DIGITS[c])) for c in GLYPH_ORDER)
+    glyph_size = GLYPH_W * GLYPH_H // 8
+    print(TEMPLATE_HEAD)
+    print("_DATA = (")
+    for i, c in enumerate(GLYPH_ORDER):
+        chunk = data[i * glyph_size:(i + 1) * glyph_size]
+        print(f"    # '{c}'")
+        for j in range(0, glyph_size, 16):
+            print("    b\"" + "".join(f"\\x{v:02x}" for v in chunk[j:j + 16]) + "\"")
+    print(")")
+    print(TEMPLATE_TAIL, end="")
+
+
+TEMPLATE_HEAD = '''# Fájl helye: /bigfont.py
+# Funkció: Előre kiszámolt 16x24-es nagy számjegy font (MONO_VLSB) a jól olvasható RPM kijelzéshez.
+# GENERÁLT FÁJL - ne szerkeszd kézzel! Forrás: tools/gen_bigfont.py
+
+from micropython import const
+import framebuf
+
+WIDTH = const(16)
+HEIGHT = const(24)
+_GLYPH_SIZE = const(48)   # 16 oszlop * 3 lap
+_BLANK = const(10)        # Üres karakter indexe (vezető nullák helyett)
+_MAX_VALUE = (0, 9, 99, 999, 9999, 99999, 999999)
+'''
+
+TEMPLATE_TAIL = '''
+# Blit forrás leírók egyszer, importáláskor készülnek; a glyph bájtok a (frozen) modul
+# konstansában maradnak, rajzoláskor nincs sem másolás, sem objektum foglalás.
+_mv = memoryview(_DATA)
+_GLYPHS = tuple(
+    (_mv[i * _GLYPH_SIZE:(i + 1) * _GLYPH_SIZE], WIDTH, HEIGHT, framebuf.MONO_VLSB)
+    for i in range(11)
+)
+del _mv
+
+
+def draw_number(fb, value, x, y, digits):
+    """
+    Nemnegatív egész kirajzolása jobbra igazítva, `digits` karakter szélességben.
+    Stringformázás nélkül, számjegyenként blitel; a túl nagy értéket telítésbe viszi.
+    """
+    if value < 0:
+        value = 0
+    elif value > _MAX_VALUE[digits]:
+        value = _MAX_VALUE[digits]
+    pos_x = x + (digits - 1) * WIDTH
+    for i in range(digits):
+        if i > 0 and value == 0:
+            fb.blit(_GLYPHS[_BLANK], pos_x, y)
+        else:
+            fb.blit(_GLYPHS[value % 10], pos_x, y)
+            value //= 10
+        pos_x -= WIDTH
+
+# Utolsó módosítás: 2026. október 19. 09:10:00'''
+
+
+if __name__ == "__main__":
+    main()
+
+# Utolsó módosítás: 2026. október 19. 09:10:00
\ No newline at end of file
@@ -0,0 +1,139 @@
+# Fájl helye: /tools/host_control_core.py
+# Funkció: A második magos vezérlő hurok (control_core) hoston, szálakkal emulálva: egy szál adja
+# a TACH éleket, a "vezérlő mag" a saját szálán fut, a fő szál pedig UI terhelést szimulál
+# (blokkoló kijelző frissítés, szemét + GC). A végén a jitter statisztika és a mért RPM-ek.
+# Használat: python tools/host_control_core.py [másodperc]
+# Megjegyzés: CPython alatt a GIL miatt a jitter nagyobb, mint az eszközön; a protokollt,
+# a gyűrűket és a logikát ellenőrzi, nem a valós idejű viselkedést.
+
+import gc
+import os
+import sys
+import threading
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.join(ROOT, "tools"))
+
+import replay  # A machine / micropython vázakat és a szimulált lábat / PWM-et adja
+import config
+import fan_control
+import control_core
+
+
+class HostTime:
+    """A MicroPython 'time' modul ticks_* és sleep_* függvényei valós idővel."""
+    _PERIOD = 1 << 30
+
+    def ticks_us(self):
+        return (time.perf_counter_ns() // 1000) & (self._PERIOD - 1)
+
+    def ticks_ms(self):
+        return (time.perf_counter_ns() // 1000000) & (self._PERIOD - 1)
+
+    def ticks_add(self, a, b):
+        return (a + b) & (self._PERIOD - 1)
+
+    def ticks_diff(self, a, b):
+        d = (a - b) & (self._PERIOD - 1)
+        return d - self._PERIOD if d >= self._PERIOD // 2 else d
+
+    def sleep_us(self, us):
+        time.sleep(us / 1e6)
+
+    def sleep_ms(self, ms):
+        time.sleep(ms / 1e3)
+
+
+class HostTimer:
+    """machine.Timer periodikus módja egy külön szálon (a hard callback megfelelője)."""
+    PERIODIC = 1
+    ONE_SHOT = 0
+
+    def __init__(self, *args, **kwargs):
+        self.running = False
+
+    def init(self, mode=PERIODIC, period=0, callback=None, hard=False):
+        self.running = True
+        threading.Thread(target=self._run, args=(period / 1000, callback), daemon=True).start()
+
+    def _run(self, period, callback):
+        deadline = time.perf_counter()
+        while self.running:
+            deadline += period
+            time.sleep(max(0.0, deadline - time.perf_counter()))
+            callback(self)
+
+    def deinit(self):
+        self.running = False
+
+
+def edge_source(fan, stop):
+    """Ventilátor modell: a fordulatszám a kitöltés 30-szorosa, ppr impulzus / fordulat."""
+    pin = fan.tach_pin
+    while not stop.is_set():
+        rpm = fan.current_duty_percent * 30
+        if rpm <= 0:
+            time.sleep(0.01)
+            continue
+        half = 60.0 / (rpm * config.TACH_PULSES_PER_REV) / 2
+        pin.drive(0)
+        time.sleep(half)
+        pin.drive(1)
+        time.sleep(half)
+
+
+def main():
+    seconds = float(sys.argv[1]) if len(sys.argv) > 1 else 10
+    sys.setswitchinterval(0.0002)
+    clock = HostTime()
+    fan_control.time = clock
+    fan_control.Pin = replay.SimPin
+    fan_control.PWM = replay.SimPWM
+    fan_control.Timer = HostTimer
+    control_core.time = clock
+
+    fan = fan_control.FanController()
+    core = control_core.ControlCore(fan)
+    core.start()
+    stop = threading.Event()
+    threading.Thread(target=edge_source, args=(fan, stop), daemon=True).start()
+
+    duties = [30, 60, 100, 50]
+    windows = []
+    t_end = time.monotonic() + seconds
+    step = 0
+    fan.set_duty_percent(duties[0])
+    while time.monotonic() < t_end:
+        # UI terhelés: ~20 ms blokkoló "kijelző frissítés", majd szemét és gyűjtés
+        busy_end = time.perf_counter() + 0.02
+        while time.perf_counter() < busy_end:
+            pass
+        junk = [bytearray(64) for _ in range(200)]
+        del junk
+        gc.collect()
+        while core.poll_window():
+            windows.append((core.view.current_duty_percent, core.view.current_rpm))
+        if len(windows) // 3 != step and len(windows) // 3 < len(duties):
+            step = len(windows) // 3
+            fan.set_duty_percent(duties[step])
+        time.sleep(0.03)
+
+    stop.set()
+    core.stop()
+    fan.stop_window_timer()
+    ticks, late_avg, late_max, overruns, dropped = core.jitter_report()
+    print(f"Vezerlo hurok: periodus {core.period_us} us, {ticks} ciklus, keses atlag {late_avg} us, "
+          f"max {late_max} us, tulfutas {overruns}, eldobott rekord {dropped}")
+    st = fan.window_stats
+    print(f"Meresi ablak: {st[0]} db, elteres atlag {st[1] // max(1, st[0])} us, max {st[2]} us, "
+          f"kihagyott {st[3]}")
+    print("Ablakok (PWM %, RPM): " + " ".join(f"{d}:{r}" for d, r in windows))
+    if core.error:
+        print(f"Hiba a vezerlo szalon: {core.error!r}")
+
+
+if __name__ == "__main__":
+    main()
+
+# Utolsó módosítás: 2026. október 19. 23:00:00
\ No newline at end of file
@@ -0,0 +1,158 @@
+# Fájl helye: /tools/oled_viewer.py
+# Funkció: Host oldali néző a kijelző tükrözéshez ('mirror on'): a "#FB" (lap, RLE) és "#FE"
+# (kép vége) sorokból visszaállítja a képet, és a terminálban rajzolja ki (félblokk karakterekkel),
+# opcionálisan képkockánként PGM fájlba menti (képernyő felvétel a QA dokumentációhoz).
+# Használat: python tools/oled_viewer.py /dev/ttyACM0        (élő kép, pyserial kell)
+#            python tools/oled_viewer.py naplo.txt [--pgm kepek/] [--scale 4]   (vagy '-': szabványos bemenet)
+
+import os
+import sys
+
+ANSI_HOME = "\x1b[H"
+ANSI_CLEAR = "\x1b[2J"
+HALF_BLOCKS = " ▀▄█"  # [felső, alsó] pixel -> karakter
+
+
+def rle_decode(hexdata, width):
+    """Egy lap [darab, bájt] párjainak kibontása; hibás hossznál None."""
+    data = bytes.fromhex(hexdata)
+    out = bytearray()
+    for i in range(0, len(data) - 1, 2):
+        out.extend(bytes((data[i + 1],)) * data[i])
+    return out if len(out) == width else None
+
+
+class Screen:
+    """A panel képe MONO_VLSB elrendezésben: lapok (8 sor) egymás után, laponként width bájt."""
+    def __init__(self):
+        self.width = 0
+        self.height = 0
+        self.buf = bytearray()
+        self.synced = False   # Volt már kulcskép (addig a különbség képek nem rajzolhatók)
+        self.pending = {}     # Az aktuális kép lapjai a "#FE" sorig
+        self.pending_seq = None  # Az összegyűjtött lapok képsorszáma
+        self.expected = None  # A következő várt képsorszám (a "#FE" sorokból, 16 bites)
+        self.frames = 0
+        self.lost = 0         # Hibás / hiányzó adatú képek
+
+    def feed(self, line):
+        """Egy sor feldolgozása; igazat ad, ha kész (kirajzolható) kép állt elő."""
+        if line.startswith("#FB,"):
+            parts = line.split(",")
+            if len(parts) == 4:
+                seq = int(parts[1])
+                if seq != self.pending_seq:
+                    # Új kép kezdődött, de az előző "#FE" sora elveszett
+                    if self.pending:
+                        self._gap()
+                    self.pending, self.pending_seq = {}, seq
+                self.pending[int(parts[2])] = parts[3]
+            return False
+        if not line.startswith("#FE,"):
+            return False
+        parts = line.split(",")
+        seq = int(parts[1])
+        if self.expected is not None and seq != self.expected:
+            self._gap() # Kimaradt kép: a különbség képek a következő kulcsképig nem rajzolhatók
+        self.expected = (seq + 1) & 0xFFFF
+        if self.pending and self.pending_seq != seq:
+            self.pending = {} # A lapok egy másik (lezáratlan) képhez tartoztak
+        self.pending_seq = None
+        key = parts[2] == "K"
+        width, height = int(parts[3]), int(parts[4])
+        pages, self.pending = self.pending, {}
+        if key and (width, height) != (self.width, self.height):
+            self.width, self.height = width, height
+            self.buf = bytearray(width * height // 8)
+        if not key and not self.synced:
+            return False
+        for page, hexdata in pages.items():
+            data = rle_decode(hexdata, self.width)
+            if data is None or page >= self.height // 8:
+                self.lost += 1
+                self.synced = False  # A következő kulcsképig nem bízunk a képben
+                return False
+            self.buf[page * self.width:(page + 1) * self.width] = data
+        self.synced = True
+        self.frames += 1
+        return True
+
+    def _gap(self):
+        self.lost += 1
+        self.synced = False
+
+    def pixel(self, x, y):
+        return (self.buf[(y // 8) * self.width + x] >> (y % 8)) & 1
+
+    def render_text(self):
+        rows = []
+        for y in range(0, self.height, 2):
+            rows.append("".join(HALF_BLOCKS[self.pixel(x, y) | (self.pixel(x, y + 1) << 1)]
+                                for x in range(self.width)))
+        return "\n".join(rows)
+
+    def save_pgm(self, path, scale):
+        w, h = self.width * scale, self.height * scale
+        out = bytearray()
+        for y in range(h):
+            out.extend(bytes(255 if self.pixel(x // scale, y // scale) else 0 for x in range(w)))
+        with open(path, "wb") as f:
+            f.write(b"P5\n%d %d\n255\n" % (w, h))
+            f.write(out)
+
+
+def open_source(name):
+    """Soros port (/dev/..., COMx) élő olvasásra, egyébként fájl vagy '-' a szabványos bemenethez."""
+    if name == "-":
+        return sys.stdin, False
+    if name.startswith("/dev/") or name.upper().startswith("COM"):
+        try:
+            import serial
+        except ImportError:
+            raise SystemExit("Soros porthoz a pyserial csomag kell (pip install pyserial)")
+        port = serial.Serial(name, 115200, timeout=1)
+        port.write(b"mirror on\r\n")
+
+        def lines():
+            while True:
+                raw = port.readline()
+                if raw:
+                    yield raw.decode(errors="replace")
+        return lines(), True
+    return open(name, errors="replace"), False
+
+
+def main():
+    args = sys.argv[1:]
+    if not args:
+        raise SystemExit("Hasznalat: oled_viewer.py <port|fajl|-> [--pgm mappa] [--scale n]")
+    source = args[0]
+    pgm_dir = args[args.index("--pgm") + 1] if "--pgm" in args else None
+    scale = int(args[args.index("--scale") + 1]) if "--scale" in args else 4
+    if pgm_dir:
+        os.makedirs(pgm_dir, exist_ok=True)
+
+    lines, live = open_source(source)
+    screen = Screen()
+    if live:
+        sys.stdout.write(ANSI_CLEAR)
+    try:
+        for line in lines:
+            if not screen.feed(line.strip()):
+                continue
+            if pgm_dir:
+                screen.save_pgm(os.path.join(pgm_dir, "frame_%05d.pgm" % screen.frames), scale)
+            if live:
+                sys.stdout.write(ANSI_HOME + screen.render_text() + f"\nkep {screen.frames}, hibas {screen.lost}\n")
+                sys.stdout.flush()
+    except KeyboardInterrupt:
+        pass
+    if not live and screen.frames:
+        print(screen.render_text())
+    print(f"Kepek: {screen.frames}, hibas: {screen.lost}")
+
+
+if __name__ == "__main__":
+    main()
+
+# Utolsó módosítás: 2026. október 19. 22:30:00
@@ -0,0 +1,505 @@
+# Fájl helye: /tools/replay.py
+# Funkció: TACH felvételek (.ftr) visszajátszása a FanController-be és más RPM becslőkbe szimulált
+# órával, mintha a lábról jönnének; benchmark pontosságra, késleltetésre, CPU időre és elakadás jelzésre.
+# Használat (a projekt gyökeréből, hoston; MicroPythonon is fut, ha a fájlok fel vannak töltve):
+#   python tools/replay.py convert capture.txt fan1.ftr   (a 'capture' soros kimenetből)
+#   python tools/replay.py synth synth.ftr                (szintetikus felvétel a harness ellenőrzéséhez)
+#   python tools/replay.py bench corpus/*.ftr             (becslők összehasonlítása a korpuszon)
+#   python tools/replay.py filters corpus/*.ftr [lánc...]  (RPM szűrő láncok késése és zaja a firmware-ben)
+
+import os
+import sys
+import time
+
+HOST = sys.implementation.name != "micropython"
+if HOST:
+    ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    sys.path.insert(0, ROOT)
+    sys.path.insert(0, os.path.join(ROOT, "tools"))
+    # Hoston nincs machine / micropython modul: a firmware modulok importjához elég egy váz,
+    # a tényleges lábakat és PWM-et lent a szimulált osztályok adják.
+    import types
+    _mp = types.ModuleType("micropython")
+    _mp.const = lambda x: x
+    _mp.native = _mp.viper = lambda f: f
+    sys.modules.setdefault("micropython", _mp)
+    # A viper típusjelölések (ptr8 / ptr32) CPythonban is kiértékelődnek a def-nél
+    import builtins
+    builtins.ptr8 = builtins.ptr16 = builtins.ptr32 = object
+    _machine = types.ModuleType("machine")
+    _machine.Pin = _machine.PWM = _machine.Timer = object
+    sys.modules.setdefault("machine", _machine)
+    _asyncio = types.ModuleType("uasyncio")
+    _asyncio.ThreadSafeFlag = lambda: types.SimpleNamespace(set=lambda: None)
+    sys.modules.setdefault("uasyncio", _asyncio)
+
+import config
+import fan_control
+import rpm_filters
+import tachrec
+
+TICKS_PERIOD = 1 << 30
+POLL_US = 100000             # A firmware _task_update_fan periódusa
+SETTLE_EXCLUDE_US = 2000000  # Parancs után ennyi ideig nem számítunk állandósult hibát
+STOP_GAP_US = 1000000        # Ennyi él nélkül a referencia 0 RPM
+
+
+def _cpu_ns():
+    if HOST:
+        return time.perf_counter_ns()
+    return time.ticks_us() * 1000
+
+
+# --- Szimulált hardver ---
+
+class SimClock:
+    """A firmware 'time' moduljának helyettesítője; a harness lépteti az időt."""
+    def __init__(self):
+        self.us = 0
+
+    def ticks_us(self):
+        return self.us & (TICKS_PERIOD - 1)
+
+    def ticks_ms(self):
+        return (self.us // 1000) & (TICKS_PERIOD - 1)
+
+    def ticks_add(self, a, b):
+        return (a + b) & (TICKS_PERIOD - 1)
+
+    def ticks_diff(self, a, b):
+        d = (a - b) & (TICKS_PERIOD - 1)
+        return d - TICKS_PERIOD if d >= TICKS_PERIOD // 2 else d
+
+
+class SimPin:
+    IN = 0
+    OUT = 1
+    PULL_UP = 1
+    IRQ_FALLING = 4
+    IRQ_RISING = 8
+
+    def __init__(self, *args, **kwargs):
+        self.level = 1
+        self.handler = None
+        self.trigger = 0
+
+    def irq(self, trigger=0, handler=None, hard=False):
+        self.trigger = trigger
+        self.handler = handler
+
+    def value(self):
+        return self.level
+
+    def drive(self, level):
+        """Él a lábon: a beállított megszakítás kezelő hívása, ha az él irányára figyel."""
+        if level == self.level:
+            return
+        self.level = level
+        edge = SimPin.IRQ_FALLING if level == 0 else SimPin.IRQ_RISING
+        if self.handler and self.trigger & edge:
+            self.handler(self)
+
+
+class SimTimer:
+    """Hardver időzítő: a harness a szimulált időben, eseményként hívja a callbacket."""
+    PERIODIC = 1
+    ONE_SHOT = 0
+    clock = None
+    active = []
+
+    def __init__(self, *args, **kwargs):
+        self.callback = None
+        self.period_us = 0
+        self.mode = SimTimer.PERIODIC
+        self.next_us = 0
+
+    def init(self, mode=PERIODIC, period=0, callback=None, hard=False):
+        self.mode = mode
+        self.period_us = period * 1000
+        self.callback = callback
+        self.next_us = SimTimer.clock.us + self.period_us
+        if self not in SimTimer.active:
+            SimTimer.active.append(self)
+
+    def deinit(self):
+        if self in SimTimer.active:
+            SimTimer.active.remove(self)
+
+    def fire(self):
+        if self.mode == SimTimer.PERIODIC:
+            self.next_us += self.period_us
+        else:
+            self.deinit()
+        self.callback(self)
+
+
+class SimPWM:
+    def __init__(self, pin):
+        self.duty = 0
+
+    def freq(self, f):
+        pass
+
+    def duty_u16(self, v):
+        self.duty = v
+
+
+# --- Becslők (közös felület: edge(t, szint), command(kitöltés), poll(t) -> rpm vagy None) ---
+
+class FirmwareEstimator:
+    """
+    A valódi FanController: ablakos számlálás + mozgóátlag, beépített elakadás jelzéssel.
+    Ha config.WINDOW_TIMER be van kapcsolva, az ablakot a szimulált hardver időzítő zárja.
+    """
+    name = "firmware"
+
+    def __init__(self, rec, clock):
+        fan_control.time = clock
+        fan_control.Pin = SimPin
+        fan_control.PWM = SimPWM
+        fan_control.Timer = SimTimer
+        self.fan = fan_control.FanController()
+
+    def edge(self, t, level):
+        self.fan.tach_pin.drive(level)
+
+    def command(self, duty):
+        self.fan.set_duty_percent(duty)
+
+    def poll(self, t):
+        if self.fan.calculate_rpm():
+            return self.fan.current_rpm
+        return None
+
+    def stalled(self):
+        return self.fan.stall_detected
+
+
+class WindowEstimator:
+    """Nyers ablakos számlálás átlagolás nélkül (a firmware ablakhosszával)."""
+    name = "window"
+
+    def __init__(self, rec, clock):
+        self.ppr = rec.ppr
+        self.count = 0
+        self.window_start = 0
+        self.rpm = 0
+
+    def edge(self, t, level):
+        if level == 0:
+            self.count += 1
+
+    def command(self, duty):
+        pass
+
+    def poll(self, t):
+        dt = t - self.window_start
+        if dt < config.RPM_UPDATE_INTERVAL_MS * 1000:
+            return None
+        self.rpm = self.count * 60000000 // (self.ppr * dt)
+        self.count = 0
+        self.window_start = t
+        return self.rpm
+
+
+class PeriodEstimator:
+    """Reciprok becslés: az utolsó teljes fordulat ideje (ppr lefutó él), minden lekérdezéskor."""
+    name = "period"
+
+    def __init__(self, rec, clock):
+        self.ppr = rec.ppr
+        self.times = []
+
+    def edge(self, t, level):
+        if level == 0:
+            self.times.append(t)
+            if len(self.times) > self.ppr + 1:
+                self.times.pop(0)
+
+    def command(self, duty):
+        pass
+
+    def poll(self, t):
+        if len(self.times) <= self.ppr or t - self.times[-1] > STOP_GAP_US:
+            return 0
+        return 60000000 // (self.times[-1] - self.times[0])
+
+
+class PeriodWindowEstimator:
+    """Az utolsó ablakban (RPM_UPDATE_INTERVAL_MS) mért lefutó élek átlagos periódusa."""
+    name = "period_win"
+
+    def __init__(self, rec, clock):
+        self.ppr = rec.ppr
+        self.times = []
+
+    def edge(self, t, level):
+        if level == 0:
+            self.times.append(t)
+
+    def command(self, duty):
+        pass
+
+    def poll(self, t):
+        horizon = t - config.RPM_UPDATE_INTERVAL_MS * 1000
+        while self.times and self.times[0] < horizon:
+            self.times.pop(0)
+        if len(self.times) < 2:
+            return 0
+        period = (self.times[-1] - self.times[0]) / (len(self.times) - 1)
+        return int(60000000 / (period * self.ppr))
+
+
+ESTIMATORS = [FirmwareEstimator, WindowEstimator, PeriodEstimator, PeriodWindowEstimator]
+
+
+def filter_estimator(spec):
+    """A firmware becslő egy rögzített RPM szűrő lánccal (rpm_filters leírás, pl. "median3,sma5")."""
+    class FilteredFirmware(FirmwareEstimator):
+        name = spec or "nyers"
+
+        def __init__(self, rec, clock):
+            FirmwareEstimator.__init__(self, rec, clock)
+            self.fan.rpm_filter = rpm_filters.build(spec)
+    return FilteredFirmware
+
+
+# --- Referencia és visszajátszás ---
+
+def reference(rec):
+    """
+    Nem kauzális referencia RPM függvény: a t-t tartalmazó, középre illesztett fordulat ideje.
+    Hosszú él nélküli szakaszban 0.
+    """
+    falling = [t for t, level in rec.edges if level == 0]
+    ppr = rec.ppr
+
+    def ref(t):
+        lo, hi = 0, len(falling)
+        while lo < hi:
+            mid = (lo + hi) // 2
+            if falling[mid] <= t:
+                lo = mid + 1
+            else:
+                hi = mid
+        j = lo - 1  # Utolsó él t előtt
+        if j < 0 or j + 1 >= len(falling) or falling[j + 1] - falling[j] > STOP_GAP_US:
+            return 0
+        a = max(0, j - ppr // 2)
+        b = min(len(falling) - 1, a + ppr)
+        a = b - ppr
+        if a < 0:
+            return 0
+        return 60000000 // (falling[b] - falling[a])
+    return ref
+
+
+def replay(rec, estimator_cls):
+    """Egy felvétel lejátszása egy becslőn. Eredmény: kimenetek, elakadás idők, CPU idő."""
+    clock = SimClock()
+    SimTimer.clock = clock
+    SimTimer.active = []
+    est = estimator_cls(rec, clock)
+    outputs = []
+    stall_times = []
+    cpu_edge = 0
+    cpu_poll = 0
+    polls = 0
+    duty = 0
+    ei = ci = 0
+    next_poll = POLL_US
+    end = rec.duration_us() + POLL_US
+    while next_poll <= end:
+        # A következő esemény: parancs, él, időzítő vagy lekérdezés (azonos időnél ebben a sorrendben)
+        t_cmd = rec.cmds[ci][0] if ci < len(rec.cmds) else end + 1
+        t_edge = rec.edges[ei][0] if ei < len(rec.edges) else end + 1
+        timer = min(SimTimer.active, key=lambda tm: tm.next_us) if SimTimer.active else None
+        t_timer = timer.next_us if timer else end + 1
+        if t_cmd <= t_edge and t_cmd <= next_poll and t_cmd <= t_timer:
+            clock.us = t_cmd
+            duty = rec.cmds[ci][1]
+            est.command(duty)
+            ci += 1
+        elif t_edge <= next_poll and t_edge <= t_timer:
+            clock.us = t_edge
+            c0 = _cpu_ns()
+            est.edge(t_edge, rec.edges[ei][1])
+            cpu_edge += _cpu_ns() - c0
+            ei += 1
+        elif t_timer <= next_poll:
+            clock.us = t_timer
+            c0 = _cpu_ns()
+            timer.fire()
+            cpu_poll += _cpu_ns() - c0
+        else:
+            clock.us = next_poll
+            c0 = _cpu_ns()
+            rpm = est.poll(next_poll)
+            cpu_poll += _cpu_ns() - c0
+            polls += 1
+            if rpm is not None:
+                outputs.append((next_poll, rpm, duty))
+                stalled = est.stalled() if hasattr(est, "stalled") else (rpm == 0 and duty > config.STALL_THRESHOLD_DUTY)
+                if stalled:
+                    stall_times.append(next_poll)
+            next_poll += POLL_US
+    return {"outputs": outputs, "stalls": stall_times, "cpu_edge_ns": cpu_edge,
+            "cpu_poll_ns": cpu_poll, "polls": polls, "edges": len(rec.edges)}
+
+
+def _settle_time(samples, final, t0):
+    """Az első időpont t0 után, ahonnan minden minta a végérték sávjában marad."""
+    band = max(30, final * 3 // 100)
+    settled = None
+    for t, v in samples:
+        if abs(v - final) <= band:
+            if settled is None:
+                settled = t
+        else:
+            settled = None
+    return None if settled is None else settled - t0
+
+
+def score(rec, result, ref):
+    """Pontosság (állandósult hiba), késleltetés (parancs utáni beállás a referenciához képest), elakadás késés."""
+    outputs = result["outputs"]
+    cmd_times = [t for t, _ in rec.cmds[1:]]
+    errors = []
+    rel = []
+    steps = []  # Egymás utáni kimenetek különbsége a referencia változásán felül (zaj)
+    prev = None
+    for t, rpm, _ in outputs:
+        if any(0 <= t - c < SETTLE_EXCLUDE_US for c in cmd_times):
+            prev = None
+            continue
+        r = ref(t)
+        errors.append(abs(rpm - r))
+        if r >= 100:
+            rel.append(abs(rpm - r) / r)
+        if prev is not None:
+            steps.append(abs((rpm - r) - prev))
+        prev = rpm - r
+
+    latencies = []
+    bounds = cmd_times + [rec.duration_us()]
+    for i in range(len(cmd_times)):
+        t0, t1 = bounds[i], bounds[i + 1]
+        est = [(t, rpm) for t, rpm, _ in outputs if t0 <= t < t1]
+        if len(est) < 2:
+            continue
+        final = ref(t1 - POLL_US)
+        ref_samples = [(t, ref(t)) for t, _ in est]
+        t_ref = _settle_time(ref_samples, final, t0)
+        t_est = _settle_time(est, final, t0)
+        if t_ref is not None and t_est is not None:
+            latencies.append(t_est - t_ref)
+
+    # Elakadás: a referencia szerint áll a ventilátor, miközben a kitöltés a küszöb felett van
+    stall_lag = None
+    for t, _, duty in outputs:
+        if duty > config.STALL_THRESHOLD_DUTY and ref(t) == 0:
+            flagged = [s for s in result["stalls"] if s >= t]
+            if flagged:
+                stall_lag = flagged[0] - t
+            break
+
+    return {
+        "mae": sum(errors) / len(errors) if errors else 0.0,
+        "max": max(errors) if errors else 0,
+        "mae_pct": 100.0 * sum(rel) / len(rel) if rel else 0.0,
+        "noise": sum(steps) / len(steps) if steps else 0.0,
+        "latency_ms": sum(latencies) / len(latencies) / 1000 if latencies else None,
+        "cpu_poll_us": result["cpu_poll_ns"] / max(1, result["polls"]) / 1000,
+        "cpu_edge_us": result["cpu_edge_ns"] / max(1, result["edges"]) / 1000,
+        "stall_lag_ms": None if stall_lag is None else stall_lag / 1000,
+    }
+
+
+def _mean(values):
+    values = [v for v in values if v is not None]
+    return sum(values) / len(values) if values else None
+
+
+def _fmt(v, width, digits=1):
+    return f"{'-':>{width}}" if v is None else f"{v:>{width}.{digits}f}"
+
+
+def bench(paths, estimators=None):
+    recs = [tachrec.load(p) for p in paths]
+    print(f"Korpusz: {len(recs)} felvetel, {sum(len(r.edges) for r in recs)} el, "
+          f"{sum(r.duration_us() for r in recs) / 1e6:.1f} s")
+    print(f"{'becslo':<14}{'MAE rpm':>9}{'MAE %':>8}{'max rpm':>9}{'zaj rpm':>9}{'kesl. ms':>10}"
+          f"{'us/poll':>9}{'us/el':>8}{'stall ms':>10}")
+    for cls in estimators or ESTIMATORS:
+        scores = []
+        for rec in recs:
+            scores.append(score(rec, replay(rec, cls), reference(rec)))
+        print(f"{cls.name:<14}"
+              + _fmt(_mean([s["mae"] for s in scores]), 9)
+              + _fmt(_mean([s["mae_pct"] for s in scores]), 8, 2)
+              + _fmt(max(s["max"] for s in scores), 9, 0)
+              + _fmt(_mean([s["noise"] for s in scores]), 9)
+              + _fmt(_mean([s["latency_ms"] for s in scores]), 10, 0)
+              + _fmt(_mean([s["cpu_poll_us"] for s in scores]), 9, 2)
+              + _fmt(_mean([s["cpu_edge_us"] for s in scores]), 8, 2)
+              + _fmt(_mean([s["stall_lag_ms"] for s in scores]), 10, 0))
+
+
+def synth(path, ppr=2, seed=1):
+    """
+    Szintetikus felvétel: PWM lépcsők, elsőrendű (1,5 s időállandójú) fordulatszám válasz,
+    enyhe periódus zaj, a végén elakadás (0 RPM 60 %-os kitöltésnél).
+    """
+    import random
+    rnd = random.Random(seed)
+    steps = [(0, 30), (8000000, 60), (16000000, 100), (24000000, 40), (32000000, 60)]
+    stall_at = 40000000
+    end = 56000000
+    edges = []
+    t = 0
+    rpm = 0.0
+    level = 1
+    si = 0
+    dt = 100
+    phase = 0.0
+    while t < end:
+        while si + 1 < len(steps) and steps[si + 1][0] <= t:
+            si += 1
+        goal = 0.0 if t >= stall_at else steps[si][1] * 30.0
+        rpm += (goal - rpm) * dt / 1500000
+        phase += rpm * ppr * 2 / 60e6 * dt  # Élek (fél impulzusok) száma
+        if phase >= 1.0:
+            phase -= 1.0
+            level ^= 1
+            edges.append((t + rnd.randint(-5, 5) if edges else t, level))
+        t += dt
+    edges.sort()
+    cmds = [(t0, d) for t0, d in steps]
+    tachrec.save(path, tachrec.Recording(ppr, edges, cmds, end))
+    print(f"{path}: {len(edges)} el, {len(cmds)} parancs")
+
+
+def main(argv):
+    if len(argv) >= 3 and argv[0] == "convert":
+        with open(argv[1]) as f:
+            rec = tachrec.from_capture_lines(f.readlines(), argv[1])
+        tachrec.save(argv[2], rec)
+        print(f"{argv[2]}: {len(rec.edges)} el, {len(rec.cmds)} parancs, {rec.duration_us() / 1e6:.1f} s")
+    elif len(argv) >= 2 and argv[0] == "synth":
+        synth(argv[1])
+    elif len(argv) >= 2 and argv[0] == "bench":
+        bench(argv[1:])
+    elif len(argv) >= 2 and argv[0] == "filters":
+        # A .ftr argumentumok felvételek, a többi szűrő lánc leírás (alapból: nyers + a presetek)
+        paths = [a for a in argv[1:] if a.endswith(".ftr")]
+        specs = [a for a in argv[1:] if not a.endswith(".ftr")] or [""] + rpm_filters.PRESETS + ["ema2", "median5"]
+        bench(paths, [filter_estimator(s) for s in specs])
+    else:
+        print("Hasznalat: replay.py convert <capture.txt> <ki.ftr> | synth <ki.ftr> | bench <felvetelek...> "
+              "| filters <felvetelek...> [lanc...]")
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
+
+# Utolsó módosítás: 2026. október 19. 19:30:00
\ No newline at end of file
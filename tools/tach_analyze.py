@@ -0,0 +1,136 @@
+# Fájl helye: /tools/tach_analyze.py
+# Funkció: Host oldali elemző a "capture" soros parancs kimenetéhez (NumPy). A nyers TACH él
+# időbélyegekből periódus jittert, fordulatonkénti (rend szerinti) spektrumot és kitöltés torzulást számol.
+# Használat: a soros konzolon 'capture 5000', a kimenet mentése (pl. capture.txt), majd
+#            python tools/tach_analyze.py capture.txt [--plot]   (vagy '-' a szabványos bemenethez)
+
+import sys
+import numpy as np
+
+TICKS_PERIOD = 1 << 30  # Az eszköz ticks_us értékei ennyinél körbefordulnak
+
+
+def parse_capture(lines):
+    """
+    A 'C,<élek>,<impulzus/fordulat>,<pwm>' fejléc és az 'E,...' sorok beolvasása.
+    Több rögzítés esetén az utolsót adja: (ppr, duty, nyers értékek tömbje).
+    """
+    captures = []
+    for line in lines:
+        line = line.strip()
+        if line.startswith("C,"):
+            _, n, ppr, duty = line.split(",")[:4]
+            captures.append([int(ppr), int(duty), []])
+        elif line.startswith("E,") and captures:
+            captures[-1][2].extend(int(v) for v in line[2:].split(",") if v)
+    if not captures:
+        raise SystemExit("Nincs rogzites a bemenetben (C, sor hianyzik)")
+    ppr, duty, raw = captures[-1]
+    return ppr, duty, np.array(raw, dtype=np.int64)
+
+
+def unwrap(raw):
+    """Időbélyegek (us, 0-tól, körbefordulás nélkül) és szintek az alsó bitből."""
+    level = raw & 1
+    t = raw & ~1
+    dt = np.diff(t) % TICKS_PERIOD
+    return np.concatenate(([0], np.cumsum(dt))), level
+
+
+def period_jitter(periods):
+    mean = periods.mean()
+    return {
+        "mean_us": mean,
+        "std_us": periods.std(),
+        "p2p_us": periods.max() - periods.min(),
+        "c2c_us": np.abs(np.diff(periods)).std() if len(periods) > 2 else 0.0,
+        "rel_pct": 100.0 * periods.std() / mean,
+    }
+
+
+def order_spectrum(periods, ppr):
+    """
+    A pillanatnyi periódus eltérés spektruma impulzusonkénti mintavétellel; a frekvencia
+    tengely fordulatonkénti rendben (order). 1. rend: kiegyensúlyozatlanság / excentricitás.
+    """
+    revs = len(periods) // ppr
+    x = periods[:revs * ppr] - periods[:revs * ppr].mean()
+    x = x * np.hanning(len(x))
+    spec = np.abs(np.fft.rfft(x)) * 2 / (len(x) / 2)  # Hann ablak erősítés korrekció
+    orders = np.fft.rfftfreq(len(x)) * ppr
+    return orders, 100.0 * spec / periods.mean()
+
+
+def duty_distortion(t, level):
+    """Magas szint aránya impulzusonként (ideálisan 50 %) lefutó éltől lefutó élig."""
+    falling = t[level == 0]
+    rising = t[level == 1]
+    duties = []
+    for i in range(len(falling) - 1):
+        j = np.searchsorted(rising, falling[i])
+        if j < len(rising) and rising[j] < falling[i + 1]:
+            low = rising[j] - falling[i]
+            duties.append(100.0 * (1.0 - low / (falling[i + 1] - falling[i])))
+    return np.array(duties)
+
+
+def main():
+    args = [a for a in sys.argv[1:] if not a.startswith("--")]
+    plot = "--plot" in sys.argv
+    if not args or args[0] == "-":
+        lines = sys.stdin.readlines()
+    else:
+        with open(args[0], encoding="utf-8", errors="replace") as f:
+            lines = f.readlines()
+
+    ppr, duty, raw = parse_capture(lines)
+    t, level = unwrap(raw)
+    falling = t[level == 0]
+    periods = np.diff(falling).astype(float)
+    if len(periods) < 2 * ppr:
+        raise SystemExit(f"Tul keves impulzus ({len(periods)}), a ventilator all?")
+
+    jit = period_jitter(periods)
+    rpm = 60e6 / (jit["mean_us"] * ppr)
+    print(f"Elek: {len(raw)}  impulzus/fordulat: {ppr}  PWM: {duty} %  idotartam: {t[-1] / 1e6:.2f} s")
+    print(f"RPM (atlag): {rpm:.1f}")
+    print(f"Periodus: {jit['mean_us']:.1f} us  szoras {jit['std_us']:.1f} us ({jit['rel_pct']:.2f} %)"
+          f"  csucs-csucs {jit['p2p_us']:.0f} us  ciklusrol-ciklusra {jit['c2c_us']:.1f} us")
+
+    # Impulzus pozíciónkénti átlag: pólus / jeladó aszimmetria fordulaton belül
+    revs = len(periods) // ppr
+    per_slot = periods[:revs * ppr].reshape(revs, ppr).mean(axis=0)
+    print("Poziciok (fordulaton belul, % az atlaghoz): "
+          + " ".join(f"{100.0 * (p / per_slot.mean() - 1):+.2f}" for p in per_slot))
+
+    orders, amp = order_spectrum(periods, ppr)
+    top = np.argsort(amp[1:])[::-1][:5] + 1
+    print("Rend spektrum csucsok (rend: amplitudo % a periodushoz):")
+    for k in sorted(top, key=lambda i: orders[i]):
+        print(f"  {orders[k]:6.3f}: {amp[k]:.3f}")
+
+    duties = duty_distortion(t, level)
+    if len(duties):
+        print(f"Kitoltes: {duties.mean():.2f} %  (50 %-tol {duties.mean() - 50:+.2f})  szoras {duties.std():.2f}"
+              f"  min {duties.min():.1f}  max {duties.max():.1f}")
+
+    if plot:
+        import matplotlib.pyplot as plt
+        fig, ax = plt.subplots(3, 1, figsize=(10, 8))
+        ax[0].plot(falling[1:] / 1e6, 60e6 / (periods * ppr))
+        ax[0].set_ylabel("RPM")
+        ax[0].set_xlabel("s")
+        ax[1].plot(orders, amp)
+        ax[1].set_ylabel("% / rend")
+        ax[1].set_xlabel("rend (ciklus / fordulat)")
+        if len(duties):
+            ax[2].hist(duties, bins=50)
+            ax[2].set_xlabel("kitoltes %")
+        fig.tight_layout()
+        plt.show()
+
+
+if __name__ == "__main__":
+    main()
+
+# Utolsó módosítás: 2026. október 19. 16:30:00
\ No newline at end of file
@@ -0,0 +1,130 @@
+# Fájl helye: /tools/tachrec.py
+# Funkció: Tömör TACH felvétel fájlformátum (.ftr) írása / olvasása és a "capture" soros kimenet
+# átalakítása. Tiszta Python (NumPy nélkül), így hoston és az eszközön is használható.
+#
+# Formátum: fejléc "<4sBBHIII" (b"FTR1", verzió, impulzus / fordulat, tartalék, élek, parancsok,
+# hossz us-ban), majd az élek varint((dt_us << 1) | szint) alakban az előző éltől (az első a felvétel
+# kezdetétől), végül a PWM parancsok varint(dt_us) + 1 bájt kitöltés % alakban az előző parancstól.
+
+import struct
+
+MAGIC = b"FTR1"
+VERSION = 1
+_HEADER = "<4sBBHIII"
+TICKS_PERIOD = 1 << 30  # Az eszköz ticks_us értékei ennyinél körbefordulnak
+
+
+class Recording:
+    """Egy felvétel: élek (us a kezdettől, szint) és PWM parancsok (us, kitöltés %)."""
+    def __init__(self, ppr, edges, cmds, end_us=0, name=""):
+        self.ppr = ppr
+        self.edges = edges   # [(t_us, szint), ...] időrendben
+        self.cmds = cmds     # [(t_us, kitöltés), ...] időrendben
+        self.end_us = end_us # A rögzítési ablak vége (él nélküli farok is számít, pl. elakadás)
+        self.name = name
+
+    def duration_us(self):
+        last_edge = self.edges[-1][0] if self.edges else 0
+        last_cmd = self.cmds[-1][0] if self.cmds else 0
+        return max(last_edge, last_cmd, self.end_us)
+
+
+def _put_varint(out, v):
+    while v >= 0x80:
+        out.append((v & 0x7F) | 0x80)
+        v >>= 7
+    out.append(v)
+
+
+def _get_varint(data, pos):
+    v = 0
+    shift = 0
+    while True:
+        b = data[pos]
+        pos += 1
+        v |= (b & 0x7F) << shift
+        if b < 0x80:
+            return v, pos
+        shift += 7
+
+
+def encode(rec):
+    out = bytearray(struct.pack(_HEADER, MAGIC, VERSION, rec.ppr, 0, len(rec.edges), len(rec.cmds),
+                                   rec.duration_us()))
+    prev = 0
+    for t, level in rec.edges:
+        _put_varint(out, ((t - prev) << 1) | level)
+        prev = t
+    prev = 0
+    for t, duty in rec.cmds:
+        _put_varint(out, t - prev)
+        out.append(duty)
+        prev = t
+    return out
+
+
+def decode(data, name=""):
+    magic, version, ppr, _, n_edges, n_cmds, end_us = struct.unpack_from(_HEADER, data)
+    if magic != MAGIC or version != VERSION:
+        raise ValueError("nem FTR1 felvetel")
+    pos = struct.calcsize(_HEADER)
+    edges = []
+    t = 0
+    for _ in range(n_edges):
+        v, pos = _get_varint(data, pos)
+        t += v >> 1
+        edges.append((t, v & 1))
+    cmds = []
+    t = 0
+    for _ in range(n_cmds):
+        v, pos = _get_varint(data, pos)
+        t += v
+        cmds.append((t, data[pos]))
+        pos += 1
+    return Recording(ppr, edges, cmds, end_us, name)
+
+
+def save(path, rec):
+    with open(path, "wb") as f:
+        f.write(encode(rec))
+
+
+def load(path):
+    with open(path, "rb") as f:
+        return decode(f.read(), path)
+
+
+def from_capture_lines(lines, name=""):
+    """
+    A 'capture' parancs kimenetéből (C / E / D sorok) felvétel; több rögzítésnél az utolsó.
+    Az időbélyegek a fejlécben küldött kezdő ticks_us-hoz képest, körbefordulás nélkül.
+    """
+    header = None
+    edges_raw = []
+    cmds_raw = []
+    for line in lines:
+        line = line.strip()
+        if line.startswith("C,"):
+            header = [int(v) for v in line[2:].split(",")]
+            edges_raw = []
+            cmds_raw = []
+        elif line.startswith("E,") and header:
+            edges_raw.extend(int(v) for v in line[2:].split(",") if v)
+        elif line.startswith("D,") and header:
+            cmds_raw.extend(int(v) for v in line[2:].split(",") if v)
+    if header is None or len(header) < 4:
+        raise ValueError("nincs visszajatszhato rogzites (C sor kezdo idovel hianyzik)")
+    ppr, start = header[1], header[3]
+    edges = []
+    base = 0
+    prev = start
+    for v in edges_raw:
+        # Az egymás utáni különbségek összegzése kezeli a körbefordulást
+        base += ((v & ~1) - prev) % TICKS_PERIOD
+        prev = v & ~1
+        edges.append((base, v & 1))
+    cmds = [(((v & ~0x7F) - (start & ~0x7F)) % TICKS_PERIOD, v & 0x7F) for v in cmds_raw]
+    end_us = (header[5] - start) % TICKS_PERIOD if len(header) > 5 else 0
+    return Recording(ppr, edges, cmds, end_us, name)
+
+# Utolsó módosítás: 2026. október 19. 17:00:00
\ No newline at end of file
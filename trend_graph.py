@@ -0,0 +1,137 @@
+# Fájl helye: /trend_graph.py
+# Funkció: Valós idejű RPM / PWM trend grafikon inkrementális rajzolással és O(1) autoskálázással.
+
+from array import array
+import framebuf
+import config
+
+SCALE_QUANTUM = 250   # RPM - a skála határai erre kerekítve, hogy ne kelljen minden mintánál újrarajzolni
+
+
+class MonotonicDeque:
+    """
+    Csúszóablakos minimum/maximum a FanController trend gyűrűpufferén.
+    Csak sorszámokat tárol; az értékeket a forrás tömbből olvassa (seq % méret).
+    """
+    def __init__(self, source, keep_max):
+        self.src = source
+        self.size = len(source)
+        self.keep_max = keep_max
+        self.buf = array('I', [0] * self.size)
+        self.head = 0   # Első (legrégebbi) elem indexe
+        self.count = 0
+
+    def reset(self):
+        self.head = 0
+        self.count = 0
+
+    def push(self, seq):
+        """Új minta (sorszám) felvétele; előbb a kicsúszott, majd a dominált elemek eldobása."""
+        n = self.size
+        oldest = seq - n + 1
+        while self.count and self.buf[self.head] < oldest:
+            self.head = (self.head + 1) % n
+            self.count -= 1
+
+        v = self.src[seq % n]
+        while self.count:
+            back = self.src[self.buf[(self.head + self.count - 1) % n] % n]
+            if (back <= v) if self.keep_max else (back >= v):
+                self.count -= 1
+            else:
+                break
+        self.buf[(self.head + self.count) % n] = seq
+        self.count += 1
+
+    def value(self):
+        if not self.count:
+            return 0
+        return self.src[self.buf[self.head] % self.size]
+
+
+class TrendGraph:
+    """A grafikon saját framebufferben él; új mintánként csak görget és egy oszlopot rajzol."""
+    def __init__(self, fan, width, height):
+        self.fan = fan
+        self.w = width
+        self.h = height
+        self.buf = bytearray(width * height // 8)
+        self.fb = framebuf.FrameBuffer(self.buf, width, height, framebuf.MONO_VLSB)
+        self.min_dq = MonotonicDeque(fan.trend_rpm, keep_max=False)
+        self.max_dq = MonotonicDeque(fan.trend_rpm, keep_max=True)
+        self.last_seq = 0
+        self.lo = 0
+        self.hi = SCALE_QUANTUM
+        self.hi_label = str(SCALE_QUANTUM)  # A skála teteje szövegként; csak átskálázáskor készül új
+        self.prev_y = height - 1
+
+    def _y_for(self, rpm):
+        span = self.hi - self.lo
+        return self.h - 1 - (rpm - self.lo) * (self.h - 1) // span
+
+    def _duty_y(self, duty):
+        return self.h - 1 - duty * (self.h - 1) // 100
+
+    def _rescale(self):
+        """A skála határainak frissítése; True, ha változott (teljes újrarajzolás kell)."""
+        lo = (self.min_dq.value() // SCALE_QUANTUM) * SCALE_QUANTUM
+        hi = (self.max_dq.value() // SCALE_QUANTUM + 1) * SCALE_QUANTUM
+        if lo != self.lo or hi != self.hi:
+            self.lo = lo
+            self.hi = hi
+            self.hi_label = str(hi)
+            return True
+        return False
+
+    def _draw_column(self, x, seq):
+        """Egy minta oszlopa: RPM vonal az előző ponttól, PWM kitöltés egy pontként."""
+        n = config.TREND_SAMPLES
+        y = self._y_for(self.fan.trend_rpm[seq % n])
+        if y < self.prev_y:
+            self.fb.vline(x, y, self.prev_y - y + 1, 1)
+        else:
+            self.fb.vline(x, self.prev_y, y - self.prev_y + 1, 1)
+        self.prev_y = y
+        self.fb.pixel(x, self._duty_y(self.fan.trend_duty[seq % n]), 1)
+
+    def _redraw(self, seq):
+        """Teljes újrarajzolás a gyűrűpufferből (skálaváltáskor vagy lemaradáskor)."""
+        self.fb.fill(0)
+        count = min(seq, self.w)
+        first = seq - count
+        self.prev_y = self._y_for(self.fan.trend_rpm[first % config.TREND_SAMPLES]) if count else self.h - 1
+        for i in range(count):
+            self._draw_column(self.w - count + i, first + i)
+
+    def update(self):
+        """Új minták feldolgozása a legutóbbi hívás óta."""
+        seq = self.fan.trend_seq
+        new = seq - self.last_seq
+        if new <= 0:
+            return
+
+        if new >= config.TREND_SAMPLES:
+            # Túl sokat maradtunk le: újraépítjük a deque-kat is
+            self.min_dq.reset()
+            self.max_dq.reset()
+            first = max(0, seq - config.TREND_SAMPLES)
+            for s in range(first, seq):
+                self.min_dq.push(s)
+                self.max_dq.push(s)
+        else:
+            for s in range(self.last_seq, seq):
+                self.min_dq.push(s)
+                self.max_dq.push(s)
+        self.last_seq = seq
+
+        if self._rescale() or new >= self.w:
+            self._redraw(seq)
+            return
+
+        # Inkrementális út: görgetés balra és az új oszlop(ok) kirajzolása
+        for s in range(seq - new, seq):
+            self.fb.scroll(-1, 0)
+            self.fb.vline(self.w - 1, 0, self.h, 0)
+            self._draw_column(self.w - 1, s)
+
+# Utolsó módosítás: 2026. október 19. 22:15:00
\ No newline at end of file
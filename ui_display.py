@@ -1,12 +1,17 @@
 # Fájl helye: /ui_display.py
-# Funkció: OLED kijelző kezelése, menük kirajzolása, animációk és rendszer hőmérséklet mérése.
+# Funkció: OLED kijelző kezelése, menük kirajzolása, animációk (a szenzor értékek a sensors modulból jönnek).
+# A kijelző opcionális: ha nem válaszol, a kezelő "nem elérhető" állapotba kerül (headless mód).
 # Tartalmazza a javított görgető szöveg (scroll-to-end-and-wait) és a Star Wars effektus logikáját.
 
-from machine import I2C, Pin, ADC
+from machine import I2C, Pin
 from ssd1306 import SSD1306_I2C
+import framebuf
 import config
+import logger
 import locales
+import strid
 import time
+import gc
 
 # Animációs képkockák
 FAN_ICON = [
@@ -19,23 +24,25 @@ FAN_ICON = [
 # Görgetés beállítások
 SCROLL_START_DELAY_MS = 500   # Mennyi ideig álljon a szöveg az elején
 ARROW_MARGIN = 12             # Hely a nyilaknak pixelben (bal és jobb oldalon)
+MODE_LABEL_MAX = 11           # Teszt képernyőn a mód nevének maximális hossza
 
-class SystemMonitor:
-    def __init__(self):
-        self.sensor = ADC(4)
-        
-    def get_temperature(self):
-        """RP2040 belső hőmérsékletének olvasása."""
-        adc_value = self.sensor.read_u16()
-        volt = (3.3 / 65535) * adc_value
-        temperature = 27 - (volt - 0.706) / 0.001721
-        return int(temperature)
+# Előre létrehozott egykarakteres stringek a foglalásmentes számkiíráshoz
+_DIGIT_CHARS = ("0", "1", "2", "3", "4", "5", "6", "7", "8", "9")
+
+# Nagy számjegyes teszt képernyő elrendezése
+BIG_RPM_DIGITS = 5            # 5 * 16 px = 80 px széles RPM mező
+BIG_RPM_Y = 8                 # A 24 px magas számjegyek a státuszsor alatt kezdődnek
+BIG_SIDE_X = 88               # Jobb oldali kis oszlop (PWM / cél, felirat, ikon)
+
+OLED_I2C_ADDR = 0x3C
 
 class DisplayManager:
-    def __init__(self, settings_mgr):
+    def __init__(self, settings_mgr, sensors=None):
         self.i2c = I2C(0, scl=Pin(config.PIN_I2C_SCL), sda=Pin(config.PIN_I2C_SDA), freq=config.I2C_FREQ)
-        self.oled = SSD1306_I2C(config.OLED_WIDTH, config.OLED_HEIGHT, self.i2c)
-        self.sys_mon = SystemMonitor()
+        self.oled = None
+        self.available = False
+        self.connect()
+        self.sensors = sensors
         self.settings = settings_mgr
         
         # Aktuális nyelvi szótár betöltése
@@ -44,28 +51,86 @@ class DisplayManager:
         
         self.anim_frame = 0
         self.last_anim_time = 0
+        # Ikon képkockák egyszer felépítve (MONO_HLSB: soronként 1 bájt, MSB balra)
+        self.icon_frames = [
+            framebuf.FrameBuffer(bytearray(frame), 8, 8, framebuf.MONO_HLSB) for frame in FAN_ICON
+        ]
+        
+        # Foglalásmentes renderelés segédei
+        self.num_buf = bytearray(6)   # Számjegyek (legkisebb helyiérték elöl)
+        self._build_labels()
+        
+        # Első használatkor betöltött rajzoló modulok (gyorsabb boot)
+        self.graph = None
+        self.bigfont = None
+        self.batch = None
         
+    def connect(self):
+        """
+        Kijelző (újra)csatlakoztatása. Hiba esetén nem dob kivételt, csak
+        False-t ad vissza, és a kezelő headless állapotban marad.
+        """
+        try:
+            if OLED_I2C_ADDR not in self.i2c.scan():
+                raise OSError("OLED nem valaszol")
+            self.oled = SSD1306_I2C(config.OLED_WIDTH, config.OLED_HEIGHT, self.i2c, addr=OLED_I2C_ADDR)
+            self.available = True
+        except OSError as e:
+            logger.warn("Kijelzo nem elerheto: {}", e)
+            self.oled = None
+            self.available = False
+        return self.available
+
     def update_language(self):
         """Frissíti a használt nyelvet a beállításokból."""
         lang = self.settings.get("language")
         if lang != self.current_lang:
             self.current_lang = lang
+            # Előbb elengedjük a régi szótárat, hogy a kettő ne legyen egyszerre a heapen
+            free_before = gc.mem_free()
+            self.strings = None
+            gc.collect()
             self.strings = locales.get_locale(self.current_lang)
+            self._build_labels()
+            if logger.enabled(logger.DEBUG):
+                gc.collect()
+                logger.debug("Nyelv betoltve: {}, heap valtozas: {} B", lang, gc.mem_free() - free_before)
 
-    def get_text(self, key):
-        """Szöveg lekérése az aktuális nyelven."""
-        return self.strings.get(key, key)
+    def _build_labels(self):
+        """Nyelvenként egyszer összerakott feliratok a teszt képernyő számára."""
+        self.lbl_pwm = self.get_text(strid.PWM) + ":"
+        self.lbl_target = self.get_text(strid.TARGET) + ":"
+        self.lbl_rpm = self.get_text(strid.RPM) + ":"
+        self.lbl_rpm_short = self.get_text(strid.RPM)
+        self.lbl_stall = self.get_text(strid.STALL_ALERT)
+        self.lbl_batch_wait = self.get_text(strid.BATCH_WAIT)
+        self.lbl_batch_pass = self.get_text(strid.BATCH_PASS)
+        self.lbl_batch_fail = self.get_text(strid.BATCH_FAIL)
+        self.mode_labels = {}
+        for sid in (strid.MODE_AUTO, strid.MODE_MANUAL, strid.MODE_TARGET, strid.MODE_ENDURANCE, strid.MODE_STEP,
+                    strid.MODE_BATCH):
+            self.mode_labels[sid] = self.get_text(sid)[:MODE_LABEL_MAX]
+
+    def get_text(self, sid):
+        """Szöveg lekérése az aktuális nyelven (strid azonosító alapján, egyszerű indexelés)."""
+        return self.strings[sid]
         
     def clear(self):
         self.oled.fill(0)
         
     def show(self):
-        self.oled.show()
+        try:
+            self.oled.show()
+        except OSError as e:
+            # Busz hiba futás közben: headless módba váltunk, az App a háttérben újrapróbálja
+            logger.warn("Kijelzo busz hiba: {}", e)
+            self.oled = None
+            self.available = False
 
     def draw_splash(self):
         self.clear()
-        self.oled.text(self.get_text("app_name"), 30, 5, 1)
-        self.oled.text(self.get_text("app_sub"), 25, 20, 1)
+        self.oled.text(self.get_text(strid.APP_NAME), 30, 5, 1)
+        self.oled.text(self.get_text(strid.APP_SUB), 25, 20, 1)
         self.show()
 
     def _draw_fan_icon(self, x, y, animate=True):
@@ -76,18 +141,59 @@ class DisplayManager:
                 self.anim_frame = (self.anim_frame + 1) % len(FAN_ICON)
                 self.last_anim_time = now
         
-        bitmap = FAN_ICON[self.anim_frame]
-        for r in range(8):
-            for c in range(8):
-                if (bitmap[r] >> (7-c)) & 1:
-                    if x + c < config.OLED_WIDTH and y + r < config.OLED_HEIGHT:
-                        self.oled.pixel(x + c, y + r, 1)
+        # 0 kulcsszín: csak a beállított pixelek kerülnek a képre
+        self.oled.blit(self.icon_frames[self.anim_frame], x, y, 0)
+
+    def _int_width(self, value):
+        """Egy nemnegatív egész kiírt szélessége pixelben."""
+        chars = 1
+        while value >= 10:
+            value //= 10
+            chars += 1
+        return chars * 8
+
+    def _draw_int(self, value, x, y):
+        """
+        Nemnegatív egész kiírása f-string nélkül: a számjegyek az újrahasznált
+        num_buf-ba kerülnek, majd egyenként, előre létrehozott stringekből rajzolódnak.
+        Visszaadja a kiírás utáni X pozíciót.
+        """
+        if value < 0:
+            value = 0
+        n = 0
+        while True:
+            self.num_buf[n] = value % 10
+            value //= 10
+            n += 1
+            if value == 0 or n == len(self.num_buf):
+                break
+        while n:
+            n -= 1
+            self.oled.text(_DIGIT_CHARS[self.num_buf[n]], x, y, 1)
+            x += 8
+        return x
+
+    def _draw_power(self, x, y):
+        """
+        Teljesítmény W-ban, foglalás nélkül: 10 W alatt egy tizedessel (pl. 1.2W), felette egészként
+        (pl. 12W), hogy a nagy számos nézetben a jobb oldali oszlop ne érjen a ventilátor ikonba.
+        """
+        w10 = self.sensors.power_mw // 100
+        if w10 >= 100:
+            x = self._draw_int(w10 // 10, x, y)
+            self.oled.text("W", x, y, 1)
+            return
+        x = self._draw_int(w10 // 10, x, y)
+        self.oled.text(".", x, y, 1)
+        x = self._draw_int(w10 % 10, x + 8, y)
+        self.oled.text("W", x, y, 1)
 
     def _draw_statusbar(self, temp_val):
         """Felső sáv hőmérséklettel."""
         # Jobb felső sarok: Hőmérséklet
-        temp_str = f"{temp_val}C"
-        self.oled.text(temp_str, config.OLED_WIDTH - (len(temp_str)*8), 0, 1)
+        x = config.OLED_WIDTH - self._int_width(temp_val) - 8
+        x = self._draw_int(temp_val, x, 0)
+        self.oled.text("C", x, 0, 1)
 
     def _draw_scrolling_text_horizontal(self, text, y_pos, start_time, margin=0):
         """
@@ -159,7 +265,7 @@ class DisplayManager:
         """Star Wars stílusú, lentről felfelé úszó szöveg."""
         self.clear()
         
-        lines = self.get_text("about_text")
+        lines = self.get_text(strid.ABOUT_TEXT)
         line_height = 10
         total_text_height = len(lines) * line_height
         screen_h = config.OLED_HEIGHT
@@ -184,13 +290,12 @@ class DisplayManager:
                 
         self.show()
 
-    def draw_menu(self, title_key, items_keys, selected_idx, start_time):
+    def draw_menu(self, title_id, item_ids, selected_idx, start_time):
         """Főmenü kirajzolása maszkolással és nyilakkal."""
         self.clear()
-        self.oled.text(self.get_text(title_key), 10, 0, 1)
+        self.oled.text(self.get_text(title_id), 10, 0, 1)
         
-        key = items_keys[selected_idx]
-        item_text = self.get_text(key)
+        item_text = self.get_text(item_ids[selected_idx])
         
         # 1. Szöveg kirajzolása (görgetve, margóval számolva)
         self._draw_scrolling_text_horizontal(item_text, 16, start_time, margin=ARROW_MARGIN)
@@ -203,12 +308,11 @@ class DisplayManager:
     def draw_language_selector(self, lang_list, selected_idx, start_time):
         """Nyelvválasztó képernyő maszkolással."""
         self.clear()
-        self.oled.text(self.get_text("mode_language"), 0, 0, 1)
+        self.oled.text(self.get_text(strid.MODE_LANGUAGE), 0, 0, 1)
         
         try:
             lang_code = lang_list[selected_idx]
-            lang_data = locales.get_locale(lang_code)
-            lang_name = lang_data.get("lang_name", lang_code)
+            lang_name = locales.get_lang_name(lang_code)
             
             # Szöveg
             self._draw_scrolling_text_horizontal(lang_name, 16, start_time, margin=ARROW_MARGIN)
@@ -217,21 +321,21 @@ class DisplayManager:
             self._draw_arrows_and_mask(16)
             
         except Exception as e:
-            print(f"UI Error: {e}")
+            logger.warn("UI Error: {}", e)
             self.oled.text("Error", 30, 16, 1)
         
         self.show()
 
-    def draw_value_selector(self, title_key, current_val, unit_key=""):
+    def draw_value_selector(self, title_id, current_val, unit_id=None):
         """Értékválasztó képernyő maszkolással."""
         self.clear()
-        self.oled.text(self.get_text(title_key), 0, 0, 1)
+        self.oled.text(self.get_text(title_id), 0, 0, 1)
         
         # Érték szövegének formázása
-        if unit_key and unit_key != "%":
-            val_text = f"{current_val} {self.get_text(unit_key)}"
-        elif unit_key == "%":
-             val_text = f"{current_val}%"
+        if unit_id == strid.UNIT_PCT:
+            val_text = f"{current_val}{self.get_text(unit_id)}"
+        elif unit_id is not None:
+            val_text = f"{current_val} {self.get_text(unit_id)}"
         else:
             val_text = str(current_val)
             
@@ -247,37 +351,198 @@ class DisplayManager:
         
         self.show()
 
-    def draw_message(self, msg_key):
+    def draw_message(self, msg_id):
         """Egyszerű üzenet (pl. Mentve) megjelenítése."""
         self.clear()
-        text = self.get_text(msg_key)
+        text = self.get_text(msg_id)
         x = (config.OLED_WIDTH - len(text) * 8) // 2
         self.oled.text(text, x, 12, 1)
         self.show()
 
-    def draw_test_screen(self, mode_key, pwm_percent, rpm, is_stall, target_rpm=None):
-        """Teszt képernyő kirajzolása."""
+    def draw_diag_screen(self, rows):
+        """Rejtett diagnosztikai képernyő: legfeljebb 4 kész sor (16 karakter)."""
+        self.clear()
+        for i in range(min(4, len(rows))):
+            self.oled.text(rows[i], 0, i * 8, 1)
+        self.show()
+
+    def draw_graph_screen(self, fan, rpm):
+        """RPM / PWM trend grafikon; a rajzterület csak új mintánál változik."""
+        if self.graph is None:
+            from trend_graph import TrendGraph
+            self.graph = TrendGraph(fan, config.OLED_WIDTH, config.OLED_HEIGHT - 8)
+        self.graph.update()
+        
+        self.clear()
+        # Fejléc: aktuális RPM balra, skála teteje jobbra
+        self.oled.text(self.lbl_rpm, 0, 0, 1)
+        self._draw_int(rpm, len(self.lbl_rpm) * 8, 0)
+        hi_str = self.graph.hi_label
+        self.oled.text(hi_str, config.OLED_WIDTH - len(hi_str) * 8, 0, 1)
+        self.oled.blit(self.graph.fb, 0, 8)
+        self.show()
+
+    def draw_endurance_screen(self, test, rpm, is_stall):
+        """
+        Tartós teszt: ciklus, a kijelzett lépcső PWM %-a és driftje (ezrelék), átlag / szórás,
+        5-95 % percentilis tartomány. Az aktuális lépcsőnél jobbra az élő RPM (vagy elakadás jelzés).
+        """
+        st = test.view_step()
+        self.clear()
+        self.oled.text(self.mode_labels[strid.MODE_ENDURANCE], 0, 0, 1)
+        self._draw_statusbar(self.sensors.temp_c)
+        
+        self.oled.text("C", 0, 8, 1)
+        self._draw_int(test.cycle, 8, 8)
+        x = self._draw_int(st.duty, 48, 8)
+        self.oled.text("%", x, 8, 1)
+        if test.view_idx < 0:
+            if is_stall:
+                self.oled.text("STALL", config.OLED_WIDTH - 40, 8, 1)
+            else:
+                self._draw_int(rpm, config.OLED_WIDTH - self._int_width(rpm), 8)
+        else:
+            # Drift az első ciklushoz képest (előjeles ezrelék)
+            drift = st.drift_permille()
+            x = config.OLED_WIDTH - self._int_width(abs(drift)) - 8
+            self.oled.text("-" if drift < 0 else "+", x, 8, 1)
+            self._draw_int(abs(drift), x + 8, 8)
+        
+        self.oled.text("M", 0, 16, 1)
+        self._draw_int(int(st.mean), 8, 16)
+        self.oled.text("S", 64, 16, 1)
+        self._draw_int(st.std(), 72, 16)
+        
+        q = st.quantiles
+        self.oled.text("P", 0, 24, 1)
+        x = self._draw_int(q[0].value(), 8, 24)
+        self.oled.text("-", x, 24, 1)
+        self._draw_int(q[2].value(), x + 8, 24)
+        self.show()
+
+    def _draw_ms(self, label, value, x, y):
+        """Címke és ms érték; a nem mérhető (0xFFFF) érték helyén "-"."""
+        self.oled.text(label, x, y, 1)
+        if value == 0xFFFF:
+            self.oled.text("-", x + 8, y, 1)
+        else:
+            self._draw_int(value, x + 8, y)
+
+    def draw_step_screen(self, test, rpm):
+        """
+        Ugrásválasz: a kijelzett lépcső (kiinduló > cél %), jobbra az élő RPM; alatta késés (D),
+        felfutás (R), beállás (S) ms-ban, túllövés ezrelékben (O) és a kifutás a megállásig (C).
+        """
+        self.clear()
+        self.oled.text(self.mode_labels[strid.MODE_STEP], 0, 0, 1)
+        self._draw_statusbar(self.sensors.temp_c)
+        
+        rec = test.view_result()
+        if test.active and test.view_idx < 0:
+            start_duty, end_duty = test.steps[test.idx]
+            n = test.idx + 1
+        elif rec is not None:
+            start_duty, end_duty = rec[0], rec[1]
+            n = test.view_idx + 1 if test.view_idx >= 0 else len(test.results)
+        else:
+            start_duty = end_duty = n = 0
+        x = self._draw_int(n, 0, 8)
+        x = self._draw_int(start_duty, x + 8, 8)
+        self.oled.text(">", x, 8, 1)
+        x = self._draw_int(end_duty, x + 8, 8)
+        self.oled.text("%", x, 8, 1)
+        self._draw_int(rpm, config.OLED_WIDTH - self._int_width(rpm), 8)
+        
+        # A futó lépcső alatt az előző eredménye látszik
+        if test.active and test.view_idx < 0:
+            rec = test.results[-1] if test.results else None
+        if rec is None:
+            self.oled.text("...", 0, 16, 1)
+            self.show()
+            return
+        self._draw_ms("D", rec[5], 0, 16)
+        self._draw_ms("R", rec[6], 64, 16)
+        self._draw_ms("S", rec[7], 0, 24)
+        if rec[8] != 0xFFFF:
+            self._draw_ms("C", rec[8], 64, 24)
+        else:
+            self.oled.text("O", 64, 24, 1)
+            self._draw_int(test.overshoot(rec), 72, 24)
+        self.show()
+
+    def draw_batch_screen(self, tester, rpm):
+        """
+        Sorozat teszt: várakozásnál a bedugásra felszólítás, mérés közben az aktuális lépcső és az
+        élő RPM, a végén az eredmény és a hibaok. Alul a megfelelt (P) / hibás (F) darabszám.
+        """
+        if self.batch is None:
+            import batch
+            self.batch = batch
+        batch = self.batch
+        self.clear()
+        self.oled.text(self.mode_labels[strid.MODE_BATCH], 0, 0, 1)
+        self._draw_statusbar(self.sensors.temp_c)
+        
+        state = tester.state
+        if state == batch.WAIT:
+            self.oled.text(self.lbl_batch_wait, 0, 12, 1)
+        elif state == batch.VERDICT:
+            ok = tester.reason == batch.REASON_OK
+            self.oled.text(self.lbl_batch_pass if ok else self.lbl_batch_fail, 0, 12, 1)
+            if not ok:
+                self.oled.text(tester.reason, config.OLED_WIDTH - len(tester.reason) * 8, 12, 1)
+        else:
+            test = tester.test
+            if state == batch.TEST and test.active:
+                start_duty, end_duty = test.steps[test.idx]
+                x = self._draw_int(start_duty, 0, 12)
+                self.oled.text(">", x, 12, 1)
+                x = self._draw_int(end_duty, x + 8, 12)
+                self.oled.text("%", x, 12, 1)
+            else:
+                self.oled.text("...", 0, 12, 1)
+            self._draw_int(rpm, config.OLED_WIDTH - self._int_width(rpm), 12)
+        
+        self.oled.text("P", 0, 24, 1)
+        self._draw_int(tester.passed, 8, 24)
+        self.oled.text("F", 64, 24, 1)
+        self._draw_int(tester.tested - tester.passed, 72, 24)
+        self.show()
+
+    def draw_test_screen(self, mode_id, pwm_percent, rpm, is_stall, target_rpm=None):
+        """
+        Teszt képernyő kirajzolása.
+        Állandósult állapotban nem foglal memóriát: a feliratok nyelvváltáskor
+        készülnek el, a számok a _draw_int-en / bigfont-on keresztül kerülnek ki.
+        """
         self.clear()
         
         # 1. sor: Mód és Hőmérséklet
-        mode_str = self.get_text(mode_key)
-        if len(mode_str) > 11: 
-            mode_str = mode_str[:11]
-            
-        self.oled.text(mode_str, 0, 0, 1)
-        self._draw_statusbar(self.sys_mon.get_temperature())
+        self.oled.text(self.mode_labels[mode_id], 0, 0, 1)
+        self._draw_statusbar(self.sensors.temp_c)
+        
+        if config.BIG_DIGITS:
+            self._draw_test_body_big(pwm_percent, rpm, is_stall, target_rpm)
+            self.show()
+            return
         
         # 2. sor: Adatok
         if is_stall:
-             self.oled.text(self.get_text("stall_alert"), 0, 12, 1)
+            self.oled.text(self.lbl_stall, 0, 12, 1)
         else:
             if target_rpm is not None:
-                self.oled.text(f"{self.get_text('target')}:{target_rpm}", 0, 12, 1)
+                self.oled.text(self.lbl_target, 0, 12, 1)
+                self._draw_int(target_rpm, len(self.lbl_target) * 8, 12)
             else:
-                self.oled.text(f"{self.get_text('pwm')}:{pwm_percent}%", 0, 12, 1)
+                self.oled.text(self.lbl_pwm, 0, 12, 1)
+                x = self._draw_int(pwm_percent, len(self.lbl_pwm) * 8, 12)
+                self.oled.text("%", x, 12, 1)
+            if self.sensors.has_power:
+                self._draw_power(72, 12)
             
             # 3. sor: RPM
-            self.oled.text(f"{self.get_text('rpm')}:{rpm}", 0, 22, 1)
+            self.oled.text(self.lbl_rpm, 0, 22, 1)
+            self._draw_int(rpm, len(self.lbl_rpm) * 8, 22)
             
         # Ikon (jobb oldalon lent)
         should_animate = not is_stall and pwm_percent > 0
@@ -285,4 +550,29 @@ class DisplayManager:
         
         self.show()
 
-# Utolsó módosítás: 2026. február 06. 10:15:00
\ No newline at end of file
+    def _draw_test_body_big(self, pwm_percent, rpm, is_stall, target_rpm):
+        """Nagy számjegyes RPM mező és a jobb oldali kis oszlop (PWM vagy cél, ikon)."""
+        if self.bigfont is None:
+            import bigfont
+            self.bigfont = bigfont
+        if is_stall:
+            self.oled.text(self.lbl_stall, 0, 16, 1)
+        else:
+            self.bigfont.draw_number(self.oled, rpm, 0, BIG_RPM_Y, BIG_RPM_DIGITS)
+            
+            # Jobb oszlop felső sora: cél RPM vagy PWM %
+            if target_rpm is not None:
+                self._draw_int(target_rpm, BIG_SIDE_X, 10)
+            else:
+                x = self._draw_int(pwm_percent, BIG_SIDE_X, 10)
+                self.oled.text("%", x, 10, 1)
+            # Alsó sor: teljesítmény, ha van áram/feszültség mérés, különben felirat
+            if self.sensors.has_power:
+                self._draw_power(BIG_SIDE_X, 22)
+            else:
+                self.oled.text(self.lbl_rpm_short, BIG_SIDE_X, 22, 1)
+        
+        should_animate = not is_stall and pwm_percent > 0
+        self._draw_fan_icon(config.OLED_WIDTH - 8, 22, should_animate)
+
+# Utolsó módosítás: 2026. október 19. 23:50:00
\ No newline at end of file